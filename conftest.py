@@ -0,0 +1,3 @@
+# test_enterprise_module.py is a standalone script (`python test_enterprise_module.py`)
+# that runs its checks at import time and calls sys.exit on failure, so pytest skips it
+collect_ignore = ["test_enterprise_module.py"]
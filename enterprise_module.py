@@ -8,10 +8,14 @@ import pandas as pd
 import random
 import time
 import uuid
+import functools
+import hashlib
+import threading
 from datetime import datetime, timedelta
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import os
 
 # ============================================================================
@@ -384,11 +388,18 @@ class ControlTowerManager:
                 st.error(f"⚠️ Error: {str(e)}")
                 return [{'id': 'error', 'name': str(e), 'accounts': 0, 'compliance': 0}]
     
-    def provision_account(self, name, email, ou, sso_user):
-        """Provision new account with demo/live support"""
+    def provision_account(self, name, email, ou, sso_user, progress_callback=None):
+        """Provision new account with demo/live support
+        
+        Args:
+            progress_callback: Optional callable receiving a 0-100 percentage
+                              as real provisioning milestones are reached.
+        """
+        report_progress = progress_callback or (lambda pct: None)
         
         if self._is_demo_mode():
             # DEMO MODE - Simulate account provisioning
+            report_progress(100)
             return {
                 'status': 'SUCCESS',
                 'account_id': f'{random.randint(100000000000, 999999999999)}',
@@ -403,6 +414,7 @@ class ControlTowerManager:
                 
                 # Use helper function to get client with proper credentials
                 org_client = get_aws_client('organizations')
+                report_progress(25)
                 
                 try:
                     # Create actual AWS account
@@ -410,6 +422,7 @@ class ControlTowerManager:
                         Email=email,
                         AccountName=name
                     )
+                    report_progress(90)
                     
                     # Get the request ID to track provisioning
                     request_id = response['CreateAccountStatus']['Id']
@@ -562,6 +575,76 @@ class RealTimeCostMonitor:
 # ENTERPRISE UI FUNCTIONS
 # ============================================================================
 
+# Static markup is built once at import instead of on every Streamlit rerun
+_LOGIN_HEADER_HTML = """
+    <div class='main-header'>
+        <h1>🛡️ Future Minds Enterprise Platform v5.0</h1>
+        <p>Unified Cloud Governance • Security • Compliance • FinOps</p>
+        <div style='background: #FF9900; color: #232F3E; padding: 0.4rem 1.2rem; border-radius: 25px; 
+                    font-weight: bold; display: inline-block; margin-top: 1rem;'>ENTERPRISE EDITION</div>
+    </div>
+    """
+
+_HEADER_TEMPLATE = """
+        <div style='background: linear-gradient(135deg, #232F3E 0%, #37475A 100%); 
+                    padding: 1rem; border-radius: 10px; color: white; margin-bottom: 1rem;'>
+            <strong>👤 {name}</strong> • <em>{role_name}</em> • 
+            <small style='background: #FF9900; padding: 0.2rem 0.6rem; border-radius: 10px; 
+                         color: #232F3E; font-weight: bold;'>{tenant_name}</small>
+        </div>
+        """
+
+@functools.lru_cache(maxsize=None)
+def _role_name(role_id):
+    """Display name for a role id"""
+    return EnterpriseAuth.ROLES[role_id]['name']
+
+# Column order of the dashboard tables, declared once so pandas need not infer it.
+# Numeric columns are downcast to shrink the Arrow payload sent to the browser;
+# display formatting is left to st.column_config instead of Python strings.
+_CHARGEBACK_COLS = ['department', 'cost', 'budget', 'utilization']
+_CHARGEBACK_DTYPES = {'cost': 'float32', 'budget': 'float32'}
+_CHARGEBACK_COLUMN_CONFIG = {
+    'cost': st.column_config.NumberColumn('cost', format='dollar'),
+    'budget': st.column_config.NumberColumn('budget', format='dollar'),
+}
+
+_OU_COLS = ['id', 'name', 'accounts', 'compliance']
+_OU_DTYPES = {'accounts': 'int32', 'compliance': 'float32'}
+_OU_COLUMN_CONFIG = {
+    'compliance': st.column_config.NumberColumn('compliance', format='%.1f%%'),
+}
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _get_chargeback_frame(_cost_monitor, is_demo):
+    """Department chargeback table, cached per demo/live mode"""
+    df = pd.DataFrame.from_records(_cost_monitor.get_chargeback_data(), columns=_CHARGEBACK_COLS)
+    return df[_CHARGEBACK_COLS].astype(_CHARGEBACK_DTYPES)
+
+def _org_cache_key(org_client):
+    """
+    Cache key identifying the credentials and region behind an Organizations
+    client (a hash, so the access key itself never appears in a cache key)
+    """
+    if org_client is None:
+        return None
+    # Clients don't expose their credentials publicly; the ones in aws_clients
+    # are created from the stored boto3 session
+    import boto3
+    session = st.session_state.get('boto3_session') or boto3.Session()
+    credentials = session.get_credentials()
+    access_key = credentials.access_key if credentials else 'anonymous'
+    return hashlib.blake2b(
+        f"{access_key}:{org_client.meta.region_name}".encode(),
+        digest_size=16
+    ).hexdigest()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _get_ou_frame(_ct, is_demo, org_key):
+    """Organizational units table, cached per mode and Organizations client"""
+    df = pd.DataFrame.from_records(_ct.get_organizational_units(), columns=_OU_COLS)
+    return df[_OU_COLS].astype(_OU_DTYPES)
+
 def init_enterprise_session():
     """Initialize enterprise session state"""
     if 'enterprise_initialized' not in st.session_state:
@@ -578,14 +661,7 @@ def init_enterprise_session():
 
 def render_enterprise_login():
     """Enterprise login page"""
-    st.markdown("""
-    <div class='main-header'>
-        <h1>🛡️ Future Minds Enterprise Platform v5.0</h1>
-        <p>Unified Cloud Governance • Security • Compliance • FinOps</p>
-        <div style='background: #FF9900; color: #232F3E; padding: 0.4rem 1.2rem; border-radius: 25px; 
-                    font-weight: bold; display: inline-block; margin-top: 1rem;'>ENTERPRISE EDITION</div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_LOGIN_HEADER_HTML, unsafe_allow_html=True)
     
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
@@ -618,15 +694,11 @@ def render_enterprise_header():
     user = st.session_state.user
     col1, col2 = st.columns([5, 1])
     with col1:
-        role_name = EnterpriseAuth.ROLES[user['role']]['name']
-        st.markdown(f"""
-        <div style='background: linear-gradient(135deg, #232F3E 0%, #37475A 100%); 
-                    padding: 1rem; border-radius: 10px; color: white; margin-bottom: 1rem;'>
-            <strong>👤 {user['name']}</strong> • <em>{role_name}</em> • 
-            <small style='background: #FF9900; padding: 0.2rem 0.6rem; border-radius: 10px; 
-                         color: #232F3E; font-weight: bold;'>{user['tenant_name']}</small>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_HEADER_TEMPLATE.format_map({
+            'name': user['name'],
+            'role_name': _role_name(user['role']),
+            'tenant_name': user['tenant_name']
+        }), unsafe_allow_html=True)
     with col2:
         if st.button("🚪 Logout", width="stretch"):
             st.session_state.authenticated = False
@@ -1318,9 +1390,19 @@ def render_cfo_dashboard():
         st.metric("Budget Utilization", f"{budget_data['utilization_pct']:.1f}%")
     
     st.markdown("---")
-    st.markdown("### 💳 Department Chargeback/Showback")
-    chargeback = st.session_state.cost_monitor.get_chargeback_data()
-    st.dataframe(pd.DataFrame(chargeback), width="stretch", hide_index=True)
+    _chargeback_fragment(st.session_state.cost_monitor, st.session_state.get('demo_mode', False))
+
+@st.fragment
+def _chargeback_fragment(cost_monitor, is_demo):
+    """Department chargeback table, reloaded only on an explicit refresh"""
+    col1, col2 = st.columns([5, 1])
+    with col1:
+        st.markdown("### 💳 Department Chargeback/Showback")
+    with col2:
+        if st.button("🔄 Refresh", key="cfo_chargeback_refresh", width="stretch"):
+            _get_chargeback_frame.clear()
+    chargeback = _get_chargeback_frame(cost_monitor, is_demo)
+    st.dataframe(chargeback, width="stretch", hide_index=True, column_config=_CHARGEBACK_COLUMN_CONFIG)
 
 def render_enhanced_cfo_dashboard():
     """Enhanced CFO Executive Dashboard with comprehensive data integration"""
@@ -1990,6 +2072,20 @@ def render_control_tower():
             st.warning("⚠️ AWS credentials not configured. Please configure AWS credentials in sidebar.")
     
     ct = st.session_state.ct_manager
+    org_key = _org_cache_key(org_client)
+    
+    # Each section reruns on its own, so a click in one does not reload the others
+    _lz_status_fragment(ct)
+    
+    st.markdown("---")
+    _ou_table_fragment(ct, is_demo, org_key)
+    
+    st.markdown("---")
+    _provision_form_fragment(ct, is_demo, org_key)
+
+@st.fragment
+def _lz_status_fragment(ct):
+    """Landing zone status metrics"""
     lz = ct.get_landing_zone_status()
     
     col1, col2, col3 = st.columns(3)
@@ -2000,14 +2096,17 @@ def render_control_tower():
         st.metric("Accounts Managed", lz['accounts_managed'])
     with col3:
         st.metric("Guardrails Enabled", lz['guardrails_enabled'])
-    
-    st.markdown("---")
+
+@st.fragment
+def _ou_table_fragment(ct, is_demo, org_key):
+    """Organizational units table"""
     st.markdown("### 🏢 Organizational Units")
-    ous = ct.get_organizational_units()
-    st.dataframe(pd.DataFrame(ous), width="stretch", hide_index=True)
-    
-    st.markdown("---")
-    
+    ous = _get_ou_frame(ct, is_demo, org_key)
+    st.dataframe(ous, width="stretch", hide_index=True, column_config=_OU_COLUMN_CONFIG)
+
+@st.fragment
+def _provision_form_fragment(ct, is_demo, org_key):
+    """Account Factory provisioning form"""
     # Account provisioning section with mode-aware messaging
     if is_demo:
         st.markdown("### ➕ Provision New Account (60-second target) - **DEMO SIMULATION**")
@@ -2022,7 +2121,7 @@ def render_control_tower():
             name = st.text_input("Account Name", placeholder="prod-app-2024")
             email = st.text_input("Email", placeholder="aws+prod@company.com")
         with col2:
-            ou = st.selectbox("Organizational Unit", [o['name'] for o in ous])
+            ou = st.selectbox("Organizational Unit", _get_ou_frame(ct, is_demo, org_key)['name'].tolist())
             sso = st.text_input("SSO User Email", placeholder="owner@company.com")
         
         button_label = "🚀 Provision Account (Simulation)" if is_demo else "🚀 Provision Account (LIVE - Creates Real Account!)"
@@ -2031,11 +2130,26 @@ def render_control_tower():
             start_time = time.time()
             with st.spinner("Provisioning via Account Factory..."):
                 progress = st.progress(0)
-                for i in range(21):
-                    progress.progress(i * 5)
-                    time.sleep(0.05)
                 
-                result = ct.provision_account(name, email, ou, sso)
+                # Run the real call in a worker and drive the bar from its milestones
+                outcome = {'progress': 0}
+                
+                def _provision():
+                    outcome['result'] = ct.provision_account(
+                        name, email, ou, sso,
+                        progress_callback=lambda pct: outcome.update(progress=pct)
+                    )
+                
+                worker = threading.Thread(target=_provision, daemon=True)
+                add_script_run_ctx(worker, get_script_run_ctx())
+                worker.start()
+                while worker.is_alive():
+                    progress.progress(outcome['progress'])
+                    time.sleep(0.1)
+                worker.join()
+                progress.progress(100)
+                
+                result = outcome.get('result') or {'status': 'ERROR', 'error': 'Provisioning did not complete'}
                 elapsed = time.time() - start_time
                 
                 progress.empty()
@@ -2111,16 +2225,17 @@ def render_realtime_costs():
     elif not is_demo:
         st.success("✅ No cost anomalies detected")
 
+# Enterprise page id -> render function; add a page here to make it routable
+_PAGE_ROUTES = {
+    'cfo': render_enhanced_cfo_dashboard,  # Using enhanced version
+    'controltower': render_control_tower,
+    'realtime_costs': render_realtime_costs,
+}
+
 def check_enterprise_routing():
     """Check if enterprise page is requested and route accordingly"""
-    enterprise_page = st.session_state.get('enterprise_page')
-    if enterprise_page == 'cfo':
-        render_enhanced_cfo_dashboard()  # Using enhanced version
-        return True
-    elif enterprise_page == 'controltower':
-        render_control_tower()
-        return True
-    elif enterprise_page == 'realtime_costs':
-        render_realtime_costs()
+    handler = _PAGE_ROUTES.get(st.session_state.get('enterprise_page'))
+    if handler:
+        handler()
         return True
-    return False
\ No newline at end of file
+    return False
@@ -0,0 +1,103 @@
+"""
+Numeric kernels for the FinOps modules
+
+JIT-compiled with numba when it is installed; otherwise the same functions
+run as plain Python/NumPy, so numba stays an optional dependency.
+
+Kernels:
+- Rolling z-score outlier flagging (anomaly pre-screening)
+- Demo daily cost generation with spike injection
+"""
+
+import numpy as np
+
+# Optional JIT compiler
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (bare or with options)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# ============================================================================
+# ANOMALY PRE-SCREENING
+# ============================================================================
+
+@njit(cache=True, parallel=True)
+def rolling_zscore_flags(costs: np.ndarray, window: int, threshold: float) -> np.ndarray:
+    """
+    Flag days whose cost deviates more than threshold standard deviations
+    from the mean of the preceding window days, in any series
+
+    Args:
+        costs: 2-D float64 array, one row per day and one column per series
+        window: Trailing window length in days
+        threshold: z-score above which a day is flagged
+
+    Returns:
+        Boolean array with one flag per day; all True when there are no
+        more than window days to screen
+    """
+    n_days, n_series = costs.shape
+    if n_days <= window:
+        return np.ones(n_days, dtype=np.bool_)
+
+    outliers = np.zeros((n_days, n_series), dtype=np.bool_)
+    for j in prange(n_series):
+        for i in range(window, n_days):
+            mean = 0.0
+            for k in range(i - window, i):
+                mean += costs[k, j]
+            mean /= window
+            var = 0.0
+            for k in range(i - window, i):
+                var += (costs[k, j] - mean) ** 2
+            std = np.sqrt(var / window)
+            outliers[i, j] = abs(costs[i, j] - mean) > threshold * std
+
+    flags = np.zeros(n_days, dtype=np.bool_)
+    for i in range(window, n_days):
+        for j in range(n_series):
+            if outliers[i, j]:
+                flags[i] = True
+                break
+    return flags
+
+# ============================================================================
+# DEMO DATA
+# ============================================================================
+
+@njit(cache=True)
+def inject_spikes(
+    base: np.ndarray,
+    variation: np.ndarray,
+    spike_draws: np.ndarray,
+    spike_amounts: np.ndarray,
+    spike_probability: float
+) -> np.ndarray:
+    """
+    Daily demo costs: base plus variation, plus a spike wherever the uniform
+    draw falls below spike_probability, floored at zero
+
+    Args:
+        base: Base cost per series, shape (n_series,)
+        variation: Per-day variation, shape (n_days, n_series)
+        spike_draws: Uniform [0, 1) draws deciding spikes, same shape
+        spike_amounts: Spike sizes applied where a spike occurs, same shape
+        spike_probability: Chance of a spike on any day/series
+    """
+    n_days, n_series = variation.shape
+    out = np.empty((n_days, n_series))
+    for i in range(n_days):
+        for j in range(n_series):
+            cost = base[j] + variation[i, j]
+            if spike_draws[i, j] < spike_probability:
+                cost += spike_amounts[i, j]
+            out[i, j] = max(cost, 0.0)
+    return out
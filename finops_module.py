@@ -14,87 +14,68 @@ Features:
 
 import streamlit as st
 import boto3
+import jmespath
 from botocore.exceptions import ClientError
 import pandas as pd
-from datetime import datetime, timedelta
-import plotly.express as px
+import numpy as np
+from datetime import datetime, timedelta, timezone
 import plotly.graph_objects as go
-from typing import Dict, List, Any, Optional
-import json
+from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import chain
+import os
+import string
+import logging
+
+from finops_utils import dumps, script_run_executor
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# CONCURRENCY & CACHING HELPERS
+# ============================================================================
+
+def _session_cache_key(session) -> str:
+    """Cache key identifying a boto3 session by access key and region (never the secret)"""
+    credentials = session.get_credentials()
+    access_key = credentials.access_key if credentials else 'anonymous'
+    return f"{access_key}:{session.region_name}"
+
+def _client_cache_key(client) -> str:
+    """Cache key identifying a boto3 client by access key and region (never the secret)"""
+    # Clients don't expose their credentials publicly. The clients in
+    # st.session_state['aws_clients'] are created from the stored boto3
+    # session; without one they come from the default credential chain.
+    session = st.session_state.get('boto3_session') or boto3.Session()
+    return f"{_session_cache_key(session)}:{client.meta.region_name}"
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _session_client(_session, session_key: str, service: str, region_name: Optional[str] = None):
+    """boto3 client for a service, created once per session on the calling (script) thread"""
+    # boto3 sessions are not thread-safe but their clients are: create clients
+    # here and hand only the clients to worker threads
+    return _session.client(service, region_name=region_name)
 
 # ============================================================================
 # COST EXPLORER & SPEND ANALYTICS
 # ============================================================================
 
-def fetch_cost_data(ce_client, start_date: str, end_date: str, granularity: str = 'DAILY') -> Dict:
+def fetch_cost_data(ce_client, start_date: str, end_date: str, granularity: str = 'DAILY',
+                    *, demo: bool = False) -> Dict:
     """Fetch cost and usage data from AWS Cost Explorer"""
-    if not ce_client or st.session_state.get('demo_mode', False):
+    if demo or not ce_client:
         return generate_demo_cost_data()
     
     try:
         # Debug: Show what we're querying
         st.info(f"📊 Fetching cost data from {start_date} to {end_date} with {granularity} granularity")
         
-        response = ce_client.get_cost_and_usage(
-            TimePeriod={
-                'Start': start_date,
-                'End': end_date
-            },
-            Granularity=granularity,
-            Metrics=['UnblendedCost', 'UsageQuantity'],
-            GroupBy=[
-                {'Type': 'DIMENSION', 'Key': 'SERVICE'},
-            ]
-        )
-        
-        # Debug: Check if we got data
-        if response and 'ResultsByTime' in response:
-            num_results = len(response['ResultsByTime'])
-            st.success(f"✅ Successfully fetched {num_results} time periods of data")
-            
-            # Check if there's actually any cost data
-            total_check = 0
-            for result in response['ResultsByTime']:
-                total_check += float(result['Total'].get('UnblendedCost', {}).get('Amount', 0))
-            
-            if total_check == 0:
-                st.warning("⚠️ Cost Explorer returned data but all costs are $0.00. Trying alternative query...")
-                
-                # Try without GroupBy to see if we can get any data
-                try:
-                    alt_response = ce_client.get_cost_and_usage(
-                        TimePeriod={
-                            'Start': start_date,
-                            'End': end_date
-                        },
-                        Granularity=granularity,
-                        Metrics=['UnblendedCost']
-                    )
-                    
-                    alt_total = 0
-                    if alt_response and 'ResultsByTime' in alt_response:
-                        for result in alt_response['ResultsByTime']:
-                            alt_total += float(result['Total'].get('UnblendedCost', {}).get('Amount', 0))
-                    
-                    if alt_total > 0:
-                        st.warning(f"⚠️ Found ${alt_total:.2f} in total costs without service grouping.\n"
-                                  "This indicates the issue is with the GROUP BY SERVICE dimension.\n"
-                                  "Possible causes:\n"
-                                  "- Portfolio filter may be applied but not passed to Cost Explorer\n"
-                                  "- Service dimension might not be available in this account")
-                    else:
-                        st.warning("⚠️ No cost data found even without grouping. This indicates:\n"
-                                  "- No usage in the selected time period\n"
-                                  "- Cost data not yet available (AWS has 24-48h delay)\n"
-                                  "- Account might not have Cost Explorer enabled\n"
-                                  "- Insufficient permissions to view cost data")
-                except Exception as inner_e:
-                    st.error(f"Alternative query also failed: {str(inner_e)}")
-        else:
-            st.warning("⚠️ Cost Explorer response has no 'ResultsByTime' data")
-        
+        client_key = _client_cache_key(ce_client)
+        response = _fetch_cost_data_live(ce_client, client_key, start_date, end_date, granularity)
+        _report_cost_data_status(ce_client, client_key, response, start_date, end_date, granularity)
         return response
-        
     except ClientError as e:
         error_code = e.response.get('Error', {}).get('Code', 'Unknown')
         error_msg = e.response.get('Error', {}).get('Message', str(e))
@@ -115,69 +96,185 @@ def fetch_cost_data(ce_client, start_date: str, end_date: str, granularity: str
         st.code(traceback.format_exc())
         return generate_demo_cost_data()
 
-def fetch_cost_by_portfolio(ce_client, start_date: str, end_date: str, portfolio_tag: str = 'Portfolio') -> Dict:
+def _get_cost_and_usage_all(ce_client, **kwargs) -> Dict:
+    """GetCostAndUsage across every NextPageToken page, merged into one response"""
+    # botocore has no paginator for this operation. With GroupBy, one time
+    # period's groups can be split across pages, so merge them by period start.
+    by_period = {}
+    while True:
+        response = ce_client.get_cost_and_usage(**kwargs)
+        for result in response.get('ResultsByTime', []):
+            start = result['TimePeriod']['Start']
+            if start in by_period:
+                by_period[start].setdefault('Groups', []).extend(result.get('Groups', []))
+            else:
+                by_period[start] = result
+        next_token = response.get('NextPageToken')
+        if not next_token:
+            break
+        kwargs['NextPageToken'] = next_token
+    
+    response.pop('NextPageToken', None)
+    response['ResultsByTime'] = list(by_period.values())
+    return response
+
+# Cost Explorer bills per request, so identical queries are served from cache for
+# 10 minutes. Errors propagate uncached and the public wrappers fall back to demo data.
+@st.cache_data(ttl=600, show_spinner=False)
+def _fetch_cost_data_live(_ce_client, client_key: str, start_date: str, end_date: str,
+                          granularity: str) -> Dict:
+    """Query GetCostAndUsage grouped by service (cached per client and query)"""
+    return _get_cost_and_usage_all(
+        _ce_client,
+        TimePeriod={
+            'Start': start_date,
+            'End': end_date
+        },
+        Granularity=granularity,
+        Metrics=['UnblendedCost', 'UsageQuantity'],
+        GroupBy=[
+            {'Type': 'DIMENSION', 'Key': 'SERVICE'},
+        ]
+    )
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _fetch_ungrouped_total_live(_ce_client, client_key: str, start_date: str, end_date: str,
+                                granularity: str) -> float:
+    """Total UnblendedCost from GetCostAndUsage without grouping (cached per client and query)"""
+    alt_response = _get_cost_and_usage_all(
+        _ce_client,
+        TimePeriod={
+            'Start': start_date,
+            'End': end_date
+        },
+        Granularity=granularity,
+        Metrics=['UnblendedCost']
+    )
+    
+    alt_total = 0
+    if alt_response and 'ResultsByTime' in alt_response:
+        for result in alt_response['ResultsByTime']:
+            alt_total += float(result['Total'].get('UnblendedCost', {}).get('Amount', 0))
+    return alt_total
+
+def _report_cost_data_status(ce_client, client_key: str, response: Dict, start_date: str, end_date: str,
+                             granularity: str) -> None:
+    """Show what the cost query returned, probing an ungrouped query when every cost is zero"""
+    # Debug: Check if we got data
+    if response and 'ResultsByTime' in response:
+        num_results = len(response['ResultsByTime'])
+        st.success(f"✅ Successfully fetched {num_results} time periods of data")
+        
+        # Check if there's actually any cost data
+        total_check = 0
+        for result in response['ResultsByTime']:
+            total_check += float(result['Total'].get('UnblendedCost', {}).get('Amount', 0))
+        
+        if total_check == 0:
+            st.warning("⚠️ Cost Explorer returned data but all costs are $0.00. Trying alternative query...")
+            
+            # Try without GroupBy to see if we can get any data
+            try:
+                alt_total = _fetch_ungrouped_total_live(ce_client, client_key, start_date, end_date, granularity)
+                
+                if alt_total > 0:
+                    st.warning(f"⚠️ Found ${alt_total:.2f} in total costs without service grouping.\n"
+                              "This indicates the issue is with the GROUP BY SERVICE dimension.\n"
+                              "Possible causes:\n"
+                              "- Portfolio filter may be applied but not passed to Cost Explorer\n"
+                              "- Service dimension might not be available in this account")
+                else:
+                    st.warning("⚠️ No cost data found even without grouping. This indicates:\n"
+                              "- No usage in the selected time period\n"
+                              "- Cost data not yet available (AWS has 24-48h delay)\n"
+                              "- Account might not have Cost Explorer enabled\n"
+                              "- Insufficient permissions to view cost data")
+            except Exception as inner_e:
+                st.error(f"Alternative query also failed: {str(inner_e)}")
+    else:
+        st.warning("⚠️ Cost Explorer response has no 'ResultsByTime' data")
+
+def fetch_cost_by_portfolio(ce_client, start_date: str, end_date: str, portfolio_tag: str = 'Portfolio',
+                            *, demo: bool = False) -> Dict:
     """Fetch costs grouped by portfolio tag"""
-    if not ce_client or st.session_state.get('demo_mode', False):
+    if demo or not ce_client:
         return generate_demo_portfolio_costs()
     
     try:
-        response = ce_client.get_cost_and_usage(
-            TimePeriod={
-                'Start': start_date,
-                'End': end_date
-            },
-            Granularity='MONTHLY',
-            Metrics=['UnblendedCost'],
-            GroupBy=[
-                {'Type': 'TAG', 'Key': portfolio_tag}
-            ]
-        )
-        return response
+        return _fetch_cost_by_portfolio_live(ce_client, _client_cache_key(ce_client),
+                                             start_date, end_date, portfolio_tag)
     except ClientError as e:
         st.error(f"Error fetching portfolio costs: {str(e)}")
         return generate_demo_portfolio_costs()
 
-def fetch_cost_forecast(ce_client, start_date: str, end_date: str) -> Dict:
+@st.cache_data(ttl=600, show_spinner=False)
+def _fetch_cost_by_portfolio_live(_ce_client, client_key: str, start_date: str, end_date: str,
+                                  portfolio_tag: str) -> Dict:
+    """Query monthly GetCostAndUsage grouped by portfolio tag (cached per client and query)"""
+    return _get_cost_and_usage_all(
+        _ce_client,
+        TimePeriod={
+            'Start': start_date,
+            'End': end_date
+        },
+        Granularity='MONTHLY',
+        Metrics=['UnblendedCost'],
+        GroupBy=[
+            {'Type': 'TAG', 'Key': portfolio_tag}
+        ]
+    )
+
+def fetch_cost_forecast(ce_client, start_date: str, end_date: str, *, demo: bool = False) -> Dict:
     """Fetch cost forecast from AWS Cost Explorer"""
-    if not ce_client or st.session_state.get('demo_mode', False):
+    if demo or not ce_client:
         return generate_demo_forecast()
     
     try:
-        response = ce_client.get_cost_forecast(
-            TimePeriod={
-                'Start': start_date,
-                'End': end_date
-            },
-            Metric='UNBLENDED_COST',
-            Granularity='MONTHLY'
-        )
-        return response
+        return _fetch_cost_forecast_live(ce_client, _client_cache_key(ce_client), start_date, end_date)
     except ClientError as e:
         st.error(f"Error fetching forecast: {str(e)}")
         return generate_demo_forecast()
 
+@st.cache_data(ttl=600, show_spinner=False)
+def _fetch_cost_forecast_live(_ce_client, client_key: str, start_date: str, end_date: str) -> Dict:
+    """Query the monthly GetCostForecast (cached per client and period)"""
+    return _ce_client.get_cost_forecast(
+        TimePeriod={
+            'Start': start_date,
+            'End': end_date
+        },
+        Metric='UNBLENDED_COST',
+        Granularity='MONTHLY'
+    )
+
 # ============================================================================
 # COST ANOMALY DETECTION
 # ============================================================================
 
-def fetch_cost_anomalies(ce_client, start_date: str, end_date: str) -> List[Dict]:
+def fetch_cost_anomalies(ce_client, start_date: str, end_date: str, *, demo: bool = False) -> List[Dict]:
     """Fetch cost anomalies from AWS Cost Anomaly Detection"""
-    if not ce_client or st.session_state.get('demo_mode', False):
+    if demo or not ce_client:
         return generate_demo_anomalies()
     
     try:
-        response = ce_client.get_anomalies(
-            DateInterval={
-                'StartDate': start_date,
-                'EndDate': end_date
-            },
-            MaxResults=50
-        )
-        return response.get('Anomalies', [])
+        return _fetch_cost_anomalies_live(ce_client, _client_cache_key(ce_client), start_date, end_date)
     except ClientError as e:
         st.warning(f"Cost Anomaly Detection not available: {str(e)}")
         return generate_demo_anomalies()
 
+@st.cache_data(ttl=600, show_spinner=False)
+def _fetch_cost_anomalies_live(_ce_client, client_key: str, start_date: str, end_date: str) -> List[Dict]:
+    """Query GetAnomalies for the date interval (cached per client and interval)"""
+    pages = _ce_client.get_paginator('get_anomalies').paginate(
+        DateInterval={
+            'StartDate': start_date,
+            'EndDate': end_date
+        },
+        PaginationConfig={'PageSize': 50}
+    )
+    return [anomaly for page in pages for anomaly in page.get('Anomalies', [])]
+
+@st.cache_data(ttl=3600, show_spinner=False)
 def detect_spending_patterns(cost_data: Dict) -> Dict:
     """Analyze spending patterns and identify unusual trends"""
     # This is a simplified pattern detection
@@ -191,136 +288,201 @@ def detect_spending_patterns(cost_data: Dict) -> Dict:
             'patterns': []
         }
     
-    daily_costs = []
-    for result in cost_data['ResultsByTime']:
-        total = float(result['Total'].get('UnblendedCost', {}).get('Amount', 0))
-        daily_costs.append(total)
+    results = cost_data['ResultsByTime']
+    daily_costs = np.fromiter(
+        (float(result['Total'].get('UnblendedCost', {}).get('Amount', 0)) for result in results),
+        dtype=np.float64,
+        count=len(results)
+    )
     
-    if not daily_costs:
+    if not daily_costs.size:
         return {'trend': 'stable', 'avg_daily_spend': 0, 'max_spike': 0, 'patterns': []}
     
-    avg_spend = sum(daily_costs) / len(daily_costs)
-    max_spend = max(daily_costs)
-    
-    # Detect spikes (>50% above average)
-    threshold = avg_spend * 1.5
-    spikes = [cost for cost in daily_costs if cost > threshold]
+    # Spikes are day-over-day changes more than two standard deviations above
+    # the mean change; a constant trend (zero deviation) has none
+    diffs = np.diff(daily_costs)
+    std = diffs.std() if diffs.size else 0.0
+    spike_count = int(((diffs - diffs.mean()) > 2 * std).sum()) if std > 0 else 0
     
     return {
         'trend': 'increasing' if daily_costs[-1] > daily_costs[0] else 'decreasing',
-        'avg_daily_spend': avg_spend,
-        'max_spike': max_spend,
-        'spike_count': len(spikes),
-        'patterns': ['Unusual spike detected' if spikes else 'Normal spending pattern']
+        'avg_daily_spend': float(daily_costs.mean()),
+        # Highest single-day spend, as shown by the "Max Spike" metric
+        'max_spike': float(daily_costs.max()),
+        'spike_count': spike_count,
+        'patterns': ['Unusual spike detected' if spike_count else 'Normal spending pattern']
     }
 
 # ============================================================================
 # INVENTORY & RESOURCE TRACKING
 # ============================================================================
 
-def fetch_resource_inventory(session) -> Dict:
+def fetch_resource_inventory(session, *, demo: bool = False) -> Dict:
     """Fetch comprehensive resource inventory across services"""
-    if not session or st.session_state.get('demo_mode', False):
+    if demo or not session:
         return generate_demo_inventory()
     
-    inventory = {
-        'ec2': fetch_ec2_inventory(session),
-        'rds': fetch_rds_inventory(session),
-        's3': fetch_s3_inventory(session),
-        'lambda': fetch_lambda_inventory(session),
-        'ebs': fetch_ebs_inventory(session)
+    session_key = _session_cache_key(session)
+    return _fetch_resource_inventory_live(_inventory_clients(session, session_key), session_key)
+
+_INVENTORY_SERVICES = ('ec2', 'rds', 's3', 'cloudwatch', 'lambda')
+
+def _inventory_clients(session, session_key: str) -> Dict:
+    """Clients used by the inventory fetchers, keyed by service name"""
+    return {service: _session_client(session, session_key, service) for service in _INVENTORY_SERVICES}
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_resource_inventory_live(_clients: Dict, session_key: str) -> Dict:
+    """Fetch all five service inventories concurrently (cached per session)"""
+    # EC2 and EBS share the ec2 client
+    jobs = {
+        'ec2': (fetch_ec2_inventory, _clients['ec2']),
+        'rds': (fetch_rds_inventory, _clients['rds']),
+        's3': (fetch_s3_inventory, _clients['s3'], _clients['cloudwatch']),
+        'lambda': (fetch_lambda_inventory, _clients['lambda']),
+        'ebs': (fetch_ebs_inventory, _clients['ec2'])
     }
     
-    return inventory
+    # Each service is an independent round-trip, so wall time is the slowest one
+    results = {}
+    with script_run_executor(max_workers=len(jobs)) as executor:
+        futures = {executor.submit(*job): service for service, job in jobs.items()}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    
+    return {service: results[service] for service in jobs}
 
-def fetch_ec2_inventory(session) -> List[Dict]:
+# describe_instances fields kept in the inventory ('State.Name' is flattened by json_normalize)
+_EC2_INVENTORY_FIELDS = ['InstanceId', 'InstanceType', 'State.Name', 'LaunchTime', 'Tags', 'Platform', 'VpcId']
+
+def fetch_ec2_inventory(ec2) -> List[Dict]:
     """Fetch EC2 instances with cost data"""
     try:
-        ec2 = session.client('ec2')
-        response = ec2.describe_instances()
+        pages = ec2.get_paginator('describe_instances').paginate(
+            PaginationConfig={'PageSize': 1000}
+        )
         
-        instances = []
-        for reservation in response.get('Reservations', []):
-            for instance in reservation.get('Instances', []):
-                instances.append({
-                    'InstanceId': instance.get('InstanceId'),
-                    'InstanceType': instance.get('InstanceType'),
-                    'State': instance.get('State', {}).get('Name'),
-                    'LaunchTime': instance.get('LaunchTime'),
-                    'Tags': instance.get('Tags', []),
-                    'Platform': instance.get('Platform', 'Linux'),
-                    'VpcId': instance.get('VpcId'),
-                    'EstimatedMonthlyCost': calculate_ec2_cost(instance.get('InstanceType'))
-                })
-        return instances
+        all_instances = list(chain.from_iterable(
+            reservation.get('Instances', [])
+            for page in pages
+            for reservation in page.get('Reservations', [])
+        ))
+        if not all_instances:
+            return []
+        
+        # Flatten the nested describe_instances payload in one pass, then project
+        df = (
+            pd.json_normalize(all_instances)
+            .reindex(columns=_EC2_INVENTORY_FIELDS)
+            .rename(columns={'State.Name': 'State'})
+        )
+        df['Platform'] = df['Platform'].fillna('Linux')
+        df['Tags'] = [tags if isinstance(tags, list) else [] for tags in df['Tags']]
+        
+        # Price the whole fleet in one vectorized lookup
+        df['EstimatedMonthlyCost'] = df['InstanceType'].map(_EC2_PRICING).fillna(_EC2_DEFAULT_COST)
+        return df.to_dict('records')
     except ClientError as e:
         st.warning(f"Could not fetch EC2 inventory: {str(e)}")
         return []
 
-def fetch_rds_inventory(session) -> List[Dict]:
+def fetch_rds_inventory(rds) -> List[Dict]:
     """Fetch RDS instances"""
     try:
-        rds = session.client('rds')
-        response = rds.describe_db_instances()
+        pages = rds.get_paginator('describe_db_instances').paginate()
         
-        instances = []
-        for db in response.get('DBInstances', []):
-            instances.append({
+        instances = [
+            {
                 'DBInstanceIdentifier': db.get('DBInstanceIdentifier'),
                 'DBInstanceClass': db.get('DBInstanceClass'),
                 'Engine': db.get('Engine'),
                 'DBInstanceStatus': db.get('DBInstanceStatus'),
-                'AllocatedStorage': db.get('AllocatedStorage'),
-                'EstimatedMonthlyCost': calculate_rds_cost(db.get('DBInstanceClass'))
-            })
-        return instances
+                'AllocatedStorage': db.get('AllocatedStorage')
+            }
+            for db in chain.from_iterable(page.get('DBInstances', []) for page in pages)
+        ]
+        if not instances:
+            return []
+        
+        df = pd.DataFrame.from_records(instances)
+        df['EstimatedMonthlyCost'] = df['DBInstanceClass'].map(_RDS_PRICING).fillna(_RDS_DEFAULT_COST)
+        return df.to_dict('records')
     except ClientError as e:
         st.warning(f"Could not fetch RDS inventory: {str(e)}")
         return []
 
-def fetch_s3_inventory(session) -> List[Dict]:
-    """Fetch S3 buckets"""
+# GetMetricData accepts at most 500 metric queries per request
+_METRIC_DATA_BATCH_SIZE = 500
+
+@st.cache_data(ttl=900, show_spinner=False)
+def _get_bucket_sizes(_cw, bucket_names: tuple) -> Dict[str, float]:
+    """Get approximate bucket sizes in GB with batched CloudWatch GetMetricData calls"""
+    sizes = {}
+    for offset in range(0, len(bucket_names), _METRIC_DATA_BATCH_SIZE):
+        batch = bucket_names[offset:offset + _METRIC_DATA_BATCH_SIZE]
+        queries = [
+            {
+                'Id': f'q{i}',
+                'MetricStat': {
+                    'Metric': {
+                        'Namespace': 'AWS/S3',
+                        'MetricName': 'BucketSizeBytes',
+                        'Dimensions': [
+                            {'Name': 'BucketName', 'Value': bucket_name},
+                            {'Name': 'StorageType', 'Value': 'StandardStorage'}
+                        ]
+                    },
+                    'Period': 86400,
+                    'Stat': 'Average'
+                }
+            }
+            for i, bucket_name in enumerate(batch)
+        ]
+        
+        pages = _cw.get_paginator('get_metric_data').paginate(
+            MetricDataQueries=queries,
+            StartTime=datetime.now() - timedelta(days=2),
+            EndTime=datetime.now()
+        )
+        latest = {}
+        for page in pages:
+            for result in page.get('MetricDataResults', []):
+                # Values are newest-first; keep the first one seen per query
+                if result.get('Values') and result['Id'] not in latest:
+                    latest[result['Id']] = result['Values'][0]
+        
+        for i, bucket_name in enumerate(batch):
+            sizes[bucket_name] = latest.get(f'q{i}', 0) / (1024**3)
+    return sizes
+
+def fetch_s3_inventory(s3, cw) -> List[Dict]:
+    """Fetch S3 buckets, sized from CloudWatch metrics"""
     try:
-        s3 = session.client('s3')
         response = s3.list_buckets()
+        bucket_list = response.get('Buckets', [])
+        
+        # Get bucket sizes (approximate) - one CloudWatch request per 500 buckets
+        try:
+            sizes = _get_bucket_sizes(cw, tuple(bucket['Name'] for bucket in bucket_list))
+        except Exception:
+            sizes = {}
         
         buckets = []
-        for bucket in response.get('Buckets', []):
-            bucket_name = bucket['Name']
-            
-            # Get bucket size (this is approximate)
-            try:
-                cw = session.client('cloudwatch')
-                size_response = cw.get_metric_statistics(
-                    Namespace='AWS/S3',
-                    MetricName='BucketSizeBytes',
-                    Dimensions=[
-                        {'Name': 'BucketName', 'Value': bucket_name},
-                        {'Name': 'StorageType', 'Value': 'StandardStorage'}
-                    ],
-                    StartTime=datetime.now() - timedelta(days=2),
-                    EndTime=datetime.now(),
-                    Period=86400,
-                    Statistics=['Average']
-                )
-                
-                size_gb = 0
-                if size_response['Datapoints']:
-                    size_bytes = size_response['Datapoints'][0]['Average']
-                    size_gb = size_bytes / (1024**3)
-                
+        for bucket in bucket_list:
+            size_gb = sizes.get(bucket['Name'])
+            if size_gb is None:
                 buckets.append({
-                    'BucketName': bucket_name,
+                    'BucketName': bucket['Name'],
                     'CreationDate': bucket['CreationDate'],
-                    'SizeGB': round(size_gb, 2),
-                    'EstimatedMonthlyCost': round(size_gb * 0.023, 2)  # S3 Standard pricing
+                    'SizeGB': 'N/A',
+                    'EstimatedMonthlyCost': 'N/A'
                 })
-            except:
+            else:
                 buckets.append({
-                    'BucketName': bucket_name,
+                    'BucketName': bucket['Name'],
                     'CreationDate': bucket['CreationDate'],
-                    'SizeGB': 'N/A',
-                    'EstimatedMonthlyCost': 'N/A'
+                    'SizeGB': round(size_gb, 2),
+                    'EstimatedMonthlyCost': round(size_gb * 0.023, 2)  # S3 Standard pricing
                 })
         
         return buckets
@@ -328,42 +490,48 @@ def fetch_s3_inventory(session) -> List[Dict]:
         st.warning(f"Could not fetch S3 inventory: {str(e)}")
         return []
 
-def fetch_lambda_inventory(session) -> List[Dict]:
+def fetch_lambda_inventory(lambda_client) -> List[Dict]:
     """Fetch Lambda functions"""
     try:
-        lambda_client = session.client('lambda')
-        response = lambda_client.list_functions()
+        pages = lambda_client.get_paginator('list_functions').paginate()
         
-        functions = []
-        for func in response.get('Functions', []):
-            functions.append({
+        return [
+            {
                 'FunctionName': func.get('FunctionName'),
                 'Runtime': func.get('Runtime'),
                 'MemorySize': func.get('MemorySize'),
                 'LastModified': func.get('LastModified'),
                 'EstimatedMonthlyCost': 'Usage-based'
-            })
-        return functions
+            }
+            for func in chain.from_iterable(page.get('Functions', []) for page in pages)
+        ]
     except ClientError as e:
         st.warning(f"Could not fetch Lambda inventory: {str(e)}")
         return []
 
-def fetch_ebs_inventory(session) -> List[Dict]:
+def fetch_ebs_inventory(ec2) -> List[Dict]:
     """Fetch EBS volumes"""
     try:
-        ec2 = session.client('ec2')
-        response = ec2.describe_volumes()
+        pages = ec2.get_paginator('describe_volumes').paginate(
+            PaginationConfig={'PageSize': 500}
+        )
         
-        volumes = []
-        for vol in response.get('Volumes', []):
-            volumes.append({
+        volumes = [
+            {
                 'VolumeId': vol.get('VolumeId'),
                 'VolumeType': vol.get('VolumeType'),
                 'Size': vol.get('Size'),
-                'State': vol.get('State'),
-                'EstimatedMonthlyCost': calculate_ebs_cost(vol.get('VolumeType'), vol.get('Size'))
-            })
-        return volumes
+                'State': vol.get('State')
+            }
+            for vol in chain.from_iterable(page.get('Volumes', []) for page in pages)
+        ]
+        if not volumes:
+            return []
+        
+        df = pd.DataFrame.from_records(volumes)
+        price_per_gb = df['VolumeType'].map(_EBS_PRICING_PER_GB).fillna(_EBS_DEFAULT_PRICE_PER_GB)
+        df['EstimatedMonthlyCost'] = (df['Size'] * price_per_gb).round(2)
+        return df.to_dict('records')
     except ClientError as e:
         st.warning(f"Could not fetch EBS inventory: {str(e)}")
         return []
@@ -372,128 +540,171 @@ def fetch_ebs_inventory(session) -> List[Dict]:
 # COST CALCULATIONS
 # ============================================================================
 
+# Simplified pricing (actual pricing varies by region)
+_EC2_PRICING = {
+    't2.micro': 8.50,
+    't2.small': 17.00,
+    't2.medium': 34.00,
+    't3.micro': 7.50,
+    't3.small': 15.00,
+    't3.medium': 30.00,
+    'm5.large': 70.00,
+    'm5.xlarge': 140.00,
+    'c5.large': 62.00,
+    'r5.large': 92.00
+}
+_EC2_DEFAULT_COST = 50.00  # Default estimate
+
+_RDS_PRICING = {
+    'db.t3.micro': 12.00,
+    'db.t3.small': 24.00,
+    'db.t3.medium': 48.00,
+    'db.m5.large': 140.00,
+    'db.r5.large': 180.00
+}
+_RDS_DEFAULT_COST = 75.00
+
+_EBS_PRICING_PER_GB = {
+    'gp2': 0.10,
+    'gp3': 0.08,
+    'io1': 0.125,
+    'io2': 0.125,
+    'st1': 0.045,
+    'sc1': 0.015
+}
+_EBS_DEFAULT_PRICE_PER_GB = 0.10
+
+# Cost lookups repeat for the same few instance/volume types, so memoize them
+@lru_cache(maxsize=None)
 def calculate_ec2_cost(instance_type: str) -> float:
     """Calculate approximate monthly EC2 cost"""
-    # Simplified pricing (actual pricing varies by region)
-    pricing = {
-        't2.micro': 8.50,
-        't2.small': 17.00,
-        't2.medium': 34.00,
-        't3.micro': 7.50,
-        't3.small': 15.00,
-        't3.medium': 30.00,
-        'm5.large': 70.00,
-        'm5.xlarge': 140.00,
-        'c5.large': 62.00,
-        'r5.large': 92.00
-    }
-    return pricing.get(instance_type, 50.00)  # Default estimate
+    return _EC2_PRICING.get(instance_type, _EC2_DEFAULT_COST)
 
 def calculate_rds_cost(instance_class: str) -> float:
     """Calculate approximate monthly RDS cost"""
-    pricing = {
-        'db.t3.micro': 12.00,
-        'db.t3.small': 24.00,
-        'db.t3.medium': 48.00,
-        'db.m5.large': 140.00,
-        'db.r5.large': 180.00
-    }
-    return pricing.get(instance_class, 75.00)
+    return _RDS_PRICING.get(instance_class, _RDS_DEFAULT_COST)
 
+@lru_cache(maxsize=1024)
 def calculate_ebs_cost(volume_type: str, size: int) -> float:
     """Calculate approximate monthly EBS cost"""
-    pricing_per_gb = {
-        'gp2': 0.10,
-        'gp3': 0.08,
-        'io1': 0.125,
-        'io2': 0.125,
-        'st1': 0.045,
-        'sc1': 0.015
-    }
-    price_per_gb = pricing_per_gb.get(volume_type, 0.10)
+    price_per_gb = _EBS_PRICING_PER_GB.get(volume_type, _EBS_DEFAULT_PRICE_PER_GB)
     return round(size * price_per_gb, 2)
 
 # ============================================================================
 # TAG MANAGEMENT
 # ============================================================================
 
-def fetch_tag_compliance(session) -> Dict:
+def fetch_tag_compliance(session, *, demo: bool = False) -> Dict:
     """Analyze tag compliance across resources"""
-    if not session or st.session_state.get('demo_mode', False):
+    if demo or not session:
         return generate_demo_tag_compliance()
     
     try:
-        tagging = session.client('resourcegroupstaggingapi')
-        
-        # Required tags for compliance
-        required_tags = ['Environment', 'Owner', 'CostCenter', 'Portfolio', 'Application']
-        
-        # Get all resources
-        response = tagging.get_resources(
-            ResourcesPerPage=100
-        )
-        
-        resources = response.get('ResourceTagMappingList', [])
-        
-        compliance_data = {
-            'total_resources': len(resources),
-            'tagged_resources': 0,
-            'untagged_resources': 0,
-            'partially_tagged': 0,
-            'compliant_resources': 0,
-            'tag_coverage': {},
-            'resources_by_service': {}
-        }
-        
-        for resource in resources:
-            tags = {tag['Key']: tag['Value'] for tag in resource.get('Tags', [])}
-            resource_arn = resource.get('ResourceARN', '')
-            
-            # Determine service from ARN
-            service = resource_arn.split(':')[2] if ':' in resource_arn else 'unknown'
-            compliance_data['resources_by_service'][service] = \
-                compliance_data['resources_by_service'].get(service, 0) + 1
-            
-            if not tags:
-                compliance_data['untagged_resources'] += 1
-            else:
-                compliance_data['tagged_resources'] += 1
-                
-                # Check compliance
-                missing_tags = [tag for tag in required_tags if tag not in tags]
-                
-                if not missing_tags:
-                    compliance_data['compliant_resources'] += 1
-                elif len(missing_tags) < len(required_tags):
-                    compliance_data['partially_tagged'] += 1
-                
-                # Track individual tag coverage
-                for tag_key in required_tags:
-                    if tag_key in tags:
-                        compliance_data['tag_coverage'][tag_key] = \
-                            compliance_data['tag_coverage'].get(tag_key, 0) + 1
-        
-        return compliance_data
-        
+        session_key = _session_cache_key(session)
+        tagging = _session_client(session, session_key, 'resourcegroupstaggingapi')
+        return _fetch_tag_compliance_live(tagging, session_key)
     except ClientError as e:
         st.warning(f"Could not fetch tag compliance: {str(e)}")
         return generate_demo_tag_compliance()
 
-def apply_tags_to_resources(session, resources: List[str], tags: Dict[str, str]) -> Dict:
-    """Apply tags to specified resources"""
+# Errors propagate uncached so a transient failure is retried on the next rerun
+@st.cache_data(ttl=600, show_spinner=False)
+def _fetch_tag_compliance_live(_tagging, session_key: str) -> Dict:
+    """Paginate every tagged resource and compute compliance counts (cached per session)"""
+    # Required tags for compliance
+    required_tags = ['Environment', 'Owner', 'CostCenter', 'Portfolio', 'Application']
+    required_set = frozenset(required_tags)
+    
+    # Get all resources - a single get_resources call stops at the first page
+    pages = _tagging.get_paginator('get_resources').paginate(
+        PaginationConfig={'PageSize': 100}
+    )
+    # Only tag keys matter for compliance, so skip building key->value dicts
+    df = pd.DataFrame.from_records(
+        [
+            {
+                'arn': resource.get('ResourceARN', ''),
+                'tag_keys': frozenset(tag['Key'] for tag in resource.get('Tags', ()))
+            }
+            for page in pages
+            for resource in page.get('ResourceTagMappingList', [])
+        ],
+        columns=['arn', 'tag_keys']
+    )
+    
+    compliance_data = {
+        'total_resources': len(df),
+        'tagged_resources': 0,
+        'untagged_resources': 0,
+        'partially_tagged': 0,
+        'compliant_resources': 0,
+        'tag_coverage': {},
+        'resources_by_service': {}
+    }
+    if df.empty:
+        return compliance_data
+    
+    # Determine service from ARN (arn:partition:service:...)
+    service = df['arn'].str.split(':', n=3).str[2].fillna('unknown')
+    compliance_data['resources_by_service'] = {
+        svc: int(count) for svc, count in service.value_counts().items()
+    }
+    
+    has_tags = df['tag_keys'].map(bool)
+    missing = df['tag_keys'].map(lambda keys: len(required_set - keys))
+    
+    compliance_data['tagged_resources'] = int(has_tags.sum())
+    compliance_data['untagged_resources'] = int((~has_tags).sum())
+    compliance_data['compliant_resources'] = int((has_tags & (missing == 0)).sum())
+    compliance_data['partially_tagged'] = int(
+        (has_tags & (missing > 0) & (missing < len(required_tags))).sum()
+    )
+    
+    # Track individual tag coverage over the required tags each resource carries
+    key_counts = df['tag_keys'].map(lambda keys: list(required_set & keys)).explode().value_counts()
+    compliance_data['tag_coverage'] = {
+        tag: int(key_counts[tag]) for tag in required_tags if tag in key_counts.index
+    }
+    
+    return compliance_data
+
+# The Resource Groups Tagging API accepts at most 20 ARNs per TagResources call
+_TAG_BATCH_SIZE = 20
+
+def _tag_resource_batch(tagging, arns: List[str], tags: Dict[str, str]) -> Dict:
+    """Tag one batch of ARNs; a failed call marks every ARN in the batch as failed"""
+    try:
+        response = tagging.tag_resources(ResourceARNList=arns, Tags=tags)
+        return response.get('FailedResourcesMap', {})
+    except ClientError as e:
+        error = e.response.get('Error', {})
+        return {
+            arn: {'ErrorCode': error.get('Code', 'Unknown'), 'ErrorMessage': error.get('Message', str(e))}
+            for arn in arns
+        }
+
+def apply_tags_to_resources(session, resources: List[str], tags: Dict[str, str],
+                            max_workers: int = 8) -> Dict:
+    """Apply tags to specified resources in parallel batches of 20 ARNs"""
     try:
         tagging = session.client('resourcegroupstaggingapi')
         
-        tag_list = [{'Key': k, 'Value': v} for k, v in tags.items()]
+        batches = [resources[i:i + _TAG_BATCH_SIZE] for i in range(0, len(resources), _TAG_BATCH_SIZE)]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            batch_failures = list(executor.map(
+                lambda batch: _tag_resource_batch(tagging, batch, tags),
+                batches
+            ))
         
-        response = tagging.tag_resources(
-            ResourceARNList=resources,
-            Tags=tag_list
-        )
+        failed_resources = {}
+        for failures in batch_failures:
+            failed_resources.update(failures)
         
         return {
-            'success': True,
-            'failed_resources': response.get('FailedResourcesMap', {})
+            'success': len(failed_resources) < len(resources) or not resources,
+            'tagged_count': len(resources) - len(failed_resources),
+            'failed_count': len(failed_resources),
+            'failed_resources': failed_resources
         }
     except ClientError as e:
         return {
@@ -505,32 +716,47 @@ def apply_tags_to_resources(session, resources: List[str], tags: Dict[str, str])
 # COST OPTIMIZATION RECOMMENDATIONS
 # ============================================================================
 
-def fetch_cost_optimization_recommendations(session) -> Dict:
+# [instanceArn, currentInstanceType, top recommended instanceType] per recommendation
+_EC2_RIGHTSIZING_EXPR = jmespath.compile(
+    'instanceRecommendations[*].[instanceArn, currentInstanceType, recommendationOptions[0].instanceType]'
+)
+
+def _iter_ec2_rightsizing(co_client):
+    """Yield (arn, current_type, recommended_type) across every recommendations page"""
+    # botocore ships no paginator for this operation, so page on nextToken manually
+    kwargs = {'maxResults': 1000}
+    while True:
+        response = co_client.get_ec2_instance_recommendations(**kwargs)
+        yield from _EC2_RIGHTSIZING_EXPR.search(response) or []
+        next_token = response.get('nextToken')
+        if not next_token:
+            return
+        kwargs['nextToken'] = next_token
+
+def fetch_cost_optimization_recommendations(session, *, demo: bool = False) -> Dict:
     """Fetch recommendations from AWS Compute Optimizer and Cost Explorer"""
-    if not session or st.session_state.get('demo_mode', False):
+    if demo or not session:
         return generate_demo_optimization_recommendations()
     
-    recommendations = {
-        'ec2_rightsizing': [],
-        'unused_resources': [],
-        'reserved_instance_opportunities': [],
-        'savings_plans': [],
-        'total_potential_savings': 0
-    }
+    session_key = _session_cache_key(session)
+    return _fetch_optimization_recommendations_live(
+        _session_client(session, session_key, 'compute-optimizer'),
+        _session_client(session, session_key, 'ec2'),
+        session_key
+    )
+
+@st.cache_data(ttl=900, show_spinner=False)
+def _fetch_optimization_recommendations_live(_co_client, _ec2, session_key: str) -> Dict:
+    """Collect rightsizing and unused-resource recommendations (cached per session)"""
+    ec2_rightsizing = []
+    unused_resources = []
     
     try:
-        # Get Compute Optimizer recommendations
-        co_client = session.client('compute-optimizer')
-        
-        # EC2 Rightsizing
-        ec2_recs = co_client.get_ec2_instance_recommendations()
-        for rec in ec2_recs.get('instanceRecommendations', []):
-            current_type = rec.get('currentInstanceType')
-            recommended_type = rec.get('recommendationOptions', [{}])[0].get('instanceType')
-            
+        # EC2 Rightsizing from Compute Optimizer - follow nextToken, a single call stops at the first page
+        for arn, current_type, recommended_type in _iter_ec2_rightsizing(_co_client):
             if recommended_type and recommended_type != current_type:
-                recommendations['ec2_rightsizing'].append({
-                    'instance_id': rec.get('instanceArn', '').split('/')[-1],
+                ec2_rightsizing.append({
+                    'instance_id': (arn or '').rpartition('/')[2],
                     'current_type': current_type,
                     'recommended_type': recommended_type,
                     'reason': 'Underutilized - Lower performance tier suitable',
@@ -541,158 +767,219 @@ def fetch_cost_optimization_recommendations(session) -> Dict:
     
     # Identify unused resources
     try:
-        recommendations['unused_resources'] = identify_unused_resources(session)
+        unused_resources = identify_unused_resources(_ec2)
     except Exception as e:
         st.warning(f"Could not identify unused resources: {str(e)}")
     
-    # Calculate total potential savings
-    total_savings = 0
-    for rec in recommendations['ec2_rightsizing']:
-        total_savings += rec['estimated_savings']
-    for res in recommendations['unused_resources']:
-        total_savings += res.get('monthly_cost', 0)
-    
-    recommendations['total_potential_savings'] = total_savings
-    
-    return recommendations
+    # Assemble the result once both sources are in, with total potential savings
+    return {
+        'ec2_rightsizing': ec2_rightsizing,
+        'unused_resources': unused_resources,
+        'reserved_instance_opportunities': [],
+        'savings_plans': [],
+        'total_potential_savings': (
+            sum(rec['estimated_savings'] for rec in ec2_rightsizing)
+            + sum(res.get('monthly_cost', 0) for res in unused_resources)
+        )
+    }
 
+@lru_cache(maxsize=512)
 def calculate_rightsizing_savings(current: str, recommended: str) -> float:
     """Calculate potential monthly savings from rightsizing"""
     current_cost = calculate_ec2_cost(current)
     recommended_cost = calculate_ec2_cost(recommended)
     return max(0, current_cost - recommended_cost)
 
-def identify_unused_resources(session) -> List[Dict]:
+def _list_unattached_volumes(ec2) -> List[Dict]:
+    """Unattached EBS volumes"""
+    volumes = ec2.describe_volumes(
+        Filters=[{'Name': 'status', 'Values': ['available']}]
+    )
+    return [
+        {
+            'resource_type': 'EBS Volume',
+            'resource_id': vol['VolumeId'],
+            'reason': 'Unattached volume',
+            'monthly_cost': calculate_ebs_cost(vol['VolumeType'], vol['Size'])
+        }
+        for vol in volumes.get('Volumes', [])
+    ]
+
+def _list_unassociated_eips(ec2) -> List[Dict]:
+    """Elastic IPs (VPC and EC2-Classic) not associated with an instance"""
+    eips = ec2.describe_addresses()
+    return [
+        {
+            'resource_type': 'Elastic IP',
+            'resource_id': eip.get('PublicIp'),
+            'reason': 'Not associated with instance',
+            'monthly_cost': 3.60  # $0.005/hour
+        }
+        for eip in eips.get('Addresses', [])
+        if 'InstanceId' not in eip
+    ]
+
+_UNUSED_RESOURCES_LIMIT = 10
+
+def _list_old_snapshots(ec2, limit: int = _UNUSED_RESOURCES_LIMIT) -> List[Dict]:
+    """EBS snapshots older than 90 days (stops paging once limit are found)"""
+    pages = ec2.get_paginator('describe_snapshots').paginate(
+        OwnerIds=['self'],
+        # No server-side age filter exists; at least skip pending/errored snapshots
+        Filters=[{'Name': 'status', 'Values': ['completed']}],
+        PaginationConfig={'PageSize': 1000}
+    )
+    # boto3 returns tz-aware StartTime values, so compare against an aware cutoff
+    cutoff = datetime.now(timezone.utc) - timedelta(days=90)
+    
+    old_snapshots = []
+    for page in pages:
+        old_snapshots.extend(
+            {
+                'resource_type': 'EBS Snapshot',
+                'resource_id': snap['SnapshotId'],
+                'reason': 'Older than 90 days',
+                'monthly_cost': snap['VolumeSize'] * 0.05  # $0.05/GB-month
+            }
+            for snap in page.get('Snapshots', [])
+            if snap['StartTime'] < cutoff
+        )
+        if len(old_snapshots) >= limit:
+            break
+    return old_snapshots[:limit]
+
+def identify_unused_resources(ec2) -> List[Dict]:
     """Identify unused AWS resources"""
     unused = []
+    listers = (_list_unattached_volumes, _list_unassociated_eips, _list_old_snapshots)
     
-    try:
-        # Unused EBS volumes
-        ec2 = session.client('ec2')
-        volumes = ec2.describe_volumes(
-            Filters=[{'Name': 'status', 'Values': ['available']}]
-        )
-        
-        for vol in volumes.get('Volumes', []):
-            unused.append({
-                'resource_type': 'EBS Volume',
-                'resource_id': vol['VolumeId'],
-                'reason': 'Unattached volume',
-                'monthly_cost': calculate_ebs_cost(vol['VolumeType'], vol['Size'])
-            })
-        
-        # Unused Elastic IPs
-        eips = ec2.describe_addresses()
-        for eip in eips.get('Addresses', []):
-            if 'InstanceId' not in eip:
-                unused.append({
-                    'resource_type': 'Elastic IP',
-                    'resource_id': eip.get('PublicIp'),
-                    'reason': 'Not associated with instance',
-                    'monthly_cost': 3.60  # $0.005/hour
-                })
-        
-        # Old snapshots (>90 days)
-        snapshots = ec2.describe_snapshots(OwnerIds=['self'])
-        ninety_days_ago = datetime.now() - timedelta(days=90)
-        
-        for snap in snapshots.get('Snapshots', []):
-            if snap['StartTime'].replace(tzinfo=None) < ninety_days_ago:
-                unused.append({
-                    'resource_type': 'EBS Snapshot',
-                    'resource_id': snap['SnapshotId'],
-                    'reason': 'Older than 90 days',
-                    'monthly_cost': snap['VolumeSize'] * 0.05  # $0.05/GB-month
-                })
-    
-    except ClientError as e:
-        st.warning(f"Could not identify some unused resources: {str(e)}")
+    # The three describe calls are independent, so issue them concurrently
+    with ThreadPoolExecutor(max_workers=len(listers)) as executor:
+        futures = [executor.submit(lister, ec2) for lister in listers]
+        for future in futures:
+            try:
+                unused.extend(future.result())
+            except ClientError as e:
+                st.warning(f"Could not identify some unused resources: {str(e)}")
     
-    return unused[:10]  # Return top 10
+    return unused[:_UNUSED_RESOURCES_LIMIT]  # Return top 10
 
 # ============================================================================
 # AWS TRUSTED ADVISOR / BEST PRACTICES
 # ============================================================================
 
-def fetch_trusted_advisor_checks(session) -> Dict:
+# The AWS Support API is only served from us-east-1
+_SUPPORT_REGION = 'us-east-1'
+
+# Trusted Advisor check results are independent round-trips; fan them out
+_TA_DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) * 5)
+
+# Trusted Advisor category -> results bucket
+_TA_CATEGORY_MAP = {
+    'cost_optimizing': 'cost_optimization',
+    'security': 'security',
+    'performance': 'performance',
+    'fault_tolerance': 'fault_tolerance',
+    'service_limits': 'service_limits'
+}
+
+def _fetch_ta_check_result(support, check: Dict) -> Optional[Dict]:
+    """Fetch one Trusted Advisor check result, or None if it cannot be read"""
+    try:
+        result = support.describe_trusted_advisor_check_result(
+            checkId=check['id'],
+            language='en'
+        )
+    except Exception:
+        return None
+    
+    check_result = result.get('result', {})
+    return {
+        'name': check['name'],
+        'description': check['description'],
+        'status': check_result.get('status', 'unknown'),
+        'flagged_resources': check_result.get('flaggedResources', [])
+    }
+
+def fetch_trusted_advisor_checks(session, *, demo: bool = False,
+                                 max_workers: int = _TA_DEFAULT_WORKERS) -> Dict:
     """Fetch AWS Trusted Advisor recommendations"""
-    if not session or st.session_state.get('demo_mode', False):
+    if demo or not session:
         return generate_demo_trusted_advisor()
     
     try:
-        support = session.client('support', region_name='us-east-1')
-        
-        # Get all checks
-        checks = support.describe_trusted_advisor_checks(language='en')
-        
-        results = {
-            'cost_optimization': [],
-            'security': [],
-            'performance': [],
-            'fault_tolerance': [],
-            'service_limits': []
-        }
-        
-        for check in checks.get('checks', []):
-            check_id = check['id']
-            category = check['category']
-            
-            # Get check result
-            try:
-                result = support.describe_trusted_advisor_check_result(
-                    checkId=check_id,
-                    language='en'
-                )
-                
-                check_result = result.get('result', {})
-                status = check_result.get('status', 'unknown')
-                
-                check_info = {
-                    'name': check['name'],
-                    'description': check['description'],
-                    'status': status,
-                    'flagged_resources': check_result.get('flaggedResources', [])
-                }
-                
-                # Categorize
-                if category == 'cost_optimizing':
-                    results['cost_optimization'].append(check_info)
-                elif category == 'security':
-                    results['security'].append(check_info)
-                elif category == 'performance':
-                    results['performance'].append(check_info)
-                elif category == 'fault_tolerance':
-                    results['fault_tolerance'].append(check_info)
-                elif category == 'service_limits':
-                    results['service_limits'].append(check_info)
-            except:
-                continue
-        
-        return results
-        
+        session_key = _session_cache_key(session)
+        support = _session_client(session, session_key, 'support', _SUPPORT_REGION)
+        return _fetch_trusted_advisor_live(support, session_key, max_workers)
     except ClientError as e:
         st.warning(f"Trusted Advisor not available (requires Business/Enterprise support): {str(e)}")
         return generate_demo_trusted_advisor()
 
+# Errors propagate uncached so a transient failure is retried on the next rerun
+@st.cache_data(ttl=900, show_spinner=False)
+def _fetch_trusted_advisor_live(_support, session_key: str, max_workers: int) -> Dict:
+    """Fetch and categorize every Trusted Advisor check result (cached per session)"""
+    # Get all checks
+    checks = _support.describe_trusted_advisor_checks(language='en').get('checks', [])
+    
+    results = {
+        'cost_optimization': [],
+        'security': [],
+        'performance': [],
+        'fault_tolerance': [],
+        'service_limits': []
+    }
+    
+    # Get check results concurrently; unreadable checks are skipped
+    check_infos = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_fetch_ta_check_result, _support, check): check['id']
+            for check in checks
+        }
+        for future in as_completed(futures):
+            check_infos[futures[future]] = future.result()
+    
+    for check in checks:
+        check_info = check_infos.get(check['id'])
+        if check_info is None:
+            continue
+        # Categorize; checks in unknown categories are dropped
+        bucket = _TA_CATEGORY_MAP.get(check['category'])
+        if bucket:
+            results[bucket].append(check_info)
+    
+    return results
+
 # ============================================================================
 # DEMO DATA GENERATORS
 # ============================================================================
 
 def generate_demo_cost_data() -> Dict:
     """Generate demo cost data for testing"""
-    start_date = datetime.now() - timedelta(days=30)
-    
-    results = []
-    for i in range(30):
-        date = start_date + timedelta(days=i)
-        results.append({
+    return _demo_cost_data_for(datetime.now().strftime('%Y-%m-%d'))
+
+# Date-relative demo payloads are persisted to disk and keyed on the current
+# day to stay fresh. Static ones are module-level constants (treat as read-only).
+@st.cache_data(persist='disk', show_spinner=False, max_entries=2)
+def _demo_cost_data_for(as_of: str) -> Dict:
+    """Demo cost data for the 30 days before ``as_of``"""
+    start_date = datetime.strptime(as_of, '%Y-%m-%d') - timedelta(days=30)
+    
+    # Daily totals for the whole window in one vectorized expression
+    day = np.arange(30)
+    costs = 150 + day * 5 + (day % 7) * 20
+    dates = [start_date + timedelta(days=i) for i in range(31)]
+    
+    results = [
+        {
             'TimePeriod': {
-                'Start': date.strftime('%Y-%m-%d'),
-                'End': (date + timedelta(days=1)).strftime('%Y-%m-%d')
+                'Start': f"{date:%Y-%m-%d}",
+                'End': f"{next_date:%Y-%m-%d}"
             },
             'Total': {
                 'UnblendedCost': {
-                    'Amount': str(150 + (i * 5) + (i % 7) * 20),
+                    'Amount': f"{cost}",
                     'Unit': 'USD'
                 }
             },
@@ -702,48 +989,60 @@ def generate_demo_cost_data() -> Dict:
                 {'Keys': ['S3'], 'Metrics': {'UnblendedCost': {'Amount': '20', 'Unit': 'USD'}}},
                 {'Keys': ['Lambda'], 'Metrics': {'UnblendedCost': {'Amount': '15', 'Unit': 'USD'}}},
             ]
-        })
+        }
+        for date, next_date, cost in zip(dates, dates[1:], costs.tolist())
+    ]
     
     return {'ResultsByTime': results}
 
+_DEMO_PORTFOLIO_COSTS = {
+    'ResultsByTime': [
+        {
+            'TimePeriod': {'Start': '2024-11-01', 'End': '2024-11-30'},
+            'Groups': [
+                {'Keys': ['Retail'], 'Metrics': {'UnblendedCost': {'Amount': '4500', 'Unit': 'USD'}}},
+                {'Keys': ['Healthcare'], 'Metrics': {'UnblendedCost': {'Amount': '6800', 'Unit': 'USD'}}},
+                {'Keys': ['Financial'], 'Metrics': {'UnblendedCost': {'Amount': '8200', 'Unit': 'USD'}}},
+            ]
+        }
+    ]
+}
+
 def generate_demo_portfolio_costs() -> Dict:
     """Generate demo portfolio cost breakdown"""
-    return {
-        'ResultsByTime': [
-            {
-                'TimePeriod': {'Start': '2024-11-01', 'End': '2024-11-30'},
-                'Groups': [
-                    {'Keys': ['Retail'], 'Metrics': {'UnblendedCost': {'Amount': '4500', 'Unit': 'USD'}}},
-                    {'Keys': ['Healthcare'], 'Metrics': {'UnblendedCost': {'Amount': '6800', 'Unit': 'USD'}}},
-                    {'Keys': ['Financial'], 'Metrics': {'UnblendedCost': {'Amount': '8200', 'Unit': 'USD'}}},
-                ]
-            }
-        ]
-    }
+    return _DEMO_PORTFOLIO_COSTS
+
+_DEMO_FORECAST = {
+    'Total': {
+        'Amount': '6500',
+        'Unit': 'USD'
+    },
+    'ForecastResultsByTime': [
+        {'TimePeriod': {'Start': '2024-12-01', 'End': '2024-12-31'},
+         'MeanValue': '6500'}
+    ]
+}
 
 def generate_demo_forecast() -> Dict:
     """Generate demo forecast data"""
-    return {
-        'Total': {
-            'Amount': '6500',
-            'Unit': 'USD'
-        },
-        'ForecastResultsByTime': [
-            {'TimePeriod': {'Start': '2024-12-01', 'End': '2024-12-31'},
-             'MeanValue': '6500'}
-        ]
-    }
+    return _DEMO_FORECAST
 
 def generate_demo_anomalies() -> List[Dict]:
     """Generate demo anomaly data"""
+    return _demo_anomalies_for(datetime.now().strftime('%Y-%m-%d'))
+
+@st.cache_data(persist='disk', show_spinner=False, max_entries=2)
+def _demo_anomalies_for(as_of: str) -> List[Dict]:
+    """Demo anomalies dated relative to ``as_of``"""
+    today = datetime.strptime(as_of, '%Y-%m-%d')
     return [
         {
             'AnomalyId': 'ANOM-001',
             'AnomalyScore': {'MaxScore': 0.85, 'CurrentScore': 0.85},
             'Impact': {'MaxImpact': 450, 'TotalImpact': 450},
             'MonitorArn': 'arn:aws:ce::123456789012:anomalymonitor/monitor-1',
-            'AnomalyStartDate': (datetime.now() - timedelta(days=2)).strftime('%Y-%m-%d'),
-            'AnomalyEndDate': (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d'),
+            'AnomalyStartDate': (today - timedelta(days=2)).strftime('%Y-%m-%d'),
+            'AnomalyEndDate': (today - timedelta(days=1)).strftime('%Y-%m-%d'),
             'DimensionValue': 'EC2',
             'RootCauses': [
                 {'Service': 'EC2', 'Region': 'us-east-1', 'UsageType': 'm5.xlarge'}
@@ -754,8 +1053,8 @@ def generate_demo_anomalies() -> List[Dict]:
             'AnomalyScore': {'MaxScore': 0.72, 'CurrentScore': 0.72},
             'Impact': {'MaxImpact': 320, 'TotalImpact': 320},
             'MonitorArn': 'arn:aws:ce::123456789012:anomalymonitor/monitor-1',
-            'AnomalyStartDate': (datetime.now() - timedelta(days=5)).strftime('%Y-%m-%d'),
-            'AnomalyEndDate': (datetime.now() - timedelta(days=4)).strftime('%Y-%m-%d'),
+            'AnomalyStartDate': (today - timedelta(days=5)).strftime('%Y-%m-%d'),
+            'AnomalyEndDate': (today - timedelta(days=4)).strftime('%Y-%m-%d'),
             'DimensionValue': 'RDS',
             'RootCauses': [
                 {'Service': 'RDS', 'Region': 'us-west-2', 'UsageType': 'db.m5.large'}
@@ -765,14 +1064,20 @@ def generate_demo_anomalies() -> List[Dict]:
 
 def generate_demo_inventory() -> Dict:
     """Generate demo inventory data"""
+    return _demo_inventory_for(datetime.now().strftime('%Y-%m-%d'))
+
+@st.cache_data(persist='disk', show_spinner=False, max_entries=2)
+def _demo_inventory_for(as_of: str) -> Dict:
+    """Demo inventory with launch times relative to ``as_of``"""
+    today = datetime.strptime(as_of, '%Y-%m-%d')
     return {
         'ec2': [
             {'InstanceId': 'i-0123456789abcdef0', 'InstanceType': 't3.medium', 'State': 'running',
-             'LaunchTime': datetime.now() - timedelta(days=45), 'EstimatedMonthlyCost': 30.00},
+             'LaunchTime': today - timedelta(days=45), 'EstimatedMonthlyCost': 30.00},
             {'InstanceId': 'i-0123456789abcdef1', 'InstanceType': 'm5.large', 'State': 'running',
-             'LaunchTime': datetime.now() - timedelta(days=120), 'EstimatedMonthlyCost': 70.00},
+             'LaunchTime': today - timedelta(days=120), 'EstimatedMonthlyCost': 70.00},
             {'InstanceId': 'i-0123456789abcdef2', 'InstanceType': 't3.small', 'State': 'stopped',
-             'LaunchTime': datetime.now() - timedelta(days=200), 'EstimatedMonthlyCost': 0.00},
+             'LaunchTime': today - timedelta(days=200), 'EstimatedMonthlyCost': 0.00},
         ],
         'rds': [
             {'DBInstanceIdentifier': 'prod-database', 'DBInstanceClass': 'db.m5.large',
@@ -799,152 +1104,434 @@ def generate_demo_inventory() -> Dict:
         ]
     }
 
+_DEMO_TAG_COMPLIANCE = {
+    'total_resources': 156,
+    'tagged_resources': 134,
+    'untagged_resources': 22,
+    'partially_tagged': 45,
+    'compliant_resources': 89,
+    'tag_coverage': {
+        'Environment': 142,
+        'Owner': 128,
+        'CostCenter': 115,
+        'Portfolio': 134,
+        'Application': 98
+    },
+    'resources_by_service': {
+        'ec2': 42,
+        's3': 35,
+        'rds': 18,
+        'lambda': 28,
+        'dynamodb': 12,
+        'efs': 8,
+        'elasticloadbalancing': 13
+    }
+}
+
 def generate_demo_tag_compliance() -> Dict:
     """Generate demo tag compliance data"""
-    return {
-        'total_resources': 156,
-        'tagged_resources': 134,
-        'untagged_resources': 22,
-        'partially_tagged': 45,
-        'compliant_resources': 89,
-        'tag_coverage': {
-            'Environment': 142,
-            'Owner': 128,
-            'CostCenter': 115,
-            'Portfolio': 134,
-            'Application': 98
+    return _DEMO_TAG_COMPLIANCE
+
+_DEMO_OPTIMIZATION_RECOMMENDATIONS = {
+    'ec2_rightsizing': [
+        {
+            'instance_id': 'i-0123456789abcdef0',
+            'current_type': 'm5.xlarge',
+            'recommended_type': 'm5.large',
+            'reason': 'CPU utilization consistently below 20%',
+            'estimated_savings': 70.00
         },
-        'resources_by_service': {
-            'ec2': 42,
-            's3': 35,
-            'rds': 18,
-            'lambda': 28,
-            'dynamodb': 12,
-            'efs': 8,
-            'elasticloadbalancing': 13
-        }
-    }
+        {
+            'instance_id': 'i-0123456789abcdef1',
+            'current_type': 'c5.2xlarge',
+            'recommended_type': 'c5.xlarge',
+            'reason': 'Memory utilization below 30%',
+            'estimated_savings': 125.00
+        },
+    ],
+    'unused_resources': [
+        {
+            'resource_type': 'EBS Volume',
+            'resource_id': 'vol-0123456789abcdef2',
+            'reason': 'Unattached for 45+ days',
+            'monthly_cost': 5.00
+        },
+        {
+            'resource_type': 'Elastic IP',
+            'resource_id': '54.123.45.67',
+            'reason': 'Not associated with instance',
+            'monthly_cost': 3.60
+        },
+        {
+            'resource_type': 'EBS Snapshot',
+            'resource_id': 'snap-0123456789abcdef',
+            'reason': 'Older than 180 days',
+            'monthly_cost': 12.50
+        },
+    ],
+    'reserved_instance_opportunities': [],
+    'savings_plans': [],
+    'total_potential_savings': 216.10
+}
 
 def generate_demo_optimization_recommendations() -> Dict:
     """Generate demo optimization recommendations"""
-    return {
-        'ec2_rightsizing': [
-            {
-                'instance_id': 'i-0123456789abcdef0',
-                'current_type': 'm5.xlarge',
-                'recommended_type': 'm5.large',
-                'reason': 'CPU utilization consistently below 20%',
-                'estimated_savings': 70.00
-            },
-            {
-                'instance_id': 'i-0123456789abcdef1',
-                'current_type': 'c5.2xlarge',
-                'recommended_type': 'c5.xlarge',
-                'reason': 'Memory utilization below 30%',
-                'estimated_savings': 125.00
-            },
-        ],
-        'unused_resources': [
-            {
-                'resource_type': 'EBS Volume',
-                'resource_id': 'vol-0123456789abcdef2',
-                'reason': 'Unattached for 45+ days',
-                'monthly_cost': 5.00
-            },
-            {
-                'resource_type': 'Elastic IP',
-                'resource_id': '54.123.45.67',
-                'reason': 'Not associated with instance',
-                'monthly_cost': 3.60
-            },
-            {
-                'resource_type': 'EBS Snapshot',
-                'resource_id': 'snap-0123456789abcdef',
-                'reason': 'Older than 180 days',
-                'monthly_cost': 12.50
-            },
-        ],
-        'reserved_instance_opportunities': [],
-        'savings_plans': [],
-        'total_potential_savings': 216.10
-    }
+    return _DEMO_OPTIMIZATION_RECOMMENDATIONS
+
+_DEMO_TRUSTED_ADVISOR = {
+    'cost_optimization': [
+        {
+            'name': 'Low Utilization Amazon EC2 Instances',
+            'description': 'Identifies EC2 instances with low utilization',
+            'status': 'warning',
+            'flagged_resources': 3
+        },
+        {
+            'name': 'Idle Load Balancers',
+            'description': 'Identifies load balancers with no traffic',
+            'status': 'error',
+            'flagged_resources': 1
+        },
+        {
+            'name': 'Unassociated Elastic IP Addresses',
+            'description': 'Identifies elastic IPs not associated with instances',
+            'status': 'warning',
+            'flagged_resources': 2
+        },
+    ],
+    'security': [
+        {
+            'name': 'Security Groups - Unrestricted Access',
+            'description': 'Checks for security groups that allow unrestricted access',
+            'status': 'error',
+            'flagged_resources': 5
+        },
+    ],
+    'performance': [
+        {
+            'name': 'High Utilization Amazon EC2 Instances',
+            'description': 'Identifies instances with high utilization',
+            'status': 'ok',
+            'flagged_resources': 0
+        },
+    ],
+    'fault_tolerance': [
+        {
+            'name': 'Amazon RDS Backups',
+            'description': 'Checks for RDS instances without automatic backups',
+            'status': 'ok',
+            'flagged_resources': 0
+        },
+    ],
+    'service_limits': [
+        {
+            'name': 'EC2 Service Limits',
+            'description': 'Monitors EC2 service limits',
+            'status': 'ok',
+            'flagged_resources': 0
+        },
+    ]
+}
 
 def generate_demo_trusted_advisor() -> Dict:
     """Generate demo Trusted Advisor recommendations"""
-    return {
-        'cost_optimization': [
-            {
-                'name': 'Low Utilization Amazon EC2 Instances',
-                'description': 'Identifies EC2 instances with low utilization',
-                'status': 'warning',
-                'flagged_resources': 3
-            },
-            {
-                'name': 'Idle Load Balancers',
-                'description': 'Identifies load balancers with no traffic',
-                'status': 'error',
-                'flagged_resources': 1
-            },
-            {
-                'name': 'Unassociated Elastic IP Addresses',
-                'description': 'Identifies elastic IPs not associated with instances',
-                'status': 'warning',
-                'flagged_resources': 2
-            },
-        ],
-        'security': [
-            {
-                'name': 'Security Groups - Unrestricted Access',
-                'description': 'Checks for security groups that allow unrestricted access',
-                'status': 'error',
-                'flagged_resources': 5
-            },
-        ],
-        'performance': [
-            {
-                'name': 'High Utilization Amazon EC2 Instances',
-                'description': 'Identifies instances with high utilization',
-                'status': 'ok',
-                'flagged_resources': 0
-            },
-        ],
-        'fault_tolerance': [
-            {
-                'name': 'Amazon RDS Backups',
-                'description': 'Checks for RDS instances without automatic backups',
-                'status': 'ok',
-                'flagged_resources': 0
-            },
-        ],
-        'service_limits': [
-            {
-                'name': 'EC2 Service Limits',
-                'description': 'Monitors EC2 service limits',
-                'status': 'ok',
-                'flagged_resources': 0
-            },
-        ]
-    }
+    return _DEMO_TRUSTED_ADVISOR
 
 # ============================================================================
 # RENDER FUNCTIONS - UI COMPONENTS
 # ============================================================================
 
+def _flatten_ce(cost_data: Dict, missing_key: str) -> pd.DataFrame:
+    """Flatten Cost Explorer ResultsByTime groups into date/group/cost rows"""
+    return pd.DataFrame.from_records(
+        [
+            (
+                result['TimePeriod']['Start'],
+                group['Keys'][0] if group.get('Keys') else missing_key,
+                float(group['Metrics']['UnblendedCost']['Amount'])
+            )
+            for result in cost_data.get('ResultsByTime', [])
+            for group in result.get('Groups', [])
+        ],
+        columns=['date', 'group', 'cost']
+    )
+
+def _sum_by_group(df: pd.DataFrame) -> pd.Series:
+    """Total cost per group, largest first (ties keep first-seen order)"""
+    return df.groupby('group', sort=False)['cost'].sum().sort_values(ascending=False, kind='stable')
+
+def _fmt_usd(values: pd.Series) -> pd.Series:
+    """Format a numeric cost column as $1,234.56 strings"""
+    return values.map('${:,.2f}'.format)
+
+# Styles travel with each row so the single markdown delta is self-contained
+_METRIC_ROW_CSS = (
+    "<style>"
+    ".metric-row{display:flex;gap:1rem;margin:0.5rem 0;}"
+    ".metric-row .metric{flex:1;min-width:0;}"
+    ".metric-row .label{font-size:0.875rem;opacity:0.7;}"
+    ".metric-row .value{font-size:2rem;line-height:1.3;}"
+    ".metric-row .delta{font-size:0.875rem;color:#09AB3B;min-height:1.2em;}"
+    ".metric-row .delta.negative{color:#FF2B2B;}"
+    "</style>"
+)
+
+def _metric_row(pairs: List[Tuple[str, str, Optional[str]]]) -> None:
+    """Render a row of label/value/delta metrics as a single markdown element"""
+    html = "".join(
+        f"<div class='metric'><div class='label'>{label}</div>"
+        f"<div class='value'>{value}</div>"
+        f"<div class='delta{' negative' if delta and delta.startswith('-') else ''}'>{delta or ''}</div></div>"
+        for label, value, delta in pairs
+    )
+    st.markdown(f"{_METRIC_ROW_CSS}<div class='metric-row'>{html}</div>", unsafe_allow_html=True)
+
+_TREND_MAX_POINTS = 500
+
+def _lttb_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets downsampling: indices of the points to keep"""
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    # Points are evenly spaced, so position stands in for x
+    x = np.arange(n, dtype=np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    keep = [0]
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_lo, next_hi = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x, avg_y = x[next_lo:next_hi].mean(), y[next_lo:next_hi].mean()
+        # Keep the point forming the largest triangle with the last kept point and the next bucket's mean
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        keep.append(a)
+    keep.append(n - 1)
+    return np.asarray(keep)
+
+@lru_cache(maxsize=None)
+def _get_px():
+    """Import plotly.express on first chart render rather than at module load"""
+    import plotly.express as px
+    return px
+
+# Plotly figures are cached by the content hash of their input frame, so reruns
+# with unchanged data skip px construction and trace validation. cache_resource
+# hands back the same Figure (cache_data would re-validate it when unpickling);
+# st.plotly_chart only serializes it, never mutates it.
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _cost_trend_figure(df: pd.DataFrame) -> go.Figure:
+    """Spend trend line chart"""
+    px = _get_px()
+    fig = px.line(
+        df,
+        x='Date',
+        y='Cost',
+        title='Cost Trend Over Time',
+        labels={'Cost': 'Cost (USD)', 'Date': 'Date'},
+        render_mode='webgl'
+    )
+    fig.update_traces(line_color='#FF9900', line_width=3)
+    fig.update_layout(
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        font=dict(size=12),
+        uirevision='static'
+    )
+    return fig
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _service_pie_figure(df: pd.DataFrame) -> go.Figure:
+    """Cost share by service pie chart"""
+    px = _get_px()
+    fig = px.pie(
+        df,
+        values='Cost',
+        names='Service',
+        title='Cost Distribution by Service',
+        color_discrete_sequence=px.colors.sequential.Oranges_r
+    )
+    fig.update_layout(uirevision='static')
+    return fig
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _portfolio_bar_figure(df: pd.DataFrame) -> go.Figure:
+    """Cost by portfolio bar chart"""
+    px = _get_px()
+    fig = px.bar(
+        df,
+        x='Portfolio',
+        y='Cost',
+        title='Cost by Portfolio',
+        color='Cost',
+        color_continuous_scale='Oranges'
+    )
+    fig.update_layout(showlegend=False, uirevision='static')
+    return fig
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _portfolio_pie_figure(df: pd.DataFrame) -> go.Figure:
+    """Cost share by portfolio pie chart"""
+    px = _get_px()
+    fig = px.pie(
+        df,
+        values='Cost',
+        names='Portfolio',
+        title='Cost Distribution',
+        color_discrete_sequence=px.colors.sequential.Oranges_r
+    )
+    fig.update_layout(uirevision='static')
+    return fig
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _tag_coverage_figure(df: pd.DataFrame) -> go.Figure:
+    """Tag coverage by key bar chart"""
+    px = _get_px()
+    fig = px.bar(
+        df,
+        x='Tag',
+        y='Resources',
+        title='Tag Coverage by Key',
+        color='Resources',
+        color_continuous_scale='Oranges',
+        text='Coverage'
+    )
+    fig.update_traces(textposition='outside')
+    fig.update_layout(uirevision='static')
+    return fig
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _resource_pie_figure(df: pd.DataFrame) -> go.Figure:
+    """Resource count by service pie chart"""
+    px = _get_px()
+    fig = px.pie(
+        df,
+        values='Count',
+        names='Service',
+        title='Resource Distribution',
+        color_discrete_sequence=px.colors.sequential.Oranges_r
+    )
+    fig.update_layout(uirevision='static')
+    return fig
+
+def _prefetch_finops_data(demo: bool) -> None:
+    """Warm every tab's fetch cache concurrently with the tabs' default queries"""
+    if demo:
+        return
+    
+    ce_client = st.session_state.get('aws_clients', {}).get('ce')
+    session = st.session_state.get('boto3_session')
+    end_date = datetime.now().strftime('%Y-%m-%d')
+    start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+    
+    # Call the cached helpers directly: the tabs call the same helpers with the
+    # same keys, so they hit the cache and report any errors in their own place.
+    jobs = []
+    if ce_client:
+        client_key = _client_cache_key(ce_client)
+        jobs += [
+            (_fetch_cost_data_live, (ce_client, client_key, start_date, end_date, 'DAILY')),
+            (_fetch_cost_anomalies_live, (ce_client, client_key, start_date, end_date)),
+            (_fetch_cost_by_portfolio_live, (ce_client, client_key, start_date, end_date, 'Portfolio')),
+        ]
+    if session:
+        # Workers get clients built here, never the (non-thread-safe) session
+        session_key = _session_cache_key(session)
+        inventory_clients = _inventory_clients(session, session_key)
+        optimizer = _session_client(session, session_key, 'compute-optimizer')
+        support = _session_client(session, session_key, 'support', _SUPPORT_REGION)
+        tagging = _session_client(session, session_key, 'resourcegroupstaggingapi')
+        jobs += [
+            (_fetch_optimization_recommendations_live, (optimizer, inventory_clients['ec2'], session_key)),
+            (_fetch_trusted_advisor_live, (support, session_key, _TA_DEFAULT_WORKERS)),
+            (_fetch_resource_inventory_live, (inventory_clients, session_key)),
+            (_fetch_tag_compliance_live, (tagging, session_key)),
+        ]
+    if not jobs:
+        return
+    
+    with script_run_executor(max_workers=len(jobs)) as executor:
+        futures = {executor.submit(fetch, *args): fetch.__name__ for fetch, args in jobs}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                # The owning tab refetches (errors are not cached) and reports it to the user
+                logger.warning("FinOps prefetch %s failed: %s", futures[future], e)
+
+# Low-cardinality inventory columns stored as categoricals
+_INVENTORY_CATEGORY_COLUMNS = (
+    'InstanceType', 'State', 'Platform', 'DBInstanceClass', 'Engine',
+    'DBInstanceStatus', 'Runtime', 'VolumeType'
+)
+
+def _inventory_frame(resources: List[Dict]) -> pd.DataFrame:
+    """Inventory rows as a DataFrame with categorical labels and Arrow-backed columns"""
+    df = pd.DataFrame.from_records(resources)
+    categorical = [col for col in _INVENTORY_CATEGORY_COLUMNS if col in df.columns]
+    if categorical:
+        df = df.astype({col: 'category' for col in categorical})
+    
+    # Arrow-backed ids/sizes/dates serialize to st.dataframe without an object->Arrow pass.
+    # The cost column stays numpy: it can mix numbers with 'N/A', and Arrow keeps
+    # coerced NaNs as values, which would poison the vectorized total.
+    arrow_cols = [col for col in df.columns if col not in categorical and col != 'EstimatedMonthlyCost']
+    if arrow_cols:
+        df[arrow_cols] = df[arrow_cols].convert_dtypes(dtype_backend='pyarrow')
+    return df
+
+# Static page banners, built once at import instead of on every rerun
+_FINOPS_BANNER_HTML = """
+<div style='background: linear-gradient(135deg, #232F3E 0%, #37475A 100%); 
+            padding: 1.5rem; 
+            border-radius: 10px; 
+            margin-bottom: 1rem;
+            border-top: 4px solid #FF9900;'>
+    <h2 style='color: white; margin: 0;'>💰 FinOps Cost Management</h2>
+    <p style='color: #E8F4F8; margin: 0.5rem 0 0 0;'>
+        Comprehensive cost optimization, analytics, and resource management
+    </p>
+</div>
+"""
+
+_SAVINGS_BANNER = string.Template("""
+<div class='score-card excellent'>
+    <h3>💰 Total Potential Monthly Savings</h3>
+    <h1 style='color: #4CAF50; margin: 1rem 0;'>
+        $$${savings}
+    </h1>
+    <p>Based on identified optimization opportunities</p>
+</div>
+""")
+
+_INVENTORY_COST_BANNER = string.Template("""
+<div class='score-card excellent'>
+    <h3>💰 Total Estimated Monthly Cost</h3>
+    <h1 style='color: #FF9900; margin: 1rem 0;'>$$${cost}</h1>
+    <p>Based on current resource inventory and usage patterns</p>
+</div>
+""")
+
+_TAG_BANNER = string.Template("""
+<div style='background: linear-gradient(135deg, ${color} 0%, ${color}CC 100%); 
+            padding: 2rem; 
+            border-radius: 10px; 
+            text-align: center; 
+            margin-bottom: 2rem;'>
+    <h2 style='color: white; margin: 0;'>Tag Compliance Score</h2>
+    <h1 style='color: white; font-size: 4rem; margin: 1rem 0;'>${rate}%</h1>
+    <p style='color: white; margin: 0;'>${compliant} out of ${total} resources are fully compliant</p>
+</div>
+""")
+
 def render_finops_dashboard():
     """Main FinOps dashboard with all features"""
     
-    st.markdown("""
-    <div style='background: linear-gradient(135deg, #232F3E 0%, #37475A 100%); 
-                padding: 1.5rem; 
-                border-radius: 10px; 
-                margin-bottom: 1rem;
-                border-top: 4px solid #FF9900;'>
-        <h2 style='color: white; margin: 0;'>💰 FinOps Cost Management</h2>
-        <p style='color: #E8F4F8; margin: 0.5rem 0 0 0;'>
-            Comprehensive cost optimization, analytics, and resource management
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    # Tabs render sequentially; fetch their data in parallel up front
+    _prefetch_finops_data(st.session_state.get('demo_mode', False))
+    
+    st.markdown(_FINOPS_BANNER_HTML, unsafe_allow_html=True)
     
     # Create tabs for different FinOps features
     finops_tabs = st.tabs([
@@ -988,6 +1575,7 @@ def render_finops_dashboard():
 def render_spend_analytics():
     """Render spend analytics dashboard"""
     st.markdown("### 📊 AWS Spend Analytics")
+    demo = st.session_state.get('demo_mode', False)
     
     # Diagnostic section - Add expander for troubleshooting
     with st.expander("🔍 Troubleshooting & Diagnostics", expanded=False):
@@ -996,7 +1584,6 @@ def render_spend_analytics():
         # Check session state
         has_session = st.session_state.get('boto3_session') is not None
         has_ce_client = st.session_state.get('aws_clients', {}).get('ce') is not None
-        demo_mode = st.session_state.get('demo_mode', False)
         
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -1004,7 +1591,7 @@ def render_spend_analytics():
         with col2:
             st.metric("Cost Explorer Client", "✅ Available" if has_ce_client else "❌ Missing")
         with col3:
-            st.metric("Mode", "🎭 Demo" if demo_mode else "🔴 Live")
+            st.metric("Mode", "🎭 Demo" if demo else "🔴 Live")
         
         if not has_ce_client:
             st.error("**Cost Explorer client is not initialized.** This could mean:\n"
@@ -1041,7 +1628,7 @@ def render_spend_analytics():
     start_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
     
     ce_client = st.session_state.get('aws_clients', {}).get('ce')
-    cost_data = fetch_cost_data(ce_client, start_date, end_date, granularity)
+    cost_data = fetch_cost_data(ce_client, start_date, end_date, granularity, demo=demo)
     
     # Summary metrics
     total_cost = 0
@@ -1049,29 +1636,28 @@ def render_spend_analytics():
         for result in cost_data['ResultsByTime']:
             total_cost += float(result['Total'].get('UnblendedCost', {}).get('Amount', 0))
     
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("Total Spend", f"${total_cost:,.2f}")
-    with col2:
-        avg_daily = total_cost / max(days_back, 1)
-        st.metric("Avg Daily", f"${avg_daily:,.2f}")
-    with col3:
-        forecast_monthly = avg_daily * 30
-        st.metric("Monthly Forecast", f"${forecast_monthly:,.2f}")
-    with col4:
-        # Calculate trend
-        if cost_data and 'ResultsByTime' in cost_data and len(cost_data['ResultsByTime']) > 1:
-            first_day = float(cost_data['ResultsByTime'][0]['Total'].get('UnblendedCost', {}).get('Amount', 0))
-            last_day = float(cost_data['ResultsByTime'][-1]['Total'].get('UnblendedCost', {}).get('Amount', 0))
-            trend = ((last_day - first_day) / max(first_day, 1)) * 100
-            st.metric("Trend", f"{trend:+.1f}%", delta=f"{trend:+.1f}%")
-        else:
-            st.metric("Trend", "N/A")
+    avg_daily = total_cost / max(days_back, 1)
+    forecast_monthly = avg_daily * 30
+    # Calculate trend
+    if cost_data and 'ResultsByTime' in cost_data and len(cost_data['ResultsByTime']) > 1:
+        first_day = float(cost_data['ResultsByTime'][0]['Total'].get('UnblendedCost', {}).get('Amount', 0))
+        last_day = float(cost_data['ResultsByTime'][-1]['Total'].get('UnblendedCost', {}).get('Amount', 0))
+        trend = ((last_day - first_day) / max(first_day, 1)) * 100
+        trend_metric = ("Trend", f"{trend:+.1f}%", f"{trend:+.1f}%")
+    else:
+        trend_metric = ("Trend", "N/A", None)
+    
+    _metric_row([
+        ("Total Spend", f"${total_cost:,.2f}", None),
+        ("Avg Daily", f"${avg_daily:,.2f}", None),
+        ("Monthly Forecast", f"${forecast_monthly:,.2f}", None),
+        trend_metric,
+    ])
     
     # Debug: Show raw API response
     with st.expander("🔍 View Raw API Response (Debug)", expanded=False):
         if cost_data:
-            st.json(cost_data)
+            st.json(dumps(cost_data))
             
             # Provide analysis
             st.markdown("#### Response Analysis")
@@ -1099,29 +1685,18 @@ def render_spend_analytics():
     
     # Cost trend chart
     if cost_data and 'ResultsByTime' in cost_data:
-        dates = []
-        costs = []
-        
-        for result in cost_data['ResultsByTime']:
-            dates.append(result['TimePeriod']['Start'])
-            costs.append(float(result['Total'].get('UnblendedCost', {}).get('Amount', 0)))
-        
-        df_trend = pd.DataFrame({'Date': dates, 'Cost': costs})
-        
-        fig_trend = px.line(
-            df_trend,
-            x='Date',
-            y='Cost',
-            title='Cost Trend Over Time',
-            labels={'Cost': 'Cost (USD)', 'Date': 'Date'}
-        )
-        fig_trend.update_traces(line_color='#FF9900', line_width=3)
-        fig_trend.update_layout(
-            plot_bgcolor='white',
-            paper_bgcolor='white',
-            font=dict(size=12)
+        df_trend = pd.DataFrame.from_records(
+            [
+                (result['TimePeriod']['Start'], float(result['Total'].get('UnblendedCost', {}).get('Amount', 0)))
+                for result in cost_data['ResultsByTime']
+            ],
+            columns=['Date', 'Cost']
         )
-        st.plotly_chart(fig_trend, use_container_width=True)
+        # Long windows: send at most _TREND_MAX_POINTS shape-preserving points to the browser
+        if len(df_trend) > _TREND_MAX_POINTS:
+            df_trend = df_trend.iloc[_lttb_indices(df_trend['Cost'].to_numpy(), _TREND_MAX_POINTS)]
+        
+        st.plotly_chart(_cost_trend_figure(df_trend), use_container_width=True)
     
     st.markdown("---")
     
@@ -1131,56 +1706,54 @@ def render_spend_analytics():
     
     if cost_data and 'ResultsByTime' in cost_data:
         # Aggregate costs by service
-        service_costs = {}
-        for result in cost_data['ResultsByTime']:
-            for group in result.get('Groups', []):
-                service = group['Keys'][0] if group.get('Keys') else 'Other'
-                cost = float(group['Metrics']['UnblendedCost']['Amount'])
-                service_costs[service] = service_costs.get(service, 0) + cost
+        service_costs = _sum_by_group(_flatten_ce(cost_data, missing_key='Other'))
         
         # Create pie chart
-        if service_costs:
-            df_services = pd.DataFrame([
-                {'Service': k, 'Cost': v}
-                for k, v in sorted(service_costs.items(), key=lambda x: x[1], reverse=True)
-            ])
+        if not service_costs.empty:
+            df_services = service_costs.rename_axis('Service').reset_index(name='Cost')
             
-            fig_pie = px.pie(
-                df_services,
-                values='Cost',
-                names='Service',
-                title='Cost Distribution by Service',
-                color_discrete_sequence=px.colors.sequential.Oranges_r
-            )
-            st.plotly_chart(fig_pie, use_container_width=True)
+            st.plotly_chart(_service_pie_figure(df_services), use_container_width=True)
             
             # Service table - Calculate percentage BEFORE formatting
             # Use sum of service_costs instead of total_cost for accurate percentage
-            service_total = sum(service_costs.values())
-            df_services['Percentage'] = df_services['Cost'].apply(
-                lambda x: f"{(x / service_total * 100):.1f}%" if service_total > 0 else "0.0%"
-            )
-            df_services['Cost'] = df_services['Cost'].apply(lambda x: f"${x:,.2f}")
+            service_total = service_costs.sum()
+            if service_total > 0:
+                df_services['Percentage'] = (df_services['Cost'] / service_total * 100).map('{:.1f}%'.format)
+            else:
+                df_services['Percentage'] = "0.0%"
+            df_services['Cost'] = _fmt_usd(df_services['Cost'])
             
             st.dataframe(df_services, use_container_width=True, hide_index=True)
 
+def _rightsizing_card_html(rec: Dict) -> str:
+    """HTML card for one EC2 rightsizing recommendation"""
+    return f"""
+            <div class='metric-card'>
+                <strong>Instance:</strong> {rec['instance_id']}<br>
+                <strong>Current:</strong> {rec['current_type']} → <strong>Recommended:</strong> {rec['recommended_type']}<br>
+                <strong>Reason:</strong> {rec['reason']}<br>
+                <strong>Monthly Savings:</strong> <span style='color: #4CAF50; font-weight: bold;'>
+                    ${rec['estimated_savings']:.2f}
+                </span>
+            </div>
+            """
+
 def render_cost_optimization():
     """Render cost optimization recommendations"""
     st.markdown("### 💡 Cost Optimization Recommendations")
     
+    if st.button("🔄 Refresh Recommendations", key="refresh_optimization"):
+        _fetch_optimization_recommendations_live.clear()
+    
     session = st.session_state.get('boto3_session')
-    recommendations = fetch_cost_optimization_recommendations(session)
+    demo = st.session_state.get('demo_mode', False)
+    recommendations = fetch_cost_optimization_recommendations(session, demo=demo)
     
     # Summary card
-    st.markdown(f"""
-    <div class='score-card excellent'>
-        <h3>💰 Total Potential Monthly Savings</h3>
-        <h1 style='color: #4CAF50; margin: 1rem 0;'>
-            ${recommendations['total_potential_savings']:,.2f}
-        </h1>
-        <p>Based on identified optimization opportunities</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(
+        _SAVINGS_BANNER.substitute(savings=f"{recommendations['total_potential_savings']:,.2f}"),
+        unsafe_allow_html=True
+    )
     
     st.markdown("---")
     
@@ -1188,17 +1761,11 @@ def render_cost_optimization():
     st.markdown("#### 🖥️ EC2 Rightsizing Opportunities")
     
     if recommendations['ec2_rightsizing']:
-        for rec in recommendations['ec2_rightsizing']:
-            st.markdown(f"""
-            <div class='metric-card'>
-                <strong>Instance:</strong> {rec['instance_id']}<br>
-                <strong>Current:</strong> {rec['current_type']} → <strong>Recommended:</strong> {rec['recommended_type']}<br>
-                <strong>Reason:</strong> {rec['reason']}<br>
-                <strong>Monthly Savings:</strong> <span style='color: #4CAF50; font-weight: bold;'>
-                    ${rec['estimated_savings']:.2f}
-                </span>
-            </div>
-            """, unsafe_allow_html=True)
+        # One markdown delta for all cards instead of one per recommendation
+        st.markdown(
+            "".join(_rightsizing_card_html(rec) for rec in recommendations['ec2_rightsizing']),
+            unsafe_allow_html=True
+        )
     else:
         st.success("✅ All EC2 instances are optimally sized!")
     
@@ -1209,7 +1776,7 @@ def render_cost_optimization():
     
     if recommendations['unused_resources']:
         df_unused = pd.DataFrame(recommendations['unused_resources'])
-        df_unused['monthly_cost'] = df_unused['monthly_cost'].apply(lambda x: f"${x:.2f}")
+        df_unused['monthly_cost'] = _fmt_usd(df_unused['monthly_cost'])
         st.dataframe(df_unused, use_container_width=True, hide_index=True)
         
         if st.button("🗑️ Generate Cleanup Script", type="primary"):
@@ -1218,34 +1785,76 @@ def render_cost_optimization():
     else:
         st.success("✅ No unused resources detected!")
 
+# Trusted Advisor status -> display color / icon, and the statuses counted as issues
+_CHECK_STATUS_COLORS = {
+    'ok': '#4CAF50',
+    'warning': '#FF9900',
+    'error': '#F44336',
+    'unknown': '#9E9E9E'
+}
+_CHECK_STATUS_ICONS = {
+    'ok': '✅',
+    'warning': '⚠️',
+    'error': '❌',
+    'unknown': '❓'
+}
+_ISSUE_STATUSES = frozenset({'error', 'warning'})
+
+def _advisor_check_html(check: Dict) -> str:
+    """HTML row for one Trusted Advisor check"""
+    status_color = _CHECK_STATUS_COLORS.get(check['status'], '#9E9E9E')
+    status_icon = _CHECK_STATUS_ICONS.get(check['status'], '❓')
+    
+    flagged = check.get('flagged_resources', 0)
+    if isinstance(flagged, list):
+        flagged = len(flagged)
+    
+    return f"""
+                <div style='background: white; 
+                            padding: 1rem; 
+                            border-radius: 5px; 
+                            margin: 0.5rem 0;
+                            border-left: 5px solid {status_color};'>
+                    <strong>{status_icon} {check['name']}</strong><br>
+                    {check['description']}<br>
+                    <span style='color: {status_color}; font-weight: bold;'>
+                        Flagged Resources: {flagged}
+                    </span>
+                </div>
+                """
+
 def render_best_practices():
     """Render AWS best practices and Trusted Advisor checks"""
     st.markdown("### ✅ AWS Best Practices Advisor")
     
+    if st.button("🔄 Refresh Checks", key="refresh_trusted_advisor"):
+        _fetch_trusted_advisor_live.clear()
+    
     session = st.session_state.get('boto3_session')
-    advisor_data = fetch_trusted_advisor_checks(session)
+    demo = st.session_state.get('demo_mode', False)
+    advisor_data = fetch_trusted_advisor_checks(session, demo=demo)
     
     # Summary metrics
     col1, col2, col3, col4, col5 = st.columns(5)
     
     with col1:
-        cost_issues = len([c for c in advisor_data['cost_optimization'] if c['status'] in ['error', 'warning']])
+        cost_issues = sum(1 for c in advisor_data['cost_optimization'] if c['status'] in _ISSUE_STATUSES)
         st.metric("Cost Issues", cost_issues)
     
     with col2:
-        security_issues = len([c for c in advisor_data['security'] if c['status'] in ['error', 'warning']])
+        security_issues = sum(1 for c in advisor_data['security'] if c['status'] in _ISSUE_STATUSES)
         st.metric("Security Issues", security_issues)
     
     with col3:
-        perf_issues = len([c for c in advisor_data['performance'] if c['status'] in ['error', 'warning']])
+        perf_issues = sum(1 for c in advisor_data['performance'] if c['status'] in _ISSUE_STATUSES)
         st.metric("Performance", perf_issues)
     
     with col4:
-        ft_issues = len([c for c in advisor_data['fault_tolerance'] if c['status'] in ['error', 'warning']])
+        ft_issues = sum(1 for c in advisor_data['fault_tolerance'] if c['status'] in _ISSUE_STATUSES)
         st.metric("Fault Tolerance", ft_issues)
     
     with col5:
-        limit_issues = len([c for c in advisor_data['service_limits'] if c['status'] in ['error', 'warning']])
+        limit_issues = sum(1 for c in advisor_data['service_limits'] if c['status'] in _ISSUE_STATUSES)
         st.metric("Service Limits", limit_issues)
     
     st.markdown("---")
@@ -1263,76 +1872,21 @@ def render_best_practices():
         if checks:
             st.markdown(f"#### {category_name}")
             
-            for check in checks:
-                status_color = {
-                    'ok': '#4CAF50',
-                    'warning': '#FF9900',
-                    'error': '#F44336',
-                    'unknown': '#9E9E9E'
-                }.get(check['status'], '#9E9E9E')
-                
-                status_icon = {
-                    'ok': '✅',
-                    'warning': '⚠️',
-                    'error': '❌',
-                    'unknown': '❓'
-                }.get(check['status'], '❓')
-                
-                flagged = check.get('flagged_resources', 0)
-                if isinstance(flagged, list):
-                    flagged = len(flagged)
-                
-                st.markdown(f"""
-                <div style='background: white; 
-                            padding: 1rem; 
-                            border-radius: 5px; 
-                            margin: 0.5rem 0;
-                            border-left: 5px solid {status_color};'>
-                    <strong>{status_icon} {check['name']}</strong><br>
-                    {check['description']}<br>
-                    <span style='color: {status_color}; font-weight: bold;'>
-                        Flagged Resources: {flagged}
-                    </span>
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown("".join(_advisor_check_html(check) for check in checks), unsafe_allow_html=True)
 
-def render_anomaly_detection():
-    """Render cost anomaly detection"""
-    st.markdown("### 🚨 Cost Anomaly Detection")
-    
-    # Fetch anomalies
-    ce_client = st.session_state.get('aws_clients', {}).get('ce')
-    end_date = datetime.now().strftime('%Y-%m-%d')
-    start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-    
-    anomalies = fetch_cost_anomalies(ce_client, start_date, end_date)
-    
-    # Summary metrics
-    total_impact = sum(a.get('Impact', {}).get('TotalImpact', 0) for a in anomalies)
-    high_severity = len([a for a in anomalies if a.get('AnomalyScore', {}).get('CurrentScore', 0) > 0.75])
-    
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Total Anomalies", len(anomalies))
-    with col2:
-        st.metric("High Severity", high_severity)
-    with col3:
-        st.metric("Total Impact", f"${total_impact:,.2f}")
+# Scores above 0.5 are MEDIUM and above 0.75 HIGH (bisect_left keeps the bounds exclusive)
+_ANOMALY_SEVERITY_THRESHOLDS = (0.5, 0.75)
+_ANOMALY_SEVERITIES = (('#FFC107', 'LOW'), ('#FF9900', 'MEDIUM'), ('#F44336', 'HIGH'))
+
+def _anomaly_card_html(anomaly: Dict) -> str:
+    """HTML card for one cost anomaly"""
+    score = anomaly.get('AnomalyScore', {}).get('CurrentScore', 0)
+    impact = anomaly.get('Impact', {}).get('TotalImpact', 0)
+    dimension = anomaly.get('DimensionValue', 'Unknown')
     
-    st.markdown("---")
+    severity_color, severity_text = _ANOMALY_SEVERITIES[bisect_left(_ANOMALY_SEVERITY_THRESHOLDS, score)]
     
-    if anomalies:
-        st.markdown("#### 🔍 Detected Anomalies")
-        
-        for anomaly in anomalies:
-            score = anomaly.get('AnomalyScore', {}).get('CurrentScore', 0)
-            impact = anomaly.get('Impact', {}).get('TotalImpact', 0)
-            dimension = anomaly.get('DimensionValue', 'Unknown')
-            
-            severity_color = '#F44336' if score > 0.75 else '#FF9900' if score > 0.5 else '#FFC107'
-            severity_text = 'HIGH' if score > 0.75 else 'MEDIUM' if score > 0.5 else 'LOW'
-            
-            st.markdown(f"""
+    return f"""
             <div style='background: white; 
                         padding: 1.5rem; 
                         border-radius: 8px; 
@@ -1365,7 +1919,36 @@ def render_anomaly_detection():
                     in {anomaly.get('RootCauses', [{}])[0].get('Region', 'Unknown')}
                 </div>
             </div>
-            """, unsafe_allow_html=True)
+            """
+
+def render_anomaly_detection():
+    """Render cost anomaly detection"""
+    st.markdown("### 🚨 Cost Anomaly Detection")
+    demo = st.session_state.get('demo_mode', False)
+    
+    # Fetch anomalies
+    ce_client = st.session_state.get('aws_clients', {}).get('ce')
+    end_date = datetime.now().strftime('%Y-%m-%d')
+    start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+    
+    anomalies = fetch_cost_anomalies(ce_client, start_date, end_date, demo=demo)
+    
+    # Summary metrics
+    total_impact = sum(a.get('Impact', {}).get('TotalImpact', 0) for a in anomalies)
+    high_severity = len([a for a in anomalies if a.get('AnomalyScore', {}).get('CurrentScore', 0) > 0.75])
+    
+    _metric_row([
+        ("Total Anomalies", str(len(anomalies)), None),
+        ("High Severity", str(high_severity), None),
+        ("Total Impact", f"${total_impact:,.2f}", None),
+    ])
+    
+    st.markdown("---")
+    
+    if anomalies:
+        st.markdown("#### 🔍 Detected Anomalies")
+        
+        st.markdown("".join(_anomaly_card_html(anomaly) for anomaly in anomalies), unsafe_allow_html=True)
     else:
         st.success("✅ No cost anomalies detected in the last 30 days!")
     
@@ -1373,8 +1956,9 @@ def render_anomaly_detection():
     st.markdown("---")
     st.markdown("#### 📈 Spending Pattern Analysis")
     
-    ce_client = st.session_state.get('aws_clients', {}).get('ce')
-    cost_data = fetch_cost_data(ce_client, start_date, end_date, 'DAILY')
+    # Same 30-day DAILY query as the Spend Analytics default and the dashboard
+    # prefetch, so this is served from the Cost Explorer cache
+    cost_data = fetch_cost_data(ce_client, start_date, end_date, 'DAILY', demo=demo)
     patterns = detect_spending_patterns(cost_data)
     
     col1, col2 = st.columns(2)
@@ -1388,77 +1972,59 @@ def render_anomaly_detection():
 def render_chargeback_allocation():
     """Render chargeback and cost allocation by portfolio"""
     st.markdown("### 💳 Chargeback & Cost Allocation")
+    demo = st.session_state.get('demo_mode', False)
     
     # Fetch portfolio costs
     ce_client = st.session_state.get('aws_clients', {}).get('ce')
     end_date = datetime.now().strftime('%Y-%m-%d')
     start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
     
-    portfolio_costs = fetch_cost_by_portfolio(ce_client, start_date, end_date)
+    portfolio_costs = fetch_cost_by_portfolio(ce_client, start_date, end_date, demo=demo)
     
     # Extract portfolio data
     if portfolio_costs and 'ResultsByTime' in portfolio_costs:
-        portfolios = {}
-        for result in portfolio_costs['ResultsByTime']:
-            for group in result.get('Groups', []):
-                portfolio = group['Keys'][0] if group.get('Keys') else 'Untagged'
-                cost = float(group['Metrics']['UnblendedCost']['Amount'])
-                portfolios[portfolio] = portfolios.get(portfolio, 0) + cost
+        portfolios = _sum_by_group(_flatten_ce(portfolio_costs, missing_key='Untagged'))
         
-        total = sum(portfolios.values())
+        total = portfolios.sum()
         
         # Summary cards
         st.markdown("#### 📊 Monthly Cost Allocation by Portfolio")
         
-        cols = st.columns(len(portfolios) if portfolios else 3)
-        for idx, (portfolio, cost) in enumerate(sorted(portfolios.items(), key=lambda x: x[1], reverse=True)):
-            with cols[idx % len(cols)]:
-                percentage = (cost / total * 100) if total > 0 else 0
-                st.markdown(f"""
-                <div class='metric-card'>
-                    <h3 style='color: #FF9900; margin: 0;'>{portfolio}</h3>
-                    <h2 style='color: white; margin: 0.5rem 0;'>${cost:,.2f}</h2>
-                    <p style='color: #E8F4F8; margin: 0;'>{percentage:.1f}% of total</p>
-                </div>
-                """, unsafe_allow_html=True)
+        # One grid row of cards in a single markdown delta (one column per portfolio).
+        # No blank lines between cards, or markdown would end the HTML block early.
+        cards = "".join(
+            f"<div class='metric-card'>"
+            f"<h3 style='color: #FF9900; margin: 0;'>{portfolio}</h3>"
+            f"<h2 style='color: white; margin: 0.5rem 0;'>${cost:,.2f}</h2>"
+            f"<p style='color: #E8F4F8; margin: 0;'>{(cost / total * 100) if total > 0 else 0:.1f}% of total</p>"
+            f"</div>"
+            for portfolio, cost in portfolios.items()
+        )
+        st.markdown(
+            f"<div style='display: grid; grid-template-columns: repeat({max(len(portfolios), 1)}, 1fr); "
+            f"gap: 1rem;'>{cards}</div>",
+            unsafe_allow_html=True
+        )
         
         st.markdown("---")
         
         # Visualization
-        df_portfolios = pd.DataFrame([
-            {'Portfolio': k, 'Cost': v, 'Percentage': f"{(v/total*100):.1f}%"}
-            for k, v in sorted(portfolios.items(), key=lambda x: x[1], reverse=True)
-        ])
+        df_portfolios = portfolios.rename_axis('Portfolio').reset_index(name='Cost')
+        df_portfolios['Percentage'] = [f"{(v/total*100):.1f}%" for v in df_portfolios['Cost']]
         
         col1, col2 = st.columns(2)
         
         with col1:
-            fig_bar = px.bar(
-                df_portfolios,
-                x='Portfolio',
-                y='Cost',
-                title='Cost by Portfolio',
-                color='Cost',
-                color_continuous_scale='Oranges'
-            )
-            fig_bar.update_layout(showlegend=False)
-            st.plotly_chart(fig_bar, use_container_width=True)
+            st.plotly_chart(_portfolio_bar_figure(df_portfolios), use_container_width=True)
         
         with col2:
-            fig_pie = px.pie(
-                df_portfolios,
-                values='Cost',
-                names='Portfolio',
-                title='Cost Distribution',
-                color_discrete_sequence=px.colors.sequential.Oranges_r
-            )
-            st.plotly_chart(fig_pie, use_container_width=True)
+            st.plotly_chart(_portfolio_pie_figure(df_portfolios), use_container_width=True)
         
         # Detailed allocation table
         st.markdown("---")
         st.markdown("#### 📋 Detailed Cost Allocation")
         
-        df_portfolios['Cost'] = df_portfolios['Cost'].apply(lambda x: f"${x:,.2f}")
+        df_portfolios['Cost'] = _fmt_usd(df_portfolios['Cost'])
         st.dataframe(df_portfolios, use_container_width=True, hide_index=True)
         
         # Export options
@@ -1474,20 +2040,18 @@ def render_chargeback_allocation():
 def render_inventory_dashboard():
     """Render inventory dashboard with cost correlation"""
     st.markdown("### 📦 Resource Inventory with Cost Correlation")
+    demo = st.session_state.get('demo_mode', False)
     
     session = st.session_state.get('boto3_session')
-    inventory = fetch_resource_inventory(session)
-    
-    # Calculate totals
-    total_monthly_cost = 0
-    resource_counts = {}
+    inventory = fetch_resource_inventory(session, demo=demo)
     
-    for service, resources in inventory.items():
-        resource_counts[service] = len(resources)
-        for resource in resources:
-            cost = resource.get('EstimatedMonthlyCost', 0)
-            if isinstance(cost, (int, float)):
-                total_monthly_cost += cost
+    # Build every tab's frame once; costs that aren't numbers ('N/A', 'Usage-based') don't count
+    dfs = {service: _inventory_frame(resources) for service, resources in inventory.items()}
+    resource_counts = {service: len(df) for service, df in dfs.items()}
+    total_monthly_cost = sum(
+        pd.to_numeric(df['EstimatedMonthlyCost'], errors='coerce').sum()
+        for df in dfs.values() if 'EstimatedMonthlyCost' in df.columns
+    )
     
     # Summary metrics
     col1, col2, col3, col4, col5 = st.columns(5)
@@ -1505,13 +2069,7 @@ def render_inventory_dashboard():
     st.markdown("---")
     
     # Total cost
-    st.markdown(f"""
-    <div class='score-card excellent'>
-        <h3>💰 Total Estimated Monthly Cost</h3>
-        <h1 style='color: #FF9900; margin: 1rem 0;'>${total_monthly_cost:,.2f}</h1>
-        <p>Based on current resource inventory and usage patterns</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_INVENTORY_COST_BANNER.substitute(cost=f"{total_monthly_cost:,.2f}"), unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -1521,13 +2079,11 @@ def render_inventory_dashboard():
     # EC2 Tab
     with resource_tabs[0]:
         st.markdown("#### EC2 Instances")
-        if inventory['ec2']:
-            df_ec2 = pd.DataFrame(inventory['ec2'])
+        if not dfs['ec2'].empty:
+            df_ec2 = dfs['ec2']
             # Format cost column
             if 'EstimatedMonthlyCost' in df_ec2.columns:
-                df_ec2['EstimatedMonthlyCost'] = df_ec2['EstimatedMonthlyCost'].apply(
-                    lambda x: f"${x:.2f}" if isinstance(x, (int, float)) else x
-                )
+                df_ec2['EstimatedMonthlyCost'] = _fmt_usd(df_ec2['EstimatedMonthlyCost'])
             st.dataframe(df_ec2, use_container_width=True, hide_index=True)
         else:
             st.info("No EC2 instances found")
@@ -1535,12 +2091,10 @@ def render_inventory_dashboard():
     # RDS Tab
     with resource_tabs[1]:
         st.markdown("#### RDS Database Instances")
-        if inventory['rds']:
-            df_rds = pd.DataFrame(inventory['rds'])
+        if not dfs['rds'].empty:
+            df_rds = dfs['rds']
             if 'EstimatedMonthlyCost' in df_rds.columns:
-                df_rds['EstimatedMonthlyCost'] = df_rds['EstimatedMonthlyCost'].apply(
-                    lambda x: f"${x:.2f}" if isinstance(x, (int, float)) else x
-                )
+                df_rds['EstimatedMonthlyCost'] = _fmt_usd(df_rds['EstimatedMonthlyCost'])
             st.dataframe(df_rds, use_container_width=True, hide_index=True)
         else:
             st.info("No RDS instances found")
@@ -1548,12 +2102,12 @@ def render_inventory_dashboard():
     # S3 Tab
     with resource_tabs[2]:
         st.markdown("#### S3 Buckets")
-        if inventory['s3']:
-            df_s3 = pd.DataFrame(inventory['s3'])
+        if not dfs['s3'].empty:
+            df_s3 = dfs['s3']
             if 'EstimatedMonthlyCost' in df_s3.columns:
-                df_s3['EstimatedMonthlyCost'] = df_s3['EstimatedMonthlyCost'].apply(
-                    lambda x: f"${x:.2f}" if isinstance(x, (int, float)) else x
-                )
+                # Bucket costs may be placeholder strings; format only the numeric ones
+                costs = pd.to_numeric(df_s3['EstimatedMonthlyCost'], errors='coerce')
+                df_s3['EstimatedMonthlyCost'] = _fmt_usd(costs).mask(costs.isna(), df_s3['EstimatedMonthlyCost'])
             st.dataframe(df_s3, use_container_width=True, hide_index=True)
         else:
             st.info("No S3 buckets found")
@@ -1561,8 +2115,8 @@ def render_inventory_dashboard():
     # Lambda Tab
     with resource_tabs[3]:
         st.markdown("#### Lambda Functions")
-        if inventory['lambda']:
-            df_lambda = pd.DataFrame(inventory['lambda'])
+        if not dfs['lambda'].empty:
+            df_lambda = dfs['lambda']
             st.dataframe(df_lambda, use_container_width=True, hide_index=True)
         else:
             st.info("No Lambda functions found")
@@ -1570,22 +2124,25 @@ def render_inventory_dashboard():
     # EBS Tab
     with resource_tabs[4]:
         st.markdown("#### EBS Volumes")
-        if inventory['ebs']:
-            df_ebs = pd.DataFrame(inventory['ebs'])
+        if not dfs['ebs'].empty:
+            df_ebs = dfs['ebs']
             if 'EstimatedMonthlyCost' in df_ebs.columns:
-                df_ebs['EstimatedMonthlyCost'] = df_ebs['EstimatedMonthlyCost'].apply(
-                    lambda x: f"${x:.2f}" if isinstance(x, (int, float)) else x
-                )
+                df_ebs['EstimatedMonthlyCost'] = _fmt_usd(df_ebs['EstimatedMonthlyCost'])
             st.dataframe(df_ebs, use_container_width=True, hide_index=True)
         else:
             st.info("No EBS volumes found")
 
+# Compliance rates from 60% are amber and from 80% green
+_COMPLIANCE_THRESHOLDS = (60, 80)
+_COMPLIANCE_COLORS = ('#F44336', '#FF9900', '#4CAF50')
+
 def render_tag_management():
     """Render tag management and compliance"""
     st.markdown("### 🏷️ Tag Management & Compliance")
+    demo = st.session_state.get('demo_mode', False)
     
     session = st.session_state.get('boto3_session')
-    tag_compliance = fetch_tag_compliance(session)
+    tag_compliance = fetch_tag_compliance(session, demo=demo)
     
     # Compliance overview
     total = tag_compliance['total_resources']
@@ -1593,30 +2150,22 @@ def render_tag_management():
     compliance_rate = (compliant / total * 100) if total > 0 else 0
     
     # Status color
-    status_color = '#4CAF50' if compliance_rate >= 80 else '#FF9900' if compliance_rate >= 60 else '#F44336'
-    
-    st.markdown(f"""
-    <div style='background: linear-gradient(135deg, {status_color} 0%, {status_color}CC 100%); 
-                padding: 2rem; 
-                border-radius: 10px; 
-                text-align: center; 
-                margin-bottom: 2rem;'>
-        <h2 style='color: white; margin: 0;'>Tag Compliance Score</h2>
-        <h1 style='color: white; font-size: 4rem; margin: 1rem 0;'>{compliance_rate:.1f}%</h1>
-        <p style='color: white; margin: 0;'>{compliant} out of {total} resources are fully compliant</p>
-    </div>
-    """, unsafe_allow_html=True)
+    status_color = _COMPLIANCE_COLORS[bisect_right(_COMPLIANCE_THRESHOLDS, compliance_rate)]
+    
+    st.markdown(
+        _TAG_BANNER.substitute(
+            color=status_color, rate=f"{compliance_rate:.1f}", compliant=compliant, total=total
+        ),
+        unsafe_allow_html=True
+    )
     
     # Metrics
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("Total Resources", tag_compliance['total_resources'])
-    with col2:
-        st.metric("Fully Compliant", tag_compliance['compliant_resources'])
-    with col3:
-        st.metric("Partially Tagged", tag_compliance['partially_tagged'])
-    with col4:
-        st.metric("Untagged", tag_compliance['untagged_resources'])
+    _metric_row([
+        ("Total Resources", str(tag_compliance['total_resources']), None),
+        ("Fully Compliant", str(tag_compliance['compliant_resources']), None),
+        ("Partially Tagged", str(tag_compliance['partially_tagged']), None),
+        ("Untagged", str(tag_compliance['untagged_resources']), None),
+    ])
     
     st.markdown("---")
     
@@ -1624,26 +2173,13 @@ def render_tag_management():
     st.markdown("#### 📊 Tag Coverage Analysis")
     
     if tag_compliance['tag_coverage']:
-        df_coverage = pd.DataFrame([
-            {
-                'Tag': tag,
-                'Resources': count,
-                'Coverage': f"{(count / total * 100):.1f}%"
-            }
-            for tag, count in tag_compliance['tag_coverage'].items()
-        ])
-        
-        fig_coverage = px.bar(
-            df_coverage,
-            x='Tag',
-            y='Resources',
-            title='Tag Coverage by Key',
-            color='Resources',
-            color_continuous_scale='Oranges',
-            text='Coverage'
+        df_coverage = pd.DataFrame.from_records(
+            list(tag_compliance['tag_coverage'].items()),
+            columns=['Tag', 'Resources']
         )
-        fig_coverage.update_traces(textposition='outside')
-        st.plotly_chart(fig_coverage, use_container_width=True)
+        df_coverage['Coverage'] = (df_coverage['Resources'] / total * 100).map('{:.1f}%'.format)
+        
+        st.plotly_chart(_tag_coverage_figure(df_coverage), use_container_width=True)
     
     st.markdown("---")
     
@@ -1651,26 +2187,20 @@ def render_tag_management():
     st.markdown("#### 🔧 Resources by Service")
     
     if tag_compliance['resources_by_service']:
-        df_services = pd.DataFrame([
-            {'Service': service.upper(), 'Count': count}
-            for service, count in sorted(
+        df_services = pd.DataFrame.from_records(
+            sorted(
                 tag_compliance['resources_by_service'].items(),
                 key=lambda x: x[1],
                 reverse=True
-            )
-        ])
+            ),
+            columns=['Service', 'Count']
+        )
+        df_services['Service'] = df_services['Service'].str.upper()
         
         col1, col2 = st.columns(2)
         
         with col1:
-            fig_pie = px.pie(
-                df_services,
-                values='Count',
-                names='Service',
-                title='Resource Distribution',
-                color_discrete_sequence=px.colors.sequential.Oranges_r
-            )
-            st.plotly_chart(fig_pie, use_container_width=True)
+            st.plotly_chart(_resource_pie_figure(df_services), use_container_width=True)
         
         with col2:
             st.dataframe(df_services, use_container_width=True, hide_index=True)
@@ -1717,33 +2247,43 @@ Status: Simulated (Demo Mode)
             if st.button("📥 Download Report"):
                 st.download_button(
                     label="Download JSON",
-                    data=json.dumps(report_data, indent=2),
+                    data=dumps(report_data, indent=True),
                     file_name=f"tag_compliance_{datetime.now().strftime('%Y%m%d')}.json",
                     mime="application/json"
                 )
 
+# Resource type -> cleanup script lines for one unused resource
+_CLEANUP_COMMANDS = {
+    'EBS Volume': lambda resource_id: [
+        f"# Delete EBS Volume: {resource_id}",
+        f"aws ec2 delete-volume --volume-id {resource_id}",
+    ],
+    'Elastic IP': lambda resource_id: [
+        f"# Release Elastic IP: {resource_id}",
+        "aws ec2 release-address --allocation-id <ALLOCATION_ID>",
+    ],
+    'EBS Snapshot': lambda resource_id: [
+        f"# Delete EBS Snapshot: {resource_id}",
+        f"aws ec2 delete-snapshot --snapshot-id {resource_id}",
+    ],
+}
+
 def generate_cleanup_script(unused_resources: List[Dict]) -> str:
     """Generate AWS CLI cleanup script for unused resources"""
-    script = "#!/bin/bash\n"
-    script += "# AWS Resource Cleanup Script\n"
-    script += f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-    script += "# WARNING: Review before executing!\n\n"
+    lines = [
+        "#!/bin/bash",
+        "# AWS Resource Cleanup Script",
+        f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "",
+        "# WARNING: Review before executing!",
+        "",
+    ]
     
     for resource in unused_resources:
-        resource_type = resource['resource_type']
-        resource_id = resource['resource_id']
-        
-        if resource_type == 'EBS Volume':
-            script += f"# Delete EBS Volume: {resource_id}\n"
-            script += f"aws ec2 delete-volume --volume-id {resource_id}\n\n"
-        
-        elif resource_type == 'Elastic IP':
-            script += f"# Release Elastic IP: {resource_id}\n"
-            script += f"aws ec2 release-address --allocation-id <ALLOCATION_ID>\n\n"
-        
-        elif resource_type == 'EBS Snapshot':
-            script += f"# Delete EBS Snapshot: {resource_id}\n"
-            script += f"aws ec2 delete-snapshot --snapshot-id {resource_id}\n\n"
+        build_commands = _CLEANUP_COMMANDS.get(resource['resource_type'])
+        if build_commands:
+            lines.extend(build_commands(resource['resource_id']))
+            lines.append("")
     
-    script += "\necho 'Cleanup completed!'\n"
-    return script
\ No newline at end of file
+    lines += ["", "echo 'Cleanup completed!'", ""]
+    return "\n".join(lines)
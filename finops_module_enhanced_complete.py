@@ -20,18 +20,52 @@ import boto3
 from botocore.exceptions import ClientError
 import anthropic
 import pandas as pd
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from datetime import datetime, timedelta
-import plotly.express as px
-import plotly.graph_objects as go
 from typing import Dict, List, Any, Optional, Tuple
 import json
 import os
 import hashlib
+import inspect
+import re
+import string
+import threading
+import time
+from itertools import islice
+from collections import Counter
+from functools import lru_cache, wraps
+from concurrent.futures import CancelledError, Future
+
+from finops_kernels import NUMBA_AVAILABLE, rolling_zscore_flags, inject_spikes
+from semantic_cache import SEMANTIC_CACHE_AVAILABLE, SemanticCache
+from persistent_cache import SqliteAICache
+from finops_utils import dumps, dumps_sorted_bytes, loads, script_run_executor
 
 # ============================================================================
 # ANTHROPIC AI CLIENT INITIALIZATION
 # ============================================================================
 
+@lru_cache(maxsize=1)
+def _resolve_anthropic_key() -> Optional[str]:
+    """Resolve the Anthropic API key once per process"""
+    # 1. Environment variable (no file I/O)
+    api_key = os.environ.get('ANTHROPIC_API_KEY')
+    if api_key:
+        return api_key
+    
+    try:
+        # 2. Streamlit secrets - nested format [anthropic] section
+        anthropic_secrets = st.secrets.get('anthropic', {})
+        if 'api_key' in anthropic_secrets:
+            return anthropic_secrets['api_key']
+        
+        # 3. Streamlit secrets - direct format
+        return st.secrets.get('ANTHROPIC_API_KEY')
+    except Exception:
+        # No secrets.toml (e.g. running outside Streamlit)
+        return None
+
 @st.cache_resource
 def get_anthropic_client():
     """
@@ -40,25 +74,7 @@ def get_anthropic_client():
     Returns:
         anthropic.Anthropic client or None if API key not configured
     """
-    # Try to get API key from multiple sources
-    api_key = None
-    
-    # 1. Try Streamlit secrets - nested format [anthropic] section
-    if hasattr(st, 'secrets'):
-        try:
-            if 'anthropic' in st.secrets and 'api_key' in st.secrets['anthropic']:
-                api_key = st.secrets['anthropic']['api_key']
-        except Exception:
-            pass
-    
-    # 2. Try Streamlit secrets - direct format
-    if not api_key and hasattr(st, 'secrets') and 'ANTHROPIC_API_KEY' in st.secrets:
-        api_key = st.secrets['ANTHROPIC_API_KEY']
-    
-    # 3. Try environment variable
-    if not api_key:
-        api_key = os.environ.get('ANTHROPIC_API_KEY')
-    
+    api_key = _resolve_anthropic_key()
     if not api_key:
         return None
     
@@ -68,55 +84,33 @@ def get_anthropic_client():
         st.error(f"Error initializing Anthropic client: {str(e)}")
         return None
 
-# ============================================================================
-# AI-POWERED COST ANALYSIS FUNCTIONS
-# ============================================================================
-
-def analyze_costs_with_ai(cost_data: Dict, context: str = "") -> Dict:
+@st.cache_resource
+def get_semantic_cache() -> Optional[SemanticCache]:
     """
-    Use Anthropic Claude to analyze cost data and provide intelligent insights
+    Shared semantic cache for natural language queries
     
-    Args:
-        cost_data: Cost data from AWS Cost Explorer
-        context: Additional context about the organization
-        
     Returns:
-        Dictionary with AI-generated insights
+        SemanticCache, or None if faiss/sentence-transformers are not
+        installed or the embedding model cannot be loaded
     """
-    client = get_anthropic_client()
-    if not client:
-        return {
-            'executive_summary': 'AI analysis not available. Configure ANTHROPIC_API_KEY to enable AI features.',
-            'key_insights': [],
-            'recommendations': [],
-            'anomalies': [],
-            'cost_allocation_suggestions': []
-        }
+    if not SEMANTIC_CACHE_AVAILABLE:
+        return None
     
     try:
-        # Prepare cost data summary
-        total_cost = 0
-        service_costs = {}
-        
-        if cost_data and 'ResultsByTime' in cost_data:
-            for result in cost_data['ResultsByTime']:
-                for group in result.get('Groups', []):
-                    service = group['Keys'][0]
-                    amount = float(group['Metrics']['UnblendedCost']['Amount'])
-                    service_costs[service] = service_costs.get(service, 0) + amount
-                    total_cost += amount
-        
-        # Sort services by cost
-        top_services = dict(sorted(service_costs.items(), key=lambda x: x[1], reverse=True)[:10])
-        
-        prompt = f"""Analyze the following AWS cost data and provide actionable insights:
+        return SemanticCache()
+    except Exception:
+        return None
 
-Total Monthly Cost: ${total_cost:.2f}
+# ============================================================================
+# AI PROMPT TEMPLATES
+# ============================================================================
 
-Top Services by Cost:
-{json.dumps(top_services, indent=2)}
+# Static instructions and response schemas go in the system prompt; only the
+# data in the user message varies per request. Each prompt is far below the
+# model's 1024-token minimum for prompt caching, so none is marked cacheable.
+_AI_MODEL = "claude-sonnet-4-20250514"
 
-Context: {context}
+_COST_ANALYSIS_SYSTEM = """You are an AWS FinOps analyst. Analyze the AWS cost data in the user message and provide actionable insights.
 
 Please provide:
 1. A concise executive summary (2-3 sentences)
@@ -126,81 +120,19 @@ Please provide:
 5. Cost allocation suggestions for better visibility
 
 Format the response as JSON with the following structure:
-{{
+{
     "executive_summary": "string",
     "key_insights": ["insight1", "insight2", ...],
     "recommendations": [
-        {{"priority": "High|Medium|Low", "action": "string", "estimated_savings": "string", "implementation": "string"}}
+        {"priority": "High|Medium|Low", "action": "string", "estimated_savings": "string", "implementation": "string"}
     ],
     "anomalies": ["anomaly1", "anomaly2", ...],
     "cost_allocation_suggestions": ["suggestion1", "suggestion2", ...]
-}}
+}
 
 Respond ONLY with valid JSON, no additional text."""
 
-        message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=2000,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        
-        response_text = message.content[0].text
-        
-        # Extract JSON from response
-        try:
-            # Try to find JSON in response
-            start_idx = response_text.find('{')
-            end_idx = response_text.rfind('}') + 1
-            if start_idx != -1 and end_idx > start_idx:
-                json_str = response_text[start_idx:end_idx]
-                ai_insights = json.loads(json_str)
-            else:
-                ai_insights = json.loads(response_text)
-            
-            return ai_insights
-            
-        except json.JSONDecodeError:
-            # Fallback if JSON parsing fails
-            return {
-                'executive_summary': response_text[:500] if len(response_text) > 500 else response_text,
-                'key_insights': ['AI analysis completed - see summary'],
-                'recommendations': [],
-                'anomalies': [],
-                'cost_allocation_suggestions': []
-            }
-        
-    except Exception as e:
-        st.error(f"Error in AI cost analysis: {str(e)}")
-        return {
-            'executive_summary': f'Error performing AI analysis: {str(e)}',
-            'key_insights': [],
-            'recommendations': [],
-            'anomalies': [],
-            'cost_allocation_suggestions': []
-        }
-
-def generate_rightsizing_recommendations_ai(resource_data: List[Dict]) -> List[Dict]:
-    """
-    Use AI to analyze resource utilization and generate intelligent right-sizing recommendations
-    
-    Args:
-        resource_data: List of resources with utilization metrics
-        
-    Returns:
-        List of AI-generated right-sizing recommendations
-    """
-    client = get_anthropic_client()
-    if not client or not resource_data:
-        return []
-    
-    try:
-        # Limit to first 20 resources to avoid token limits
-        sample_data = resource_data[:20]
-        
-        prompt = f"""Analyze the following AWS resource utilization data and provide specific right-sizing recommendations:
-
-Resource Data:
-{json.dumps(sample_data, indent=2)}
+_RIGHTSIZING_SYSTEM = """You are an AWS FinOps analyst. Analyze the AWS resource utilization data in the user message and provide specific right-sizing recommendations.
 
 For each resource that could be optimized, provide:
 1. Current instance type/configuration
@@ -212,7 +144,7 @@ For each resource that could be optimized, provide:
 
 Format as JSON array:
 [
-    {{
+    {
         "resource_id": "string",
         "resource_type": "string",
         "current_config": "string",
@@ -222,73 +154,12 @@ Format as JSON array:
         "utilization_analysis": "string",
         "risk_level": "Low|Medium|High",
         "implementation_steps": ["step1", "step2", ...]
-    }}
+    }
 ]
 
 Respond ONLY with valid JSON array, no additional text."""
 
-        message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=2500,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        
-        response_text = message.content[0].text
-        
-        # Extract JSON array
-        start_idx = response_text.find('[')
-        end_idx = response_text.rfind(']') + 1
-        if start_idx != -1 and end_idx > start_idx:
-            json_str = response_text[start_idx:end_idx]
-            recommendations = json.loads(json_str)
-            return recommendations
-        
-        return []
-        
-    except Exception as e:
-        st.error(f"Error generating AI right-sizing recommendations: {str(e)}")
-        return []
-
-def detect_anomalies_with_ai(cost_data: Dict, historical_data: Optional[Dict] = None) -> List[Dict]:
-    """
-    Advanced anomaly detection using AI to identify unusual spending patterns
-    
-    Args:
-        cost_data: Current cost data
-        historical_data: Historical cost data for comparison
-        
-    Returns:
-        List of detected anomalies with AI analysis
-    """
-    client = get_anthropic_client()
-    if not client:
-        return []
-    
-    try:
-        # Prepare data for analysis
-        daily_costs = []
-        service_breakdown = {}
-        
-        if cost_data and 'ResultsByTime' in cost_data:
-            for result in cost_data['ResultsByTime']:
-                date = result['TimePeriod']['Start']
-                total = float(result['Total'].get('UnblendedCost', {}).get('Amount', 0))
-                daily_costs.append({'date': date, 'cost': total})
-                
-                for group in result.get('Groups', []):
-                    service = group['Keys'][0]
-                    amount = float(group['Metrics']['UnblendedCost']['Amount'])
-                    if service not in service_breakdown:
-                        service_breakdown[service] = []
-                    service_breakdown[service].append({'date': date, 'cost': amount})
-        
-        prompt = f"""Analyze the following AWS cost data for anomalies and unusual patterns:
-
-Daily Costs (Last 30 days):
-{json.dumps(daily_costs[-30:], indent=2)}
-
-Service Breakdown (Last 7 days):
-{json.dumps({k: v[-7:] for k, v in list(service_breakdown.items())[:10]}, indent=2)}
+_ANOMALY_SYSTEM = """You are an AWS FinOps analyst. Analyze the AWS cost data in the user message for anomalies and unusual patterns.
 
 Identify:
 1. Unexpected cost spikes (>20% increase)
@@ -299,7 +170,7 @@ Identify:
 
 Format as JSON array:
 [
-    {{
+    {
         "anomaly_type": "spike|trend|misconfiguration|waste",
         "severity": "Critical|High|Medium|Low",
         "service": "string",
@@ -309,34 +180,758 @@ Format as JSON array:
         "root_cause_analysis": "string",
         "recommended_actions": ["action1", "action2", ...],
         "prevention_measures": ["measure1", "measure2", ...]
-    }}
+    }
 ]
 
 Respond ONLY with valid JSON array, no additional text."""
 
-        message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=2000,
-            messages=[{"role": "user", "content": prompt}]
-        )
+_QUERY_SYSTEM = """You are an AWS FinOps expert assistant. Answer the user's question about AWS costs and usage using the data they provide.
+
+Provide a clear, concise answer with:
+1. Direct answer to the question
+2. Supporting data/evidence from the context
+3. Any relevant recommendations
+4. If applicable, suggest follow-up actions
+
+Keep the response conversational and easy to understand. Use bullet points where appropriate."""
+
+_EXECUTIVE_REPORT_SYSTEM = """You are an AWS FinOps advisor. Generate a professional executive summary report for the AWS cloud cost data in the user message.
+
+Generate a comprehensive executive report with:
+1. Executive Summary (3-4 paragraphs)
+2. Key Findings (bullet points)
+3. Cost Trends Analysis
+4. Critical Issues & Anomalies
+5. Optimization Opportunities
+6. Recommended Actions with Priority
+7. Expected ROI and Savings
+8. Next Steps
+
+Format in professional markdown suitable for executive presentation."""
+
+# Per-call user messages: %-style templates built once at import, filled with
+# the data for each request
+_COST_ANALYSIS_USER_TEMPLATE = """Total Monthly Cost: $%(total_cost).2f
+
+Top Services by Cost:
+%(top_services)s
+
+Context: %(context)s"""
+
+_RIGHTSIZING_USER_TEMPLATE = """Resource Data:
+%(resources)s"""
+
+_ANOMALY_USER_TEMPLATE = """Baseline: average daily cost $%(baseline).2f over the last %(days)d days
+
+Daily Costs (statistically unusual days with %(context_days)d days of context):
+%(daily_costs)s
+
+Service Breakdown (same days):
+%(service_breakdown)s"""
+
+_QUERY_USER_TEMPLATE = """Question: %(query)s
+
+Available Cost Data:
+%(cost_context)s
+
+Additional Context:
+%(additional_context)s"""
+
+_EXECUTIVE_REPORT_USER_TEMPLATE = """Time Period: %(time_period)s
+Total Cost: $%(total_cost).2f
+Anomalies Detected: %(anomaly_count)d
+Optimization Opportunities: %(recommendation_count)d
+Potential Monthly Savings: $%(potential_savings).2f
+
+Cost Data Summary:
+%(cost_summary)s
+
+Key Anomalies:
+%(anomaly_summary)s
+
+Top Recommendations:
+%(rec_summary)s"""
+
+# Output budgets sized to each response schema rather than one generous cap;
+# smaller reservations finish sooner and leave headroom under rate limits
+_COST_ANALYSIS_MAX_TOK = 1200
+_RIGHTSIZING_BASE_TOK = 200
+_RIGHTSIZING_MAX_TOK_PER_RESOURCE = 120
+_RIGHTSIZING_MAX_TOK = 2500
+_ANOMALY_BASE_TOK = 200
+_ANOMALY_MAX_TOK_PER_FLAG = 180
+_ANOMALY_MAX_TOK = 2000
+_QUERY_SHORT_MAX_TOK = 300
+_QUERY_LONG_MAX_TOK = 800
+_QUERY_SHORT_CHARS = 100
+_EXECUTIVE_REPORT_MAX_TOK = 3000
+
+def _message_params(system: str, user_content: str, max_tokens: int) -> Dict:
+    """Build Messages API parameters for one system prompt and user message"""
+    return {
+        'model': _AI_MODEL,
+        'max_tokens': max_tokens,
+        'system': system,
+        'messages': [{"role": "user", "content": user_content}]
+    }
+
+# A reply cut off at max_tokens is retried once with this multiple of the cap
+_TRUNCATED_RETRY_FACTOR = 2
+
+def _create_message(client, system: str, user_content: str, max_tokens: int):
+    """
+    Send a synchronous request through the Messages API
+    
+    Raises ValueError if the reply is still truncated after the retry, so
+    partial JSON is never parsed, cached or persisted.
+    """
+    message = client.messages.create(**_message_params(system, user_content, max_tokens))
+    if message.stop_reason == 'max_tokens':
+        max_tokens *= _TRUNCATED_RETRY_FACTOR
+        message = client.messages.create(**_message_params(system, user_content, max_tokens))
+        if message.stop_reason == 'max_tokens':
+            raise ValueError(f"AI response truncated at {max_tokens} tokens")
+    return message
+
+# Token budget for each serialized data block in a prompt
+_PROMPT_TOKEN_BUDGET = 8000
+_CONTEXT_TOKEN_BUDGET = 4000
+# Fallback estimate when the token-counting endpoint is unavailable
+_CHARS_PER_TOKEN = 4
+
+def _count_tokens(client, text: str) -> int:
+    """Count input tokens for a single user message"""
+    return client.messages.count_tokens(
+        model=_AI_MODEL,
+        messages=[{"role": "user", "content": text}]
+    ).input_tokens
+
+def _longest_list(obj: Any, path: Tuple = ()) -> Tuple[int, Tuple]:
+    """Length and key path of the longest list nested in dicts"""
+    best = (len(obj), path) if isinstance(obj, list) else (-1, path)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            candidate = _longest_list(value, path + (key,))
+            if candidate[0] > best[0]:
+                best = candidate
+    return best
+
+def _with_list_prefix(obj: Any, path: Tuple, length: int) -> Any:
+    """Shallow copy of obj with the list at path cut to its first length items"""
+    if not path:
+        return obj[:length]
+    return {**obj, path[0]: _with_list_prefix(obj[path[0]], path[1:], length)}
+
+def _fit_to_tokens(client, obj: Any, budget: int = _PROMPT_TOKEN_BUDGET) -> str:
+    """
+    Serialize obj for a prompt within a token budget
+    
+    Drops trailing elements of the longest nested list (so the JSON stays
+    valid) until the token count fits; falls back to a character cut when
+    nothing is left to drop or token counting fails.
+    """
+    text = dumps(obj, indent=True)
+    try:
+        tokens = _count_tokens(client, text)
+        length, path = _longest_list(obj)
+        while tokens > budget and length > 0:
+            # Scale the list by the overshoot, always dropping at least one item
+            length = max(0, min(length - 1, int(length * budget / tokens)))
+            text = dumps(_with_list_prefix(obj, path, length), indent=True)
+            tokens = _count_tokens(client, text)
+        if tokens <= budget:
+            return text
+    except Exception:
+        pass
+    return text[:budget * _CHARS_PER_TOKEN]
+
+_STREAM_REFRESH_SECONDS = 0.1
+# Dead-man timeout: a stream with no new data for this long is abandoned
+_STREAM_STALL_SECONDS = 30
+
+def _close_on_stall(stream, last_text: List[float], done: threading.Event, stalled: threading.Event):
+    """Watchdog: close the stream once no text has arrived for _STREAM_STALL_SECONDS"""
+    while True:
+        remaining = last_text[0] + _STREAM_STALL_SECONDS - time.monotonic()
+        if remaining <= 0:
+            stalled.set()
+            stream.close()
+            return
+        if done.wait(remaining):
+            return
+
+def _stream_message(client, system: str, user_content: str, max_tokens: int) -> str:
+    """
+    Stream a response into a temporary placeholder so text appears as it is
+    generated; the placeholder is cleared once the full text is returned
+    
+    Raises TimeoutError if no text arrives for _STREAM_STALL_SECONDS.
+    """
+    placeholder = st.empty()
+    chunks = []
+    last_refresh = 0.0
+    last_text = [time.monotonic()]
+    done = threading.Event()
+    stalled = threading.Event()
+    stall_error = TimeoutError(f"No response text for {_STREAM_STALL_SECONDS} seconds")
+    try:
+        # The per-request timeout bounds each socket read, so a silent
+        # connection fails; keep-alive pings reset it without carrying text
+        # (the SDK drops them), so a watchdog closes a stream that only pings
+        params = _message_params(system, user_content, max_tokens)
+        with client.messages.stream(**params, timeout=_STREAM_STALL_SECONDS) as stream:
+            threading.Thread(
+                target=_close_on_stall, args=(stream, last_text, done, stalled), daemon=True
+            ).start()
+            try:
+                for text in stream.text_stream:
+                    now = last_text[0] = time.monotonic()
+                    chunks.append(text)
+                    # Throttle redraws; every update is a delta sent to the browser
+                    if now - last_refresh >= _STREAM_REFRESH_SECONDS:
+                        placeholder.markdown("".join(chunks))
+                        last_refresh = now
+            except anthropic.APITimeoutError as e:
+                raise stall_error from e
+            except Exception as e:
+                if stalled.is_set():
+                    raise stall_error from e
+                raise
+            if stalled.is_set():
+                raise stall_error
+    finally:
+        done.set()
+        placeholder.empty()
+    return "".join(chunks)
+
+# ============================================================================
+# MESSAGE BATCHES (NON-INTERACTIVE WORKLOADS)
+# ============================================================================
+
+def submit_batch_ai_jobs(jobs: List[Dict]) -> Optional[str]:
+    """
+    Submit non-interactive AI jobs through the Message Batches API (half the
+    per-token price of synchronous calls, results within 24 hours)
+    
+    Args:
+        jobs: Dicts with 'id', 'system', 'content' and 'max_tokens'
         
-        response_text = message.content[0].text
+    Returns:
+        Batch ID, or None if the AI client is not configured
+    """
+    client = get_anthropic_client()
+    if not client or not jobs:
+        return None
+    
+    batch = client.messages.batches.create(requests=[
+        {
+            'custom_id': job['id'],
+            'params': _message_params(job['system'], job['content'], job['max_tokens'])
+        }
+        for job in jobs
+    ])
+    return batch.id
+
+def poll_batch_results(batch_id: str) -> Optional[Dict[str, str]]:
+    """
+    Fetch results of a submitted batch
+    
+    Returns:
+        Mapping of custom_id to response text once the batch has ended, else None
+    """
+    client = get_anthropic_client()
+    if not client:
+        return None
+    
+    batch = client.messages.batches.retrieve(batch_id)
+    if batch.processing_status != 'ended':
+        return None
+    
+    results = {}
+    for entry in client.messages.batches.results(batch_id):
+        if entry.result.type == 'succeeded':
+            results[entry.custom_id] = entry.result.message.content[0].text
+        else:
+            results[entry.custom_id] = f"# Error Generating Report\n\nBatch request {entry.result.type}"
+    return results
+
+# ============================================================================
+# AI-POWERED COST ANALYSIS FUNCTIONS
+# ============================================================================
+
+# Markdown code fences around model output (```json ... ```)
+_JSON_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$", re.MULTILINE)
+_JSON_DECODER = json.JSONDecoder()
+
+def _is_expected_json(value: Any, array: bool) -> bool:
+    """True for a dict, or for a list of dicts when array is set"""
+    if array:
+        return isinstance(value, list) and all(isinstance(item, dict) for item in value)
+    return isinstance(value, dict)
+
+def _extract_json(text: str, array: bool = False) -> Any:
+    """
+    Parse the JSON object (or array of objects) from a model response
+    
+    Strips markdown fences and tries the whole text first; otherwise decodes
+    once from the first opening bracket, so prose around the JSON is ignored
+    but a fragment nested inside truncated JSON is never returned.
+    
+    Returns:
+        Parsed value, or None if the response contains no valid JSON of that kind
+    """
+    text = _JSON_FENCE_RE.sub('', text)
+    try:
+        value = loads(text)
+        if _is_expected_json(value, array):
+            return value
+    except json.JSONDecodeError:
+        pass
+    
+    idx = text.find('[' if array else '{')
+    if idx == -1:
+        return None
+    try:
+        value, _ = _JSON_DECODER.raw_decode(text, idx)
+    except json.JSONDecodeError:
+        return None
+    return value if _is_expected_json(value, array) else None
+
+def _costdata_to_df(cost_data: Dict) -> pd.DataFrame:
+    """Flatten Cost Explorer service groups into a date/service/cost frame"""
+    # Parallel columns filled in one pass; no per-row tuple or dict
+    dates, services, costs = [], [], []
+    for result in (cost_data or {}).get('ResultsByTime', []):
+        date = result['TimePeriod']['Start']
+        for group in result.get('Groups', []):
+            dates.append(date)
+            services.append(group['Keys'][0])
+            costs.append(group['Metrics']['UnblendedCost']['Amount'])
+    return pd.DataFrame({
+        'date': dates,
+        'service': services,
+        # Amounts are strings from Cost Explorer and floats from demo data
+        'cost': pd.to_numeric(costs, errors='coerce')
+    })
+
+def _hash_costdata(cost_data: Any) -> str:
+    """Stable content hash of JSON-like data, used as an AI cache key"""
+    return hashlib.blake2b(dumps_sorted_bytes(cost_data), digest_size=16).hexdigest()
+
+# Single-slot session cache: the frame for the most recent cost_data only
+_COST_DF_STATE_KEY = 'costdf'
+
+def _get_cost_df(cost_data: Dict, cost_key: Optional[str] = None) -> pd.DataFrame:
+    """
+    Parsed service cost frame for cost_data, shared by the AI functions and
+    charts within a session so ResultsByTime is flattened once per snapshot
+    
+    Callers must treat the returned frame as read-only.
+    """
+    cost_key = cost_key or _hash_costdata(cost_data)
+    cached = st.session_state.get(_COST_DF_STATE_KEY)
+    if cached is None or cached[0] != cost_key:
+        cached = (cost_key, _costdata_to_df(cost_data))
+        st.session_state[_COST_DF_STATE_KEY] = cached
+    return cached[1]
+
+def aggregate_service_costs(cost_data: Dict, cost_key: Optional[str] = None) -> pd.DataFrame:
+    """
+    Total cost per service over the whole period
+    
+    Returns:
+        DataFrame with 'Service' and 'Cost' columns, most expensive first
+    """
+    return (
+        _get_cost_df(cost_data, cost_key)
+        .groupby('service', as_index=False)['cost'].sum()
+        .sort_values('cost', ascending=False)
+        .rename(columns={'service': 'Service', 'cost': 'Cost'})
+    )
+
+def compact_cost_payload(cost_data: Dict) -> Dict:
+    """
+    Compact form of a Cost Explorer response for prompts: the period, total
+    cost per service and total cost per day, rounded to cents
+    
+    The raw response (metric units, usage quantities, Estimated flags) stays
+    client-side for charts; only this summary is sent to Claude.
+    """
+    results = (cost_data or {}).get('ResultsByTime', [])
+    if not results:
+        return {}
+    
+    df = _costdata_to_df(cost_data)
+    by_service = df.groupby('service')['cost'].sum().round(2).sort_values(ascending=False)
+    by_day = df.groupby('date')['cost'].sum().round(2)
+    return {
+        'period': [results[0]['TimePeriod']['Start'], results[-1]['TimePeriod']['End']],
+        'by_service': by_service.to_dict(),
+        'by_day': list(zip(by_day.index.tolist(), by_day.tolist()))
+    }
+
+def _insights_fallback(summary: str, key_insights: Optional[List[str]] = None) -> Dict:
+    """Cost analysis result carrying only a summary message"""
+    return {
+        'executive_summary': summary,
+        'key_insights': key_insights or [],
+        'recommendations': [],
+        'anomalies': [],
+        'cost_allocation_suggestions': []
+    }
+
+class _UnparsedAIResponse(Exception):
+    """Raised by a cached AI helper whose reply could not be parsed; carries the fallback result"""
+    
+    def __init__(self, fallback: Any):
+        super().__init__("AI response could not be parsed")
+        self.fallback = fallback
+
+@lru_cache(maxsize=1)
+def _ai_response_store() -> Optional[SqliteAICache]:
+    """On-disk AI response store shared by all sessions, or None if it cannot be opened"""
+    try:
+        return SqliteAICache()
+    except Exception:
+        return None
+
+# AI requests currently running, by cache key; st.cache_data does not stop two
+# sessions (or two worker threads) from computing the same miss at once
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+def _dedup_call(key: str, fn):
+    """
+    Run fn() for key unless a call for the same key is already running, in
+    which case wait for and return its result (or raise its exception)
+    
+    Only Exceptions are shared with waiting callers. If the running call is
+    interrupted by a BaseException (a Streamlit rerun or stop of the leading
+    session), its future is cancelled and a waiting caller takes over.
+    """
+    while True:
+        with _inflight_lock:
+            future = _inflight.get(key)
+            leader = future is None
+            if leader:
+                future = _inflight[key] = Future()
+        if leader:
+            break
+        try:
+            return future.result()
+        except CancelledError:
+            continue
+    
+    try:
+        result = fn()
+    except BaseException as e:
+        # Unregister before waking the waiters so a retrying one becomes the leader
+        with _inflight_lock:
+            _inflight.pop(key, None)
+        if isinstance(e, Exception):
+            future.set_exception(e)
+        else:
+            future.cancel()
+        raise
+    with _inflight_lock:
+        _inflight.pop(key, None)
+    future.set_result(result)
+    return result
+
+def _share_ai_result(func):
+    """
+    Share an AI helper's results beyond the in-process cache: identical
+    concurrent requests are coalesced into one API call, and responses are
+    kept in the on-disk store so they survive restarts
+    
+    Applied under st.cache_data: in-process hits never reach it. The key uses
+    the same arguments st.cache_data hashes (underscore-prefixed ones are
+    skipped) plus the function and model names. Only non-empty, parsed
+    results are persisted: a helper signals a fallback by raising
+    _UnparsedAIResponse, whose fallback is returned (and kept in process
+    memory) but not written to disk.
+    """
+    signature = inspect.signature(func)
+    
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        key_args = {
+            name: value
+            for name, value in signature.bind(*args, **kwargs).arguments.items()
+            if not name.startswith('_')
+        }
+        key = hashlib.blake2b(
+            f"{func.__qualname__}:{_AI_MODEL}:".encode() + dumps_sorted_bytes(key_args),
+            digest_size=16
+        ).hexdigest()
+        
+        store = _ai_response_store()
+        cached = store.get(key) if store is not None else None
+        if cached is not None:
+            return loads(cached)
         
-        # Extract JSON
-        start_idx = response_text.find('[')
-        end_idx = response_text.rfind(']') + 1
-        if start_idx != -1 and end_idx > start_idx:
-            json_str = response_text[start_idx:end_idx]
-            anomalies = json.loads(json_str)
-            return anomalies
+        def compute():
+            try:
+                result = func(*args, **kwargs)
+            except _UnparsedAIResponse as e:
+                return e.fallback
+            if store is not None and result:
+                store.set(key, dumps(result).encode())
+            return result
         
+        return _dedup_call(key, compute)
+    
+    return wrapper
+
+# AI responses are cached by a content hash of their input data (the data itself
+# is passed unhashed), so reruns with unchanged data skip the API call, and
+# persisted to disk so restarts do not either. Errors propagate out of the
+# cached helpers so they are never cached.
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=64)
+@_share_ai_result
+def _analyze_costs_cached(_client, cost_key: str, _df: pd.DataFrame, context: str) -> Dict:
+    """Run the cost analysis prompt for one cost_data snapshot"""
+    # Prepare cost data summary
+    total_cost = _df['cost'].sum()
+    top_services = _df.groupby('service')['cost'].sum().nlargest(10).to_dict()
+    
+    prompt = _COST_ANALYSIS_USER_TEMPLATE % {
+        'total_cost': total_cost,
+        'top_services': dumps(top_services, indent=True),
+        'context': context
+    }
+
+    message = _create_message(_client, _COST_ANALYSIS_SYSTEM, prompt, max_tokens=_COST_ANALYSIS_MAX_TOK)
+    
+    response_text = message.content[0].text
+    
+    # Extract JSON from response
+    ai_insights = _extract_json(response_text)
+    if ai_insights is not None:
+        return ai_insights
+    
+    # Fallback if JSON parsing fails
+    raise _UnparsedAIResponse(
+        _insights_fallback(response_text[:500], ['AI analysis completed - see summary'])
+    )
+
+def analyze_costs_with_ai(cost_data: Dict, context: str = "", df: Optional[pd.DataFrame] = None) -> Dict:
+    """
+    Use Anthropic Claude to analyze cost data and provide intelligent insights
+    
+    Args:
+        cost_data: Cost data from AWS Cost Explorer
+        context: Additional context about the organization
+        df: Parsed cost frame from _get_cost_df (computed when omitted)
+        
+    Returns:
+        Dictionary with AI-generated insights
+    """
+    client = get_anthropic_client()
+    if not client:
+        return _insights_fallback('AI analysis not available. Configure ANTHROPIC_API_KEY to enable AI features.')
+    
+    try:
+        cost_key = _hash_costdata(cost_data)
+        if df is None:
+            df = _get_cost_df(cost_data, cost_key)
+        return _analyze_costs_cached(client, cost_key, df, context)
+        
+    except Exception as e:
+        st.error(f"Error in AI cost analysis: {str(e)}")
+        return _insights_fallback(f'Error performing AI analysis: {str(e)}')
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=64)
+@_share_ai_result
+def _rightsizing_cached(_client, resource_key: str, _sample_data: List[Dict]) -> List[Dict]:
+    """Run the right-sizing prompt for one resource sample"""
+    prompt = _RIGHTSIZING_USER_TEMPLATE % {'resources': dumps(_sample_data, indent=True)}
+
+    max_tokens = min(
+        _RIGHTSIZING_MAX_TOK,
+        _RIGHTSIZING_BASE_TOK + _RIGHTSIZING_MAX_TOK_PER_RESOURCE * len(_sample_data)
+    )
+    message = _create_message(_client, _RIGHTSIZING_SYSTEM, prompt, max_tokens=max_tokens)
+    
+    response_text = message.content[0].text
+    
+    # Extract JSON array
+    return _extract_json(response_text, array=True) or []
+
+def generate_rightsizing_recommendations_ai(resource_data: List[Dict]) -> List[Dict]:
+    """
+    Use AI to analyze resource utilization and generate intelligent right-sizing recommendations
+    
+    Args:
+        resource_data: List of resources with utilization metrics
+        
+    Returns:
+        List of AI-generated right-sizing recommendations
+    """
+    client = get_anthropic_client()
+    if not client or not resource_data:
         return []
+    
+    try:
+        # Limit to first 20 resources to avoid token limits
+        sample_data = resource_data[:20]
+        return _rightsizing_cached(client, _hash_costdata(sample_data), sample_data)
+        
+    except Exception as e:
+        st.error(f"Error generating AI right-sizing recommendations: {str(e)}")
+        return []
+
+# Statistical pre-screen: only days deviating from their trailing window are
+# worth sending to the model
+_ANOMALY_WINDOW_DAYS = 7
+_ANOMALY_Z_THRESHOLD = 2.5
+_ANOMALY_CONTEXT_DAYS = 2
+
+def _flag_cost_outliers(costs: np.ndarray) -> np.ndarray:
+    """
+    Flag days whose cost deviates more than _ANOMALY_Z_THRESHOLD standard
+    deviations from the trailing _ANOMALY_WINDOW_DAYS mean
+    
+    Args:
+        costs: Daily costs, one row per day (optionally one column per service)
+        
+    Returns:
+        Boolean array with one flag per day; all True when there is too
+        little history to screen
+    """
+    if NUMBA_AVAILABLE:
+        series = np.ascontiguousarray(costs.reshape(costs.shape[0], -1), dtype=np.float64)
+        return rolling_zscore_flags(series, _ANOMALY_WINDOW_DAYS, _ANOMALY_Z_THRESHOLD)
+    
+    n_days = costs.shape[0]
+    if n_days <= _ANOMALY_WINDOW_DAYS:
+        return np.ones(n_days, dtype=bool)
+    
+    # windows[i] covers days i .. i+6 and is compared with day i+7
+    windows = sliding_window_view(costs, _ANOMALY_WINDOW_DAYS, axis=0)[:-1]
+    deviation = np.abs(costs[_ANOMALY_WINDOW_DAYS:] - windows.mean(axis=-1))
+    outliers = deviation > _ANOMALY_Z_THRESHOLD * windows.std(axis=-1)
+    if outliers.ndim > 1:
+        outliers = outliers.any(axis=1)
+    
+    flags = np.zeros(n_days, dtype=bool)
+    flags[_ANOMALY_WINDOW_DAYS:] = outliers
+    return flags
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=64)
+@_share_ai_result
+def _detect_anomalies_cached(_client, cost_key: str, _cost_data: Dict, _df: pd.DataFrame) -> List[Dict]:
+    """Run the anomaly detection prompt for one cost_data snapshot"""
+    # Prepare data for analysis (last 30 days); daily totals come from the
+    # service groups because grouped Cost Explorer responses leave Total empty
+    dates = [result['TimePeriod']['Start'] for result in (_cost_data or {}).get('ResultsByTime', [])][-30:]
+    if not dates:
+        return []
+    
+    daily_totals = _df.groupby('date')['cost'].sum().reindex(dates, fill_value=0)
+    daily_costs = [{'date': date, 'cost': float(cost)} for date, cost in daily_totals.items()]
+    df = _df[_df['date'].isin(dates)]
+    by_service = df.pivot_table(index='date', columns='service', values='cost', aggfunc='sum', fill_value=0)
+    
+    # Screen both the daily totals and each service's series; skip the API
+    # call entirely when nothing stands out
+    flags = _flag_cost_outliers(daily_totals.to_numpy(dtype=np.float64))
+    if not by_service.empty:
+        flags |= _flag_cost_outliers(by_service.reindex(dates, fill_value=0).to_numpy())
+    if not flags.any():
+        return []
+    
+    # Keep only the flagged days plus surrounding context
+    context = np.ones(2 * _ANOMALY_CONTEXT_DAYS + 1)
+    keep = np.convolve(flags, context, mode='same') > 0
+    baseline = float(daily_totals.mean())
+    kept_dates = [date for date, kept in zip(dates, keep) if kept]
+    flagged_costs = [d for d, kept in zip(daily_costs, keep) if kept]
+    
+    # First 10 services, in order of appearance, as column arrays per service
+    # rather than one dict per day
+    flagged = df[df['date'].isin(kept_dates)]
+    service_breakdown = {
+        service: {'date': group['date'].tolist(), 'cost': group['cost'].tolist()}
+        for service, group in islice(flagged.groupby('service', sort=False), 10)
+    }
+    
+    prompt = _ANOMALY_USER_TEMPLATE % {
+        'baseline': baseline,
+        'days': len(daily_costs),
+        'context_days': _ANOMALY_CONTEXT_DAYS,
+        'daily_costs': dumps(flagged_costs, indent=True),
+        'service_breakdown': dumps(service_breakdown, indent=True)
+    }
+
+    max_tokens = min(_ANOMALY_MAX_TOK, _ANOMALY_BASE_TOK + _ANOMALY_MAX_TOK_PER_FLAG * int(flags.sum()))
+    message = _create_message(_client, _ANOMALY_SYSTEM, prompt, max_tokens=max_tokens)
+    
+    response_text = message.content[0].text
+    
+    # Extract JSON
+    return _extract_json(response_text, array=True) or []
+
+def detect_anomalies_with_ai(
+    cost_data: Dict,
+    historical_data: Optional[Dict] = None,
+    df: Optional[pd.DataFrame] = None
+) -> List[Dict]:
+    """
+    Advanced anomaly detection using AI to identify unusual spending patterns
+    
+    Args:
+        cost_data: Current cost data
+        historical_data: Historical cost data for comparison
+        df: Parsed cost frame from _get_cost_df (computed when omitted)
+        
+    Returns:
+        List of detected anomalies with AI analysis
+    """
+    client = get_anthropic_client()
+    if not client:
+        return []
+    
+    try:
+        cost_key = _hash_costdata(cost_data)
+        if df is None:
+            df = _get_cost_df(cost_data, cost_key)
+        return _detect_anomalies_cached(client, cost_key, cost_data, df)
         
     except Exception as e:
         st.error(f"Error in AI anomaly detection: {str(e)}")
         return []
 
-def natural_language_query(query: str, cost_data: Dict, context: Dict = None) -> str:
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=64)
+@_share_ai_result
+def _natural_language_query_cached(
+    _client,
+    query: str,
+    cost_key: str,
+    context_key: str,
+    _cost_data: Dict,
+    _context: Optional[Dict]
+) -> str:
+    """Answer one question against one cost_data/context snapshot"""
+    # Prepare context (limit size to avoid token limits)
+    cost_context = _fit_to_tokens(_client, compact_cost_payload(_cost_data)) if _cost_data else "No cost data available"
+    additional_context = _fit_to_tokens(_client, _context, budget=_CONTEXT_TOKEN_BUDGET) if _context else "No additional context"
+    
+    prompt = _QUERY_USER_TEMPLATE % {
+        'query': query,
+        'cost_context': cost_context,
+        'additional_context': additional_context
+    }
+
+    max_tokens = _QUERY_SHORT_MAX_TOK if len(query) < _QUERY_SHORT_CHARS else _QUERY_LONG_MAX_TOK
+    return _stream_message(_client, _QUERY_SYSTEM, prompt, max_tokens=max_tokens)
+
+def natural_language_query(
+    query: str,
+    cost_data: Dict,
+    context: Dict = None,
+    cost_key: Optional[str] = None
+) -> str:
     """
     Allow users to ask questions about their costs in natural language
     
@@ -344,6 +939,7 @@ def natural_language_query(query: str, cost_data: Dict, context: Dict = None) ->
         query: User's natural language question
         cost_data: Cost data context
         context: Additional context (resource inventory, tags, etc.)
+        cost_key: _hash_costdata(cost_data), when the caller already has it
         
     Returns:
         AI-generated natural language response
@@ -352,45 +948,73 @@ def natural_language_query(query: str, cost_data: Dict, context: Dict = None) ->
     if not client:
         return "AI query feature not available. Please configure ANTHROPIC_API_KEY in Streamlit secrets or environment variables."
     
-    try:
-        # Prepare context (limit size to avoid token limits)
-        cost_context = json.dumps(cost_data, indent=2)[:2000] if cost_data else "No cost data available"
-        additional_context = json.dumps(context, indent=2)[:1000] if context else "No additional context"
-        
-        prompt = f"""You are an AWS FinOps expert assistant. Answer the following question about AWS costs and usage:
-
-Question: {query}
-
-Available Cost Data:
-{cost_context}
-
-Additional Context:
-{additional_context}
-
-Provide a clear, concise answer with:
-1. Direct answer to the question
-2. Supporting data/evidence from the context
-3. Any relevant recommendations
-4. If applicable, suggest follow-up actions
-
-Keep the response conversational and easy to understand. Use bullet points where appropriate."""
-
-        message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=1000,
-            messages=[{"role": "user", "content": prompt}]
-        )
+    try:
+        cost_key = cost_key or _hash_costdata(cost_data)
+        context_key = _hash_costdata(context)
+        
+        def answer() -> str:
+            return _natural_language_query_cached(client, query, cost_key, context_key, cost_data, context)
         
-        return message.content[0].text
+        # Paraphrases of an answered question reuse its answer, but only
+        # against the same cost data and context
+        semantic_cache = get_semantic_cache()
+        if semantic_cache is None:
+            return answer()
+        return semantic_cache.get_or_compute(query, f"{cost_key}:{context_key}", answer)
         
     except Exception as e:
         return f"Error processing query: {str(e)}"
 
-def generate_executive_report_ai(
+def _executive_report_prompt(
+    client,
     cost_data: Dict,
     anomalies: List[Dict],
     recommendations: List[Dict],
     time_period: str
+) -> str:
+    """Build the per-call data section of the executive report prompt"""
+    # Calculate key metrics (grouped Cost Explorer responses leave Total empty)
+    cost_payload = compact_cost_payload(cost_data)
+    total_cost = sum(cost_payload.get('by_service', {}).values())
+    
+    potential_savings = sum(r.get('estimated_monthly_savings', 0) for r in recommendations) if recommendations else 0
+    
+    # Prepare data summaries (limit size)
+    cost_summary = _fit_to_tokens(client, cost_payload) if cost_payload else "No data"
+    anomaly_summary = dumps(anomalies[:5], indent=True) if anomalies else "None"
+    rec_summary = dumps(recommendations[:5], indent=True) if recommendations else "None"
+    
+    return _EXECUTIVE_REPORT_USER_TEMPLATE % {
+        'time_period': time_period,
+        'total_cost': total_cost,
+        'anomaly_count': len(anomalies),
+        'recommendation_count': len(recommendations),
+        'potential_savings': potential_savings,
+        'cost_summary': cost_summary,
+        'anomaly_summary': anomaly_summary,
+        'rec_summary': rec_summary
+    }
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=64)
+@_share_ai_result
+def _executive_report_cached(
+    _client,
+    cost_key: str,
+    _cost_data: Dict,
+    anomalies: List[Dict],
+    recommendations: List[Dict],
+    time_period: str
+) -> str:
+    """Generate the executive report for one cost_data snapshot"""
+    prompt = _executive_report_prompt(_client, _cost_data, anomalies, recommendations, time_period)
+    return _stream_message(_client, _EXECUTIVE_REPORT_SYSTEM, prompt, max_tokens=_EXECUTIVE_REPORT_MAX_TOK)
+
+def generate_executive_report_ai(
+    cost_data: Dict,
+    anomalies: List[Dict],
+    recommendations: List[Dict],
+    time_period: str,
+    async_mode: bool = False
 ) -> str:
     """
     Generate comprehensive executive report with AI insights
@@ -400,97 +1024,173 @@ def generate_executive_report_ai(
         anomalies: Detected anomalies
         recommendations: Optimization recommendations
         time_period: Reporting period
+        async_mode: Queue the report through the Message Batches API instead
+            of waiting for it; the batch ID is recorded in
+            st.session_state['pending_reports']
         
     Returns:
-        Formatted executive report in markdown
+        Formatted executive report in markdown, or the batch ID in async mode
     """
     client = get_anthropic_client()
     if not client:
         return "# Executive Report\n\nAI report generation not available. Configure ANTHROPIC_API_KEY to enable this feature."
     
     try:
-        # Calculate key metrics
-        total_cost = 0
-        if cost_data and 'ResultsByTime' in cost_data:
-            for result in cost_data['ResultsByTime']:
-                total_cost += float(result['Total'].get('UnblendedCost', {}).get('Amount', 0))
+        if async_mode:
+            batch_id = submit_batch_ai_jobs([{
+                'id': 'executive_report',
+                'system': _EXECUTIVE_REPORT_SYSTEM,
+                'content': _executive_report_prompt(client, cost_data, anomalies, recommendations, time_period),
+                'max_tokens': _EXECUTIVE_REPORT_MAX_TOK
+            }])
+            st.session_state.setdefault('pending_reports', {})[batch_id] = time_period
+            return batch_id
         
-        potential_savings = sum([r.get('estimated_monthly_savings', 0) for r in recommendations]) if recommendations else 0
-        
-        # Prepare data summaries (limit size)
-        cost_summary = json.dumps(cost_data, indent=2)[:1500] if cost_data else "No data"
-        anomaly_summary = json.dumps(anomalies[:5], indent=2) if anomalies else "None"
-        rec_summary = json.dumps(recommendations[:5], indent=2) if recommendations else "None"
-        
-        prompt = f"""Generate a professional executive summary report for AWS cloud costs:
-
-Time Period: {time_period}
-Total Cost: ${total_cost:.2f}
-Anomalies Detected: {len(anomalies)}
-Optimization Opportunities: {len(recommendations)}
-Potential Monthly Savings: ${potential_savings:.2f}
-
-Cost Data Summary:
-{cost_summary}
-
-Key Anomalies:
-{anomaly_summary}
-
-Top Recommendations:
-{rec_summary}
-
-Generate a comprehensive executive report with:
-1. Executive Summary (3-4 paragraphs)
-2. Key Findings (bullet points)
-3. Cost Trends Analysis
-4. Critical Issues & Anomalies
-5. Optimization Opportunities
-6. Recommended Actions with Priority
-7. Expected ROI and Savings
-8. Next Steps
-
-Format in professional markdown suitable for executive presentation."""
-
-        message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=3000,
-            messages=[{"role": "user", "content": prompt}]
+        return _executive_report_cached(
+            client, _hash_costdata(cost_data), cost_data, anomalies, recommendations, time_period
         )
         
-        return message.content[0].text
-        
     except Exception as e:
         return f"# Error Generating Report\n\n{str(e)}"
 
+def run_ai_analyses_parallel(
+    cost_data: Dict,
+    resource_data: List[Dict],
+    context: str = "",
+    *,
+    detect_anomalies: bool = True,
+    rightsize: bool = True
+) -> Tuple[Dict, Optional[List[Dict]], Optional[List[Dict]]]:
+    """
+    Run cost analysis and the requested anomaly detection and right-sizing concurrently
+    
+    The calls are independent network-bound requests. Workers only run the
+    cached helpers; failures come back through the futures and are reported
+    with st.error from the calling (script) thread.
+    
+    Returns:
+        (insights, anomalies, rightsizing recommendations); an analysis that
+        was not requested is None
+    """
+    client = get_anthropic_client()
+    if not client:
+        return (
+            analyze_costs_with_ai(cost_data, context),
+            [] if detect_anomalies else None,
+            [] if rightsize else None
+        )
+    
+    # Session state is only reachable from the script thread
+    cost_key = _hash_costdata(cost_data)
+    df = _get_cost_df(cost_data, cost_key)
+    sample_data = resource_data[:20]
+    
+    with script_run_executor(max_workers=3) as executor:
+        insights_future = executor.submit(_analyze_costs_cached, client, cost_key, df, context)
+        anomalies_future = (
+            executor.submit(_detect_anomalies_cached, client, cost_key, cost_data, df)
+            if detect_anomalies else None
+        )
+        rightsizing_future = (
+            executor.submit(_rightsizing_cached, client, _hash_costdata(sample_data), sample_data)
+            if rightsize and sample_data else None
+        )
+    
+    try:
+        insights = insights_future.result()
+    except Exception as e:
+        st.error(f"Error in AI cost analysis: {str(e)}")
+        insights = _insights_fallback(f'Error performing AI analysis: {str(e)}')
+    
+    anomalies = None
+    if anomalies_future is not None:
+        try:
+            anomalies = anomalies_future.result()
+        except Exception as e:
+            st.error(f"Error in AI anomaly detection: {str(e)}")
+            anomalies = []
+    
+    rightsizing = [] if rightsize else None
+    if rightsizing_future is not None:
+        try:
+            rightsizing = rightsizing_future.result()
+        except Exception as e:
+            st.error(f"Error generating AI right-sizing recommendations: {str(e)}")
+    
+    return insights, anomalies, rightsizing
+
 # ============================================================================
 # TRADITIONAL FINOPS FUNCTIONS (BACKWARD COMPATIBLE)
 # ============================================================================
 
-def fetch_cost_data(ce_client, start_date: str, end_date: str, granularity: str = 'DAILY') -> Dict:
-    """Fetch cost and usage data from AWS Cost Explorer"""
+def _aws_cache_key(session) -> Optional[str]:
+    """
+    Cache key identifying the credentials and region of a boto3 session
+    (a hash, so the access key itself never appears in a cache key)
+    """
+    try:
+        credentials = session.get_credentials()
+        return hashlib.blake2b(
+            f"{credentials.access_key}:{session.region_name}".encode(),
+            digest_size=16
+        ).hexdigest()
+    except Exception:
+        return None
+
+def _get_cost_and_usage(ce_client, start_date: str, end_date: str, granularity: str) -> Dict:
+    """Cost Explorer cost and usage grouped by service"""
+    return ce_client.get_cost_and_usage(
+        TimePeriod={
+            'Start': start_date,
+            'End': end_date
+        },
+        Granularity=granularity,
+        Metrics=['UnblendedCost', 'UsageQuantity'],
+        GroupBy=[
+            {'Type': 'DIMENSION', 'Key': 'SERVICE'},
+        ]
+    )
+
+# AWS responses are cached briefly per account/region (clients are passed
+# unhashed), so reruns and repeated lookups skip the API round-trip. Errors
+# propagate out of the cached helpers so they are never cached.
+@st.cache_data(ttl=300, show_spinner=False)
+def _get_cost_and_usage_cached(_ce_client, account_key: str, start_date: str, end_date: str, granularity: str) -> Dict:
+    """_get_cost_and_usage for one account/region"""
+    return _get_cost_and_usage(_ce_client, start_date, end_date, granularity)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _demo_cost_data_cached(start_date: str, end_date: str) -> Dict:
+    """Demo cost data held stable across reruns, so AI results cached by content hash are reused"""
+    return generate_demo_cost_data()
+
+def fetch_cost_data(
+    ce_client,
+    start_date: str,
+    end_date: str,
+    granularity: str = 'DAILY',
+    account_key: Optional[str] = None
+) -> Dict:
+    """
+    Fetch cost and usage data from AWS Cost Explorer
+    
+    Responses are cached for five minutes when account_key (see
+    _aws_cache_key) identifies the account behind ce_client.
+    """
     if not ce_client or st.session_state.get('demo_mode', False):
-        return generate_demo_cost_data()
+        return _demo_cost_data_cached(start_date, end_date)
     
     try:
-        response = ce_client.get_cost_and_usage(
-            TimePeriod={
-                'Start': start_date,
-                'End': end_date
-            },
-            Granularity=granularity,
-            Metrics=['UnblendedCost', 'UsageQuantity'],
-            GroupBy=[
-                {'Type': 'DIMENSION', 'Key': 'SERVICE'},
-            ]
-        )
-        return response
+        if account_key:
+            return _get_cost_and_usage_cached(ce_client, account_key, start_date, end_date, granularity)
+        return _get_cost_and_usage(ce_client, start_date, end_date, granularity)
         
     except ClientError as e:
         st.error(f"Error fetching cost data: {str(e)}")
-        return generate_demo_cost_data()
+        return _demo_cost_data_cached(start_date, end_date)
     except Exception as e:
         st.error(f"Unexpected error: {str(e)}")
-        return generate_demo_cost_data()
+        return _demo_cost_data_cached(start_date, end_date)
 
 def fetch_cost_by_portfolio(ce_client, start_date: str, end_date: str, portfolio_tag: str = 'Portfolio') -> Dict:
     """Fetch costs grouped by portfolio tag"""
@@ -533,68 +1233,156 @@ def fetch_cost_forecast(ce_client, start_date: str, end_date: str) -> Dict:
         st.error(f"Error fetching forecast: {str(e)}")
         return generate_demo_forecast()
 
+def _fetch_ec2(ec2_client) -> List[Dict]:
+    """List EC2 instances across all pages"""
+    return [
+        {
+            'InstanceId': instance.get('InstanceId'),
+            'InstanceType': instance.get('InstanceType'),
+            'State': instance.get('State', {}).get('Name'),
+            'LaunchTime': str(instance.get('LaunchTime', '')),
+            'EstimatedMonthlyCost': 120.0  # Placeholder
+        }
+        for page in ec2_client.get_paginator('describe_instances').paginate()
+        for reservation in page.get('Reservations', [])
+        for instance in reservation.get('Instances', [])
+    ]
+
+def _fetch_rds(rds_client) -> List[Dict]:
+    """List RDS instances across all pages"""
+    return [
+        {
+            'DBInstanceIdentifier': db.get('DBInstanceIdentifier'),
+            'DBInstanceClass': db.get('DBInstanceClass'),
+            'Engine': db.get('Engine'),
+            'DBInstanceStatus': db.get('DBInstanceStatus'),
+            'EstimatedMonthlyCost': 200.0  # Placeholder
+        }
+        for page in rds_client.get_paginator('describe_db_instances').paginate()
+        for db in page.get('DBInstances', [])
+    ]
+
+def _fetch_s3(s3_client) -> List[Dict]:
+    """List S3 buckets across all pages"""
+    return [
+        {
+            'Name': bucket.get('Name'),
+            'CreationDate': str(bucket.get('CreationDate', '')),
+            'EstimatedMonthlyCost': 50.0  # Placeholder
+        }
+        for page in s3_client.get_paginator('list_buckets').paginate()
+        for bucket in page.get('Buckets', [])
+    ]
+
+def _fetch_lambda(lambda_client) -> List[Dict]:
+    """List Lambda functions across all pages"""
+    return [
+        {
+            'FunctionName': function.get('FunctionName'),
+            'Runtime': function.get('Runtime'),
+            'MemorySize': function.get('MemorySize')
+        }
+        for page in lambda_client.get_paginator('list_functions').paginate()
+        for function in page.get('Functions', [])
+    ]
+
+def _fetch_ebs(ec2_client) -> List[Dict]:
+    """List EBS volumes across all pages"""
+    return [
+        {
+            'VolumeId': volume.get('VolumeId'),
+            'Size': volume.get('Size'),
+            'VolumeType': volume.get('VolumeType'),
+            'State': volume.get('State'),
+            'EstimatedMonthlyCost': volume.get('Size', 0) * 0.08  # Placeholder (gp3 per-GB rate)
+        }
+        for page in ec2_client.get_paginator('describe_volumes').paginate()
+        for volume in page.get('Volumes', [])
+    ]
+
+_INVENTORY_FETCHERS = {
+    'ec2': ('ec2', _fetch_ec2),
+    'rds': ('rds', _fetch_rds),
+    's3': ('s3', _fetch_s3),
+    'lambda': ('lambda', _fetch_lambda),
+    'ebs': ('ec2', _fetch_ebs)
+}
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _list_resources_cached(_client, account_key: str, resource_type: str) -> List[Dict]:
+    """One resource type's inventory for one account/region"""
+    return _INVENTORY_FETCHERS[resource_type][1](_client)
+
 def fetch_resource_inventory(session) -> Dict:
-    """Fetch inventory of AWS resources across services"""
+    """Fetch inventory of AWS resources across services (cached for five minutes)"""
     if not session or st.session_state.get('demo_mode', False):
         return generate_demo_inventory()
     
-    inventory = {
-        'ec2': [],
-        'rds': [],
-        's3': [],
-        'lambda': [],
-        'ebs': []
-    }
-    
-    try:
-        # EC2 Instances
-        ec2_client = session.client('ec2')
-        ec2_response = ec2_client.describe_instances()
-        
-        for reservation in ec2_response.get('Reservations', []):
-            for instance in reservation.get('Instances', []):
-                inventory['ec2'].append({
-                    'InstanceId': instance.get('InstanceId'),
-                    'InstanceType': instance.get('InstanceType'),
-                    'State': instance.get('State', {}).get('Name'),
-                    'LaunchTime': str(instance.get('LaunchTime', '')),
-                    'EstimatedMonthlyCost': 120.0  # Placeholder
-                })
-    except Exception as e:
-        st.warning(f"Error fetching EC2 inventory: {str(e)}")
-    
-    try:
-        # RDS Instances
-        rds_client = session.client('rds')
-        rds_response = rds_client.describe_db_instances()
-        
-        for db in rds_response.get('DBInstances', []):
-            inventory['rds'].append({
-                'DBInstanceIdentifier': db.get('DBInstanceIdentifier'),
-                'DBInstanceClass': db.get('DBInstanceClass'),
-                'Engine': db.get('Engine'),
-                'DBInstanceStatus': db.get('DBInstanceStatus'),
-                'EstimatedMonthlyCost': 200.0  # Placeholder
-            })
-    except Exception as e:
-        st.warning(f"Error fetching RDS inventory: {str(e)}")
-    
-    try:
-        # S3 Buckets
-        s3_client = session.client('s3')
-        s3_response = s3_client.list_buckets()
-        
-        for bucket in s3_response.get('Buckets', []):
-            inventory['s3'].append({
-                'Name': bucket.get('Name'),
-                'CreationDate': str(bucket.get('CreationDate', '')),
-                'EstimatedMonthlyCost': 50.0  # Placeholder
-            })
-    except Exception as e:
-        st.warning(f"Error fetching S3 inventory: {str(e)}")
+    inventory = {resource_type: [] for resource_type in _INVENTORY_FETCHERS}
+    
+    # Clients are created on the script thread (boto3 sessions are not
+    # thread-safe); the paginated listing calls then run concurrently
+    account_key = _aws_cache_key(session)
+    clients = {}
+    futures = {}
+    with script_run_executor(max_workers=len(_INVENTORY_FETCHERS)) as executor:
+        for resource_type, (service, fetcher) in _INVENTORY_FETCHERS.items():
+            try:
+                if service not in clients:
+                    clients[service] = session.client(service)
+                if account_key:
+                    futures[resource_type] = executor.submit(
+                        _list_resources_cached, clients[service], account_key, resource_type
+                    )
+                else:
+                    futures[resource_type] = executor.submit(fetcher, clients[service])
+            except Exception as e:
+                st.warning(f"Error fetching {resource_type.upper()} inventory: {str(e)}")
+    
+    for resource_type, future in futures.items():
+        try:
+            inventory[resource_type] = future.result()
+        except Exception as e:
+            st.warning(f"Error fetching {resource_type.upper()} inventory: {str(e)}")
     
     return inventory
 
+# EC2 inventory field -> right-sizing resource field, and defaults for gaps
+_EC2_RESOURCE_FIELDS = {
+    'InstanceId': 'ResourceId',
+    'InstanceType': 'InstanceType',
+    'State': 'State',
+    'EstimatedMonthlyCost': 'MonthlyCost'
+}
+_EC2_RESOURCE_DEFAULTS = {'ResourceId': 'Unknown', 'InstanceType': 'Unknown', 'State': 'Unknown', 'MonthlyCost': 0}
+_RESOURCE_ROW_COLUMNS = ['ResourceId', 'ResourceType', 'InstanceType', 'State', 'MonthlyCost']
+# Below this many instances building a DataFrame costs more than it saves
+_VECTORIZED_RESHAPE_MIN_ROWS = 100
+
+def ec2_inventory_to_resource_rows(ec2_list: List[Dict]) -> List[Dict]:
+    """Reshape EC2 inventory entries into right-sizing resource rows"""
+    if len(ec2_list) <= _VECTORIZED_RESHAPE_MIN_ROWS:
+        return [
+            {
+                'ResourceId': ec2.get('InstanceId', 'Unknown'),
+                'ResourceType': 'EC2',
+                'InstanceType': ec2.get('InstanceType', 'Unknown'),
+                'State': ec2.get('State', 'Unknown'),
+                'MonthlyCost': ec2.get('EstimatedMonthlyCost', 0)
+            }
+            for ec2 in ec2_list
+        ]
+    
+    return (
+        pd.DataFrame(ec2_list)
+        .reindex(columns=list(_EC2_RESOURCE_FIELDS))
+        .rename(columns=_EC2_RESOURCE_FIELDS)
+        .fillna(_EC2_RESOURCE_DEFAULTS)
+        .assign(ResourceType='EC2')
+        [_RESOURCE_ROW_COLUMNS]
+        .to_dict('records')
+    )
+
 def fetch_tag_compliance(session) -> Dict:
     """Fetch tag compliance data across resources"""
     if not session or st.session_state.get('demo_mode', False):
@@ -614,59 +1402,55 @@ def fetch_cost_optimization_recommendations(session) -> List[Dict]:
 # DEMO DATA GENERATION FUNCTIONS
 # ============================================================================
 
+# Demo amounts are emitted as floats; Cost Explorer returns strings, and every
+# consumer casts with float()/to_numeric, which accepts both.
+_DEMO_SERVICES = ('Amazon EC2', 'Amazon S3', 'Amazon RDS', 'AWS Lambda',
+                  'Amazon CloudFront', 'Amazon DynamoDB', 'Amazon EBS', 'AWS Data Transfer')
+_DEMO_SERVICE_BASE_COSTS = np.array([1200, 450, 800, 200, 350, 150, 300, 180], dtype=np.float64)
+
 def generate_demo_cost_data() -> Dict:
     """Generate realistic demo cost data"""
-    import random
+    days = 30
+    shape = (days, len(_DEMO_SERVICES))
+    rng = np.random.default_rng()
+    
+    # Add variation with occasional spikes (5% chance each)
+    variation = rng.uniform(-50, 150, size=shape)
+    spike_draws = rng.random(shape)
+    spike_amounts = rng.uniform(200, 500, size=shape)
+    if NUMBA_AVAILABLE:
+        daily_costs = inject_spikes(_DEMO_SERVICE_BASE_COSTS, variation, spike_draws, spike_amounts, 0.05)
+    else:
+        variation += (spike_draws < 0.05) * spike_amounts
+        daily_costs = np.maximum(_DEMO_SERVICE_BASE_COSTS + variation, 0)
+    usage = rng.uniform(100, 1000, size=shape)
+    totals = daily_costs.sum(axis=1)
     
+    now = datetime.now()
     results = []
-    services = ['Amazon EC2', 'Amazon S3', 'Amazon RDS', 'AWS Lambda', 
-                'Amazon CloudFront', 'Amazon DynamoDB', 'Amazon EBS', 'AWS Data Transfer']
-    
-    for i in range(30):
-        date = (datetime.now() - timedelta(days=30-i)).strftime('%Y-%m-%d')
-        groups = []
-        
-        for service in services:
-            base_cost = {
-                'Amazon EC2': 1200,
-                'Amazon S3': 450,
-                'Amazon RDS': 800,
-                'AWS Lambda': 200,
-                'Amazon CloudFront': 350,
-                'Amazon DynamoDB': 150,
-                'Amazon EBS': 300,
-                'AWS Data Transfer': 180
-            }.get(service, 100)
-            
-            # Add variation with occasional spikes
-            variation = random.uniform(-50, 150)
-            if random.random() < 0.05:  # 5% chance of spike
-                variation += random.uniform(200, 500)
-            
-            daily_cost = max(base_cost + variation, 0)
-            
-            groups.append({
-                'Keys': [service],
-                'Metrics': {
-                    'UnblendedCost': {
-                        'Amount': str(daily_cost),
-                        'Unit': 'USD'
-                    },
-                    'UsageQuantity': {
-                        'Amount': str(random.uniform(100, 1000)),
-                        'Unit': 'N/A'
-                    }
-                }
-            })
-        
-        total = sum([float(g['Metrics']['UnblendedCost']['Amount']) for g in groups])
-        
+    for i, (day_costs, day_usage, total) in enumerate(zip(daily_costs.tolist(), usage.tolist(), totals.tolist())):
+        date = (now - timedelta(days=days-i)).strftime('%Y-%m-%d')
         results.append({
             'TimePeriod': {'Start': date, 'End': date},
-            'Groups': groups,
+            'Groups': [
+                {
+                    'Keys': [service],
+                    'Metrics': {
+                        'UnblendedCost': {
+                            'Amount': cost,
+                            'Unit': 'USD'
+                        },
+                        'UsageQuantity': {
+                            'Amount': quantity,
+                            'Unit': 'N/A'
+                        }
+                    }
+                }
+                for service, cost, quantity in zip(_DEMO_SERVICES, day_costs, day_usage)
+            ],
             'Total': {
                 'UnblendedCost': {
-                    'Amount': str(total),
+                    'Amount': total,
                     'Unit': 'USD'
                 }
             },
@@ -675,40 +1459,33 @@ def generate_demo_cost_data() -> Dict:
     
     return {'ResultsByTime': results}
 
+_DEMO_PORTFOLIOS = ('Retail', 'Healthcare', 'Finance', 'Operations')
+_DEMO_PORTFOLIO_BASE_COSTS = np.array([25000, 35000, 45000, 15000], dtype=np.float64)
+
 def generate_demo_portfolio_costs() -> Dict:
     """Generate demo portfolio cost data"""
-    import random
+    months = 3
+    rng = np.random.default_rng()
+    monthly_costs = _DEMO_PORTFOLIO_BASE_COSTS + rng.uniform(-3000, 5000, size=(months, len(_DEMO_PORTFOLIOS)))
     
-    portfolios = ['Retail', 'Healthcare', 'Finance', 'Operations']
+    now = datetime.now()
     results = []
-    
-    for i in range(3):  # 3 months
-        date = (datetime.now() - timedelta(days=90-i*30)).strftime('%Y-%m-%d')
-        groups = []
-        
-        for portfolio in portfolios:
-            base_cost = {
-                'Retail': 25000,
-                'Healthcare': 35000,
-                'Finance': 45000,
-                'Operations': 15000
-            }.get(portfolio, 10000)
-            
-            monthly_cost = base_cost + random.uniform(-3000, 5000)
-            
-            groups.append({
-                'Keys': [portfolio],
-                'Metrics': {
-                    'UnblendedCost': {
-                        'Amount': str(monthly_cost),
-                        'Unit': 'USD'
-                    }
-                }
-            })
-        
+    for i, month_costs in enumerate(monthly_costs.tolist()):
+        date = (now - timedelta(days=90-i*30)).strftime('%Y-%m-%d')
         results.append({
             'TimePeriod': {'Start': date, 'End': date},
-            'Groups': groups
+            'Groups': [
+                {
+                    'Keys': [portfolio],
+                    'Metrics': {
+                        'UnblendedCost': {
+                            'Amount': cost,
+                            'Unit': 'USD'
+                        }
+                    }
+                }
+                for portfolio, cost in zip(_DEMO_PORTFOLIOS, month_costs)
+            ]
         })
     
     return {'ResultsByTime': results}
@@ -733,36 +1510,50 @@ def generate_demo_forecast() -> Dict:
     
     return {'ForecastResultsByTime': forecast_data}
 
+_DEMO_EC2_TYPES = ('t3.medium', 't3.large', 't3.xlarge', 'm5.large')
+_DEMO_EC2_COSTS = (80.0, 120.0, 160.0, 140.0)
+_DEMO_RDS_CLASSES = ('db.t3.medium', 'db.r5.large')
+_DEMO_RDS_ENGINES = ('postgres', 'mysql')
+_DEMO_RDS_COSTS = (150.0, 280.0)
+_DEMO_S3_BUCKETS = ('prod-data', 'dev-data', 'backups', 'logs', 'analytics')
+_DEMO_EBS_SIZES = (100, 200, 500)
+_DEMO_EBS_COSTS = (10.0, 20.0, 50.0)
+
 def generate_demo_inventory() -> Dict:
     """Generate demo resource inventory"""
+    # All dates in one datetime64 operation per resource type
+    today = np.datetime64(datetime.now().date(), 'D')
+    ec2_launch_dates = (today - np.arange(30, 38)).astype(str).tolist()
+    s3_creation_dates = (today - (180 + 30 * np.arange(len(_DEMO_S3_BUCKETS)))).astype(str).tolist()
+    
     return {
         'ec2': [
             {
                 'InstanceId': f'i-0{i:015x}',
-                'InstanceType': ['t3.medium', 't3.large', 't3.xlarge', 'm5.large'][i % 4],
+                'InstanceType': _DEMO_EC2_TYPES[i % 4],
                 'State': 'running',
-                'LaunchTime': (datetime.now() - timedelta(days=30+i)).strftime('%Y-%m-%d'),
-                'EstimatedMonthlyCost': [80.0, 120.0, 160.0, 140.0][i % 4]
+                'LaunchTime': ec2_launch_dates[i],
+                'EstimatedMonthlyCost': _DEMO_EC2_COSTS[i % 4]
             }
             for i in range(8)
         ],
         'rds': [
             {
                 'DBInstanceIdentifier': f'database-{i+1}',
-                'DBInstanceClass': ['db.t3.medium', 'db.r5.large'][i % 2],
-                'Engine': ['postgres', 'mysql'][i % 2],
+                'DBInstanceClass': _DEMO_RDS_CLASSES[i % 2],
+                'Engine': _DEMO_RDS_ENGINES[i % 2],
                 'DBInstanceStatus': 'available',
-                'EstimatedMonthlyCost': [150.0, 280.0][i % 2]
+                'EstimatedMonthlyCost': _DEMO_RDS_COSTS[i % 2]
             }
             for i in range(4)
         ],
         's3': [
             {
                 'Name': f'bucket-{bucket}',
-                'CreationDate': (datetime.now() - timedelta(days=180+i*30)).strftime('%Y-%m-%d'),
+                'CreationDate': creation_date,
                 'EstimatedMonthlyCost': 75.0
             }
-            for i, bucket in enumerate(['prod-data', 'dev-data', 'backups', 'logs', 'analytics'])
+            for bucket, creation_date in zip(_DEMO_S3_BUCKETS, s3_creation_dates)
         ],
         'lambda': [
             {
@@ -776,10 +1567,10 @@ def generate_demo_inventory() -> Dict:
         'ebs': [
             {
                 'VolumeId': f'vol-0{i:015x}',
-                'Size': [100, 200, 500][i % 3],
+                'Size': _DEMO_EBS_SIZES[i % 3],
                 'VolumeType': 'gp3',
                 'State': 'in-use',
-                'EstimatedMonthlyCost': [10.0, 20.0, 50.0][i % 3]
+                'EstimatedMonthlyCost': _DEMO_EBS_COSTS[i % 3]
             }
             for i in range(10)
         ]
@@ -844,8 +1635,54 @@ def generate_demo_recommendations() -> List[Dict]:
 # AI-ENHANCED UI RENDERING FUNCTIONS
 # ============================================================================
 
-def render_ai_insights_panel(cost_data: Dict):
-    """Render AI-powered insights panel"""
+# Status icons for recommendation priority, anomaly severity and change risk
+_PRIORITY_ICON = {'High': '🔴', 'Medium': '🟡', 'Low': '🟢'}
+_SEVERITY_ICON = {'Critical': '🔴', 'High': '🟠', 'Medium': '🟡', 'Low': '🟢'}
+_RISK_ICON = {'Low': '🟢', 'Medium': '🟡', 'High': '🔴'}
+
+# Detail panels emit each labelled list as one markdown block rather than one
+# element per item, keeping the per-rerun element count flat as lists grow
+def _markdown_list(title: str, items: List[str], bullet: str = "") -> str:
+    """Bold title followed by a markdown bullet list"""
+    return "\n".join([f"**{title}**\n"] + [f"- {bullet}{item}" for item in items])
+
+def _render_anomaly_detail(anomaly: Dict):
+    """Body of one anomaly expander"""
+    st.markdown(
+        f"**Type:** {anomaly.get('anomaly_type', 'Unknown')}\n\n"
+        f"**Date:** {anomaly.get('date_detected', 'N/A')}\n\n"
+        f"**Description:**"
+    )
+    st.info(anomaly.get('description', 'N/A'))
+    
+    st.markdown(f"**Root Cause Analysis:**")
+    st.warning(anomaly.get('root_cause_analysis', 'Analysis pending'))
+    
+    st.markdown(
+        _markdown_list("Recommended Actions:", anomaly.get('recommended_actions', []), "✅ ")
+        + "\n\n"
+        + _markdown_list("Prevention Measures:", anomaly.get('prevention_measures', []), "🛡️ ")
+    )
+
+def _render_rec_detail(rec: Dict, risk_icon: str, risk_level: str):
+    """Body of one right-sizing recommendation expander"""
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("**Current Configuration:**")
+        st.code(rec.get('current_config', 'N/A'))
+        st.markdown("**Utilization Analysis:**")
+        st.info(rec.get('utilization_analysis', 'N/A'))
+    
+    with col2:
+        st.markdown("**Recommended Configuration:**")
+        st.code(rec.get('recommended_config', 'N/A'))
+        st.markdown(f"**Risk Level:** {risk_icon} {risk_level}")
+    
+    st.markdown(_markdown_list("Implementation Steps:", rec.get('implementation_steps', [])))
+
+def render_ai_insights_panel(cost_data: Dict, ai_insights: Optional[Dict] = None):
+    """Render AI-powered insights panel (ai_insights: precomputed analysis)"""
     st.markdown("### 🤖 AI Cost Intelligence")
     
     # Check if AI is available
@@ -854,8 +1691,9 @@ def render_ai_insights_panel(cost_data: Dict):
         st.info("👉 Add your API key in `.streamlit/secrets.toml` or as an environment variable")
         return
     
-    with st.spinner("🧠 Claude is analyzing your cost data..."):
-        ai_insights = analyze_costs_with_ai(cost_data, context="Enterprise AWS environment")
+    if ai_insights is None:
+        with st.spinner("🧠 Claude is analyzing your cost data..."):
+            ai_insights = analyze_costs_with_ai(cost_data, context="Enterprise AWS environment")
     
     # Executive Summary
     st.markdown("#### 📊 Executive Summary")
@@ -878,11 +1716,7 @@ def render_ai_insights_panel(cost_data: Dict):
         recommendations = ai_insights.get('recommendations', [])
         if recommendations:
             for rec in recommendations[:5]:
-                priority_color = {
-                    'High': '🔴',
-                    'Medium': '🟡',
-                    'Low': '🟢'
-                }.get(rec.get('priority', 'Medium'), '⚪')
+                priority_color = _PRIORITY_ICON.get(rec.get('priority', 'Medium'), '⚪')
                 
                 with st.expander(f"{priority_color} {rec.get('action', 'Recommendation')}"):
                     st.markdown(f"**Estimated Savings:** {rec.get('estimated_savings', 'TBD')}")
@@ -902,6 +1736,20 @@ def render_ai_insights_panel(cost_data: Dict):
         for suggestion in ai_insights['cost_allocation_suggestions']:
             st.success(f"✅ {suggestion}")
 
+# Example question chosen by an on_click callback, answered on the next run
+_PENDING_QUERY_KEY = 'pending_query'
+
+_EXAMPLE_QUERIES = (
+    "What are my top 3 cost drivers?",
+    "How can I reduce EC2 costs?",
+    "Are there unusual spending patterns?",
+    "What's causing S3 cost increases?",
+    "Show me optimization opportunities"
+)
+
+def _set_pending_query(query: str):
+    st.session_state[_PENDING_QUERY_KEY] = query
+
 def render_ai_query_interface(cost_data: Dict, context: Dict = None):
     """Render natural language query interface"""
     st.markdown("### 💬 Ask Claude About Your Costs")
@@ -912,14 +1760,8 @@ def render_ai_query_interface(cost_data: Dict, context: Dict = None):
         st.warning("⚠️ AI query feature not available. Configure ANTHROPIC_API_KEY to enable this feature.")
         return
     
-    # Example queries
-    example_queries = [
-        "What are my top 3 cost drivers?",
-        "How can I reduce EC2 costs?",
-        "Are there unusual spending patterns?",
-        "What's causing S3 cost increases?",
-        "Show me optimization opportunities"
-    ]
+    # Hashed once per render and shared by every question asked below
+    cost_key = _hash_costdata(cost_data)
     
     # User input
     query = st.text_input(
@@ -931,25 +1773,34 @@ def render_ai_query_interface(cost_data: Dict, context: Dict = None):
     with col1:
         ask_button = st.button("🔍 Ask Claude", type="primary", width="stretch")
     
-    if ask_button and query:
-        with st.spinner("🤔 Claude is thinking..."):
-            response = natural_language_query(query, cost_data, context)
+    # At most one question is answered per run: a typed question, or the
+    # example clicked on the previous interaction
+    pending_query = st.session_state.pop(_PENDING_QUERY_KEY, None)
+    if ask_button:
+        if query:
+            pending_query = query
+        else:
+            st.warning("Please enter a question")
+    
+    if pending_query:
         st.markdown("#### 💡 Claude's Response:")
+        with st.spinner("🤔 Claude is thinking..."):
+            response = natural_language_query(pending_query, cost_data, context, cost_key)
         st.markdown(response)
-    elif ask_button:
-        st.warning("Please enter a question")
     
     # Example queries
     st.markdown("**💡 Try asking:**")
-    for i, example in enumerate(example_queries):
-        if st.button(example, key=f"example_{i}"):
-            with st.spinner("🤔 Claude is thinking..."):
-                response = natural_language_query(example, cost_data, context)
-            st.markdown("#### 💡 Claude's Response:")
-            st.markdown(response)
-
-def render_ai_anomaly_detection(cost_data: Dict):
-    """Render AI-powered anomaly detection"""
+    for i, (col, example) in enumerate(zip(st.columns(len(_EXAMPLE_QUERIES)), _EXAMPLE_QUERIES)):
+        col.button(example, key=f"example_{i}", on_click=_set_pending_query, args=(example,))
+
+# Keys of the buttons that trigger paid AI calls; the dashboard reads them
+# before the tabs render to start only the requested analyses
+_ANOMALY_BUTTON_KEY = 'detect_anomalies'
+_RIGHTSIZING_BUTTON_KEY = 'generate_rightsizing'
+_REPORT_BUTTON_KEY = 'generate_report'
+
+def render_ai_anomaly_detection(cost_data: Dict, anomalies: Optional[List[Dict]] = None):
+    """Render AI-powered anomaly detection (anomalies: precomputed results)"""
     st.markdown("### 🔍 AI-Powered Anomaly Detection")
     st.markdown("Claude uses advanced pattern recognition to identify unusual spending patterns.")
     
@@ -958,16 +1809,16 @@ def render_ai_anomaly_detection(cost_data: Dict):
         st.warning("⚠️ AI anomaly detection not available. Configure ANTHROPIC_API_KEY to enable this feature.")
         return
     
-    if st.button("🤖 Detect Anomalies", type="primary"):
-        with st.spinner("🧠 Claude is analyzing spending patterns..."):
-            anomalies = detect_anomalies_with_ai(cost_data)
+    if st.button("🤖 Detect Anomalies", type="primary", key=_ANOMALY_BUTTON_KEY):
+        if anomalies is None:
+            with st.spinner("🧠 Claude is analyzing spending patterns..."):
+                anomalies = detect_anomalies_with_ai(cost_data)
         
         if anomalies:
             # Severity summary
-            severity_counts = {'Critical': 0, 'High': 0, 'Medium': 0, 'Low': 0}
-            for anomaly in anomalies:
-                severity = anomaly.get('severity', 'Medium')
-                severity_counts[severity] = severity_counts.get(severity, 0) + 1
+            # Each severity is read once and reused for the counts and labels
+            severities = [anomaly.get('severity', 'Medium') for anomaly in anomalies]
+            severity_counts = Counter(severities)
             
             col1, col2, col3, col4 = st.columns(4)
             with col1:
@@ -982,39 +1833,20 @@ def render_ai_anomaly_detection(cost_data: Dict):
             # Anomaly details
             st.markdown("#### 📊 Detected Anomalies")
             
-            for anomaly in anomalies:
-                severity_icon = {
-                    'Critical': '🔴',
-                    'High': '🟠',
-                    'Medium': '🟡',
-                    'Low': '🟢'
-                }.get(anomaly.get('severity', 'Medium'), '⚪')
+            for anomaly, severity in zip(anomalies, severities):
+                severity_icon = _SEVERITY_ICON.get(severity, '⚪')
+                service = anomaly.get('service', 'Unknown Service')
+                cost_impact = anomaly.get('cost_impact', 0)
                 
                 with st.expander(
-                    f"{severity_icon} [{anomaly.get('severity', 'Medium')}] "
-                    f"{anomaly.get('service', 'Unknown Service')} - "
-                    f"${anomaly.get('cost_impact', 0):,.2f} impact"
+                    f"{severity_icon} [{severity}] {service} - ${cost_impact:,.2f} impact"
                 ):
-                    st.markdown(f"**Type:** {anomaly.get('anomaly_type', 'Unknown')}")
-                    st.markdown(f"**Date:** {anomaly.get('date_detected', 'N/A')}")
-                    st.markdown(f"**Description:**")
-                    st.info(anomaly.get('description', 'N/A'))
-                    
-                    st.markdown(f"**Root Cause Analysis:**")
-                    st.warning(anomaly.get('root_cause_analysis', 'Analysis pending'))
-                    
-                    st.markdown("**Recommended Actions:**")
-                    for action in anomaly.get('recommended_actions', []):
-                        st.markdown(f"- ✅ {action}")
-                    
-                    st.markdown("**Prevention Measures:**")
-                    for measure in anomaly.get('prevention_measures', []):
-                        st.markdown(f"- 🛡️ {measure}")
+                    _render_anomaly_detail(anomaly)
         else:
             st.success("✅ No anomalies detected. Your spending patterns look normal!")
 
-def render_ai_rightsizing_advisor(resource_data: List[Dict]):
-    """Render AI-powered right-sizing advisor"""
+def render_ai_rightsizing_advisor(resource_data: List[Dict], recommendations: Optional[List[Dict]] = None):
+    """Render AI-powered right-sizing advisor (recommendations: precomputed results)"""
     st.markdown("### 🎯 AI-Powered Right-Sizing Advisor")
     st.markdown("Claude analyzes resource utilization and provides intelligent recommendations.")
     
@@ -1027,13 +1859,14 @@ def render_ai_rightsizing_advisor(resource_data: List[Dict]):
         st.info("No resource data available for analysis")
         return
     
-    if st.button("🧠 Generate AI Recommendations", type="primary"):
-        with st.spinner("🤖 Claude is analyzing your resources..."):
-            recommendations = generate_rightsizing_recommendations_ai(resource_data)
+    if st.button("🧠 Generate AI Recommendations", type="primary", key=_RIGHTSIZING_BUTTON_KEY):
+        if recommendations is None:
+            with st.spinner("🤖 Claude is analyzing your resources..."):
+                recommendations = generate_rightsizing_recommendations_ai(resource_data)
         
         if recommendations:
             # Calculate total savings
-            total_savings = sum([r.get('estimated_monthly_savings', 0) for r in recommendations])
+            total_savings = sum(r.get('estimated_monthly_savings', 0) for r in recommendations)
             annual_savings = total_savings * 12
             
             # Summary metrics
@@ -1051,38 +1884,131 @@ def render_ai_rightsizing_advisor(resource_data: List[Dict]):
             st.markdown("#### 📋 Detailed Recommendations")
             
             for rec in recommendations:
-                risk_color = {
-                    'Low': '🟢',
-                    'Medium': '🟡',
-                    'High': '🔴'
-                }.get(rec.get('risk_level', 'Medium'), '⚪')
+                risk_level = rec.get('risk_level', 'Medium')
+                risk_color = _RISK_ICON.get(risk_level, '⚪')
                 
                 with st.expander(
                     f"{risk_color} {rec.get('resource_id', 'Unknown')} - "
                     f"Save ${rec.get('estimated_monthly_savings', 0):.2f}/mo "
                     f"({rec.get('cost_savings_percent', 0):.1f}%)"
                 ):
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        st.markdown("**Current Configuration:**")
-                        st.code(rec.get('current_config', 'N/A'))
-                        st.markdown("**Utilization Analysis:**")
-                        st.info(rec.get('utilization_analysis', 'N/A'))
-                    
-                    with col2:
-                        st.markdown("**Recommended Configuration:**")
-                        st.code(rec.get('recommended_config', 'N/A'))
-                        st.markdown(f"**Risk Level:** {risk_color} {rec.get('risk_level', 'Medium')}")
-                    
-                    st.markdown("**Implementation Steps:**")
-                    for step in rec.get('implementation_steps', []):
-                        st.markdown(f"- {step}")
+                    _render_rec_detail(rec, risk_color, risk_level)
         else:
             st.info("No optimization opportunities identified at this time.")
 
-def render_ai_executive_report(cost_data: Dict):
-    """Render AI-generated executive report interface"""
+# Standalone HTML wrapper for downloaded reports, parsed once at import
+_REPORT_HTML = string.Template("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Executive Cost Report</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }
+        h1 { color: #232F3E; border-bottom: 3px solid #FF9900; }
+        h2 { color: #FF9900; margin-top: 30px; }
+        h3 { color: #232F3E; }
+    </style>
+</head>
+<body>
+${report}
+</body>
+</html>
+""")
+
+def _render_report_downloads(report: str, time_period: str, key_prefix: str = "report"):
+    """Render an executive report with Markdown/JSON/HTML download buttons"""
+    generated = datetime.now()
+    file_stem = f"executive_report_{generated.strftime('%Y%m%d')}"
+    
+    st.markdown("---")
+    st.markdown(report)
+    st.markdown("---")
+    
+    # Download options
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.download_button(
+            label="📥 Download as Markdown",
+            data=report,
+            file_name=f"{file_stem}.md",
+            mime="text/markdown",
+            width="stretch",
+            key=f"{key_prefix}_md"
+        )
+    
+    with col2:
+        # JSON version (compact; the content is one markdown string)
+        report_json = {
+            'generated_date': generated.isoformat(),
+            'period': time_period,
+            'report_content': report
+        }
+        st.download_button(
+            label="📥 Download as JSON",
+            data=dumps(report_json),
+            file_name=f"{file_stem}.json",
+            mime="application/json",
+            width="stretch",
+            key=f"{key_prefix}_json"
+        )
+    
+    with col3:
+        # HTML version
+        html_report = _REPORT_HTML.substitute(report=report)
+        st.download_button(
+            label="📥 Download as HTML",
+            data=html_report,
+            file_name=f"{file_stem}.html",
+            mime="text/html",
+            width="stretch",
+            key=f"{key_prefix}_html"
+        )
+
+@st.fragment(run_every=30)
+def _poll_pending_reports():
+    """Poll queued report batches, rerunning the app once any has completed"""
+    pending = st.session_state.get('pending_reports', {})
+    completed = st.session_state.setdefault('completed_reports', {})
+    
+    finished = False
+    for batch_id, time_period in list(pending.items()):
+        try:
+            results = poll_batch_results(batch_id)
+        except Exception as e:
+            st.warning(f"Unable to check batch {batch_id}: {str(e)}")
+            continue
+        
+        if results is None:
+            st.info(f"⏳ {time_period} report queued (batch `{batch_id}`)")
+            continue
+        
+        completed[batch_id] = (time_period, results.get('executive_report', ''))
+        del pending[batch_id]
+        finished = True
+    
+    # Completed reports render outside the fragment; a full rerun shows them
+    # and stops the polling once nothing is pending
+    if finished:
+        st.rerun()
+
+def _render_completed_reports():
+    """Show the batched reports that have completed"""
+    for batch_id, (time_period, report) in st.session_state.get('completed_reports', {}).items():
+        with st.expander(f"📄 Executive Report - {time_period}"):
+            _render_report_downloads(report, time_period, key_prefix=batch_id)
+
+def render_ai_executive_report(
+    cost_data: Dict,
+    anomalies: Optional[List[Dict]] = None,
+    recommendations: Optional[List[Dict]] = None
+):
+    """
+    Render AI-generated executive report interface
+    
+    anomalies/recommendations: precomputed dashboard results to include;
+    anomalies are detected here when omitted
+    """
     st.markdown("### 📄 AI-Generated Executive Report")
     
     # Check if AI is available
@@ -1095,73 +2021,38 @@ def render_ai_executive_report(cost_data: Dict):
         ["Last 7 Days", "Last 30 Days", "Last Quarter", "Year to Date"]
     )
     
-    if st.button("📊 Generate Report", type="primary"):
+    queue_report = st.checkbox(
+        "Queue as batch job (50% lower cost, delivered within 24 hours)",
+        value=False
+    )
+    
+    if st.button("📊 Generate Report", type="primary", key=_REPORT_BUTTON_KEY):
         with st.spinner("🤖 Claude is preparing your executive report..."):
-            # Get anomalies and recommendations for the report
-            anomalies = detect_anomalies_with_ai(cost_data)
+            # Reuse the dashboard's anomaly and right-sizing results when given
+            if anomalies is None:
+                anomalies = detect_anomalies_with_ai(cost_data)
             
             # For recommendations, we'll pass empty list if no resource data
-            recommendations = []
+            recommendations = recommendations or []
             
-            report = generate_executive_report_ai(cost_data, anomalies, recommendations, time_period)
-        
-        st.markdown("---")
-        st.markdown(report)
-        st.markdown("---")
-        
-        # Download options
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.download_button(
-                label="📥 Download as Markdown",
-                data=report,
-                file_name=f"executive_report_{datetime.now().strftime('%Y%m%d')}.md",
-                mime="text/markdown",
-                width="stretch"
-            )
-        
-        with col2:
-            # JSON version
-            report_json = {
-                'generated_date': datetime.now().isoformat(),
-                'period': time_period,
-                'report_content': report
-            }
-            st.download_button(
-                label="📥 Download as JSON",
-                data=json.dumps(report_json, indent=2),
-                file_name=f"executive_report_{datetime.now().strftime('%Y%m%d')}.json",
-                mime="application/json",
-                width="stretch"
+            report = generate_executive_report_ai(
+                cost_data, anomalies, recommendations, time_period, async_mode=queue_report
             )
         
-        with col3:
-            # HTML version
-            html_report = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Executive Cost Report</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }}
-        h1 {{ color: #232F3E; border-bottom: 3px solid #FF9900; }}
-        h2 {{ color: #FF9900; margin-top: 30px; }}
-        h3 {{ color: #232F3E; }}
-    </style>
-</head>
-<body>
-{report}
-</body>
-</html>
-"""
-            st.download_button(
-                label="📥 Download as HTML",
-                data=html_report,
-                file_name=f"executive_report_{datetime.now().strftime('%Y%m%d')}.html",
-                mime="text/html",
-                width="stretch"
-            )
+        if not queue_report:
+            _render_report_downloads(report, time_period)
+        elif report.startswith("# "):
+            # Submission failed; the error is returned as a markdown report
+            st.markdown(report)
+        else:
+            st.success(f"✅ Report queued as batch `{report}`")
+    
+    if st.session_state.get('pending_reports') or st.session_state.get('completed_reports'):
+        st.markdown("#### 🗂️ Batched Reports")
+        _render_completed_reports()
+        # The auto-refreshing fragment only runs while batches are unfinished
+        if st.session_state.get('pending_reports'):
+            _poll_pending_reports()
 
 # ============================================================================
 # MAIN DASHBOARD RENDERING FUNCTION
@@ -1216,9 +2107,29 @@ def render_enhanced_finops_dashboard():
     cost_data = fetch_cost_data(
         ce_client,
         start_date.strftime('%Y-%m-%d'),
-        end_date.strftime('%Y-%m-%d')
+        end_date.strftime('%Y-%m-%d'),
+        account_key=_aws_cache_key(session) if ce_client else None
     )
     
+    # Get resource inventory (AI query context and right-sizing input)
+    inventory = fetch_resource_inventory(session)
+    resource_data = ec2_inventory_to_resource_rows(inventory.get('ec2', []))
+    
+    # Cost insights are generated on open; anomaly detection and right-sizing
+    # only when their buttons (or the report button, which needs anomalies)
+    # were pressed this run. The requested analyses run concurrently up front
+    # and the tabs render their results.
+    ai_insights = anomalies = rightsizing = None
+    if client:
+        with st.spinner("🧠 Claude is analyzing your cost data..."):
+            ai_insights, anomalies, rightsizing = run_ai_analyses_parallel(
+                cost_data, resource_data, context="Enterprise AWS environment",
+                detect_anomalies=bool(
+                    st.session_state.get(_ANOMALY_BUTTON_KEY) or st.session_state.get(_REPORT_BUTTON_KEY)
+                ),
+                rightsize=bool(st.session_state.get(_RIGHTSIZING_BUTTON_KEY))
+            )
+    
     # Main tabs
     tabs = st.tabs([
         "🤖 AI Insights",
@@ -1231,60 +2142,36 @@ def render_enhanced_finops_dashboard():
     
     # AI Insights Tab
     with tabs[0]:
-        render_ai_insights_panel(cost_data)
+        render_ai_insights_panel(cost_data, ai_insights)
     
     # Ask Claude Tab
     with tabs[1]:
-        # Get resource inventory for context
-        inventory = fetch_resource_inventory(session)
         render_ai_query_interface(cost_data, context={'resources': inventory})
     
     # Right-Sizing Tab
     with tabs[2]:
-        inventory = fetch_resource_inventory(session)
-        # Convert EC2 inventory to resource data format
-        resource_data = []
-        for ec2 in inventory.get('ec2', []):
-            resource_data.append({
-                'ResourceId': ec2.get('InstanceId', 'Unknown'),
-                'ResourceType': 'EC2',
-                'InstanceType': ec2.get('InstanceType', 'Unknown'),
-                'State': ec2.get('State', 'Unknown'),
-                'MonthlyCost': ec2.get('EstimatedMonthlyCost', 0)
-            })
-        render_ai_rightsizing_advisor(resource_data)
+        render_ai_rightsizing_advisor(resource_data, rightsizing)
     
     # Anomaly Detection Tab
     with tabs[3]:
-        render_ai_anomaly_detection(cost_data)
+        render_ai_anomaly_detection(cost_data, anomalies)
     
     # Spend Analytics Tab
     with tabs[4]:
         st.markdown("### 📊 Traditional Spend Analytics")
         
-        # Calculate total cost
-        total_cost = 0
-        if cost_data and 'ResultsByTime' in cost_data:
-            for result in cost_data['ResultsByTime']:
-                total_cost += float(result['Total'].get('UnblendedCost', {}).get('Amount', 0))
+        # Service totals; grouped Cost Explorer responses leave Total empty,
+        # so the overall total is summed from them too
+        df = aggregate_service_costs(cost_data)
+        total_cost = df['Cost'].sum()
         
         st.metric("Total Spend", f"${total_cost:,.2f}")
         
         # Cost by service chart
         if cost_data and 'ResultsByTime' in cost_data:
-            service_costs = {}
-            for result in cost_data['ResultsByTime']:
-                for group in result.get('Groups', []):
-                    service = group['Keys'][0]
-                    amount = float(group['Metrics']['UnblendedCost']['Amount'])
-                    service_costs[service] = service_costs.get(service, 0) + amount
-            
-            if service_costs:
-                df = pd.DataFrame([
-                    {'Service': k, 'Cost': v}
-                    for k, v in sorted(service_costs.items(), key=lambda x: x[1], reverse=True)
-                ])
-                
+            if not df.empty:
+                # plotly is only imported once a chart is actually drawn
+                import plotly.express as px
                 fig = px.bar(
                     df,
                     x='Service',
@@ -1297,7 +2184,7 @@ def render_enhanced_finops_dashboard():
     
     # Executive Report Tab
     with tabs[5]:
-        render_ai_executive_report(cost_data)
+        render_ai_executive_report(cost_data, anomalies, rightsizing)
 
 # ============================================================================
 # TRADITIONAL DASHBOARD (BACKWARD COMPATIBLE)
@@ -1330,31 +2217,19 @@ def render_finops_dashboard():
     cost_data = fetch_cost_data(
         ce_client,
         start_date.strftime('%Y-%m-%d'),
-        end_date.strftime('%Y-%m-%d')
+        end_date.strftime('%Y-%m-%d'),
+        account_key=_aws_cache_key(session) if ce_client else None
     )
     
     # Display cost data
     if cost_data and 'ResultsByTime' in cost_data:
-        total_cost = sum([
-            float(result['Total'].get('UnblendedCost', {}).get('Amount', 0))
-            for result in cost_data['ResultsByTime']
-        ])
-        st.metric("Total Cost", f"${total_cost:,.2f}")
+        df = aggregate_service_costs(cost_data)
+        st.metric("Total Cost", f"${df['Cost'].sum():,.2f}")
         
         # Service breakdown
-        service_costs = {}
-        for result in cost_data['ResultsByTime']:
-            for group in result.get('Groups', []):
-                service = group['Keys'][0]
-                amount = float(group['Metrics']['UnblendedCost']['Amount'])
-                service_costs[service] = service_costs.get(service, 0) + amount
-        
-        if service_costs:
+        if not df.empty:
             st.markdown("#### Cost by Service")
-            df = pd.DataFrame([
-                {'Service': k, 'Cost': f"${v:,.2f}"}
-                for k, v in sorted(service_costs.items(), key=lambda x: x[1], reverse=True)
-            ])
+            df['Cost'] = df['Cost'].map('${:,.2f}'.format)
             st.dataframe(df, width="stretch", hide_index=True)
 
 # ============================================================================
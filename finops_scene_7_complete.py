@@ -16,11 +16,358 @@ Duration: Part of Act 4 (3:30 - 4:20)
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import time
 
+# ============================================================================
+# STATIC HTML
+# ============================================================================
+
+# The scene's cards are fixed demo content, defined once here; only the
+# remediation step cards are filled in at render time
+
+# Predicted-anomaly alert banner with pulsing border
+_ALERT_CARD_HTML = """
+<div style='
+    background: linear-gradient(135deg, #FF9900 0%, #FF6600 100%);
+    color: white;
+    padding: 25px;
+    border-radius: 10px;
+    border: 3px solid #CC5500;
+    margin: 20px 0;
+    box-shadow: 0 4px 12px rgba(255,153,0,0.4);
+    animation: alertPulse 2s infinite;
+'>
+    <div style='display: flex; align-items: center; justify-content: space-between; margin-bottom: 15px;'>
+        <div style='display: flex; align-items: center;'>
+            <span style='font-size: 36px; margin-right: 15px;'>🚨</span>
+            <div>
+                <h2 style='margin: 0; color: white;'>Predicted Cost Anomaly</h2>
+                <p style='margin: 5px 0 0 0; font-size: 14px; opacity: 0.9;'>AI-detected spending pattern deviation</p>
+            </div>
+        </div>
+        <div style='
+            background: rgba(0,0,0,0.3);
+            padding: 10px 20px;
+            border-radius: 8px;
+            text-align: center;
+        '>
+            <div style='font-size: 12px; opacity: 0.9;'>Confidence</div>
+            <div style='font-size: 24px; font-weight: bold;'>94%</div>
+        </div>
+    </div>
+</div>
+
+<style>
+    @keyframes alertPulse {
+        0%, 100% { box-shadow: 0 4px 12px rgba(255,153,0,0.4); }
+        50% { box-shadow: 0 4px 20px rgba(255,153,0,0.7); }
+    }
+</style>
+"""
+
+# Expected / predicted / time-to-impact / savings metric cards
+_COST_CARD_TEMPLATE = """
+<div style='
+    background: white;
+    border: 2px solid {color};
+    border-radius: 10px;
+    padding: 20px;
+    text-align: center;
+'>
+    <div style='color: #666; font-size: 14px; margin-bottom: 5px;'>{label}</div>
+    <div style='color: {color}; font-size: 36px; font-weight: bold;'>{value}</div>
+    <div style='{note_style}'>{note}</div>
+</div>
+"""
+
+_NOTE_STYLE = "color: #999; font-size: 12px;"
+
+_COST_CARDS = (
+    {'color': '#00C851', 'label': 'Expected Cost', 'value': '$67K',
+     'note_style': _NOTE_STYLE, 'note': 'Normal pattern'},
+    {'color': '#FF6600', 'label': 'Predicted Cost', 'value': '$94K',
+     'note_style': "color: #FF6600; font-size: 12px; font-weight: bold;", 'note': '+$27K (+40%)'},
+    {'color': '#D13212', 'label': 'Time to Impact', 'value': '4',
+     'note_style': _NOTE_STYLE, 'note': 'Days remaining'},
+    {'color': '#00A8E1', 'label': 'Potential Savings', 'value': '$18K',
+     'note_style': _NOTE_STYLE, 'note': 'Per month'},
+)
+
+# All four cards in one CSS grid, rendered as a single element
+_COST_CARDS_HTML = (
+    "<div style='display: grid; grid-template-columns: repeat(4, 1fr); gap: 16px;'>"
+    + "".join(_COST_CARD_TEMPLATE.strip().format_map(card) for card in _COST_CARDS)
+    + "</div>"
+)
+
+# Identified issue and impact analysis
+_ROOT_CAUSE_HTML = """
+<div style='
+    background: linear-gradient(135deg, #FFF8DC 0%, #FFEAA7 100%);
+    border-left: 5px solid #FF9900;
+    padding: 20px;
+    border-radius: 8px;
+    margin-bottom: 20px;
+'>
+    <h4 style='margin: 0 0 15px 0; color: #232F3E;'>🎯 Identified Issue</h4>
+    <div style='background: white; padding: 15px; border-radius: 5px; margin-bottom: 15px;'>
+        <strong style='color: #FF6600; font-size: 16px;'>Misconfigured Auto-Scaling Policy</strong><br>
+        <span style='color: #666; font-size: 14px;'>
+            Auto Scaling Group: <code>prod-api-asg-01</code><br>
+            Current Target Utilization: <strong>50%</strong> (too aggressive)<br>
+            Instance Type: c5.4xlarge<br>
+            Average Utilization: 28% (significantly underutilized)
+        </span>
+    </div>
+
+    <h4 style='margin: 15px 0 10px 0; color: #232F3E;'>📊 Impact Analysis</h4>
+    <ul style='color: #666; font-size: 14px; margin: 0; padding-left: 20px;'>
+        <li><strong>Over-provisioning:</strong> 72% of instances idle during off-peak</li>
+        <li><strong>Wasteful scaling:</strong> 12 unnecessary scale-out events/day</li>
+        <li><strong>Cost impact:</strong> $27,000/month in excess capacity</li>
+        <li><strong>Efficiency:</strong> Only 28% resource utilization vs 70% target</li>
+    </ul>
+</div>
+"""
+
+# AI insights side panel
+_AI_INSIGHTS_HTML = """
+<div style='
+    background: linear-gradient(135deg, #E8F4F8 0%, #D5E8F0 100%);
+    border: 2px solid #00A8E1;
+    border-radius: 10px;
+    padding: 20px;
+    margin-bottom: 20px;
+'>
+    <div style='display: flex; align-items: center; margin-bottom: 15px;'>
+        <span style='font-size: 28px; margin-right: 10px;'>🤖</span>
+        <h4 style='margin: 0; color: #232F3E;'>AI Insights</h4>
+    </div>
+    <div style='background: white; padding: 15px; border-radius: 8px; color: #666; font-size: 13px; line-height: 1.6;'>
+        <strong style='color: #232F3E;'>Machine Learning Analysis:</strong><br><br>
+        • Detected 94% confidence anomaly<br>
+        • Pattern started 3 days ago<br>
+        • Similar to incident #1247 (Q2 2024)<br>
+        • 87% of peers use 65-75% target<br>
+        • Predicted escalation in 4 days<br><br>
+        <strong style='color: #00A8E1;'>Recommendation confidence: HIGH</strong>
+    </div>
+</div>
+"""
+
+# Excess cost by service
+_COST_BREAKDOWN_HTML = """
+<div style='
+    background: white;
+    border: 2px solid #E1E4E8;
+    border-radius: 10px;
+    padding: 15px;
+'>
+    <h5 style='margin: 0 0 10px 0; color: #232F3E;'>💸 Cost Breakdown</h5>
+    <div style='font-size: 13px; color: #666;'>
+        <div style='display: flex; justify-content: space-between; padding: 8px 0; border-bottom: 1px solid #E1E4E8;'>
+            <span>EC2 Instances</span>
+            <strong>$21,400</strong>
+        </div>
+        <div style='display: flex; justify-content: space-between; padding: 8px 0; border-bottom: 1px solid #E1E4E8;'>
+            <span>Load Balancer</span>
+            <strong>$3,200</strong>
+        </div>
+        <div style='display: flex; justify-content: space-between; padding: 8px 0; border-bottom: 1px solid #E1E4E8;'>
+            <span>Data Transfer</span>
+            <strong>$2,400</strong>
+        </div>
+        <div style='display: flex; justify-content: space-between; padding: 8px 0; font-weight: bold; color: #FF6600;'>
+            <span>Total Excess</span>
+            <strong>$27,000</strong>
+        </div>
+    </div>
+</div>
+"""
+
+# Recommended action with benefits and considerations
+_RECOMMENDATION_HTML = """
+<div style='
+    background: linear-gradient(135deg, #E8F8F5 0%, #D4F1E8 100%);
+    border-left: 5px solid #00C851;
+    padding: 25px;
+    border-radius: 10px;
+    margin: 20px 0;
+    box-shadow: 0 4px 8px rgba(0,200,81,0.2);
+'>
+    <h3 style='margin: 0 0 20px 0; color: #232F3E;'>🎯 Recommended Action</h3>
+
+    <div style='
+        background: white;
+        padding: 20px;
+        border-radius: 8px;
+        border: 2px solid #00C851;
+        margin-bottom: 15px;
+    '>
+        <div style='display: flex; align-items: center; justify-content: space-between;'>
+            <div>
+                <h4 style='margin: 0 0 10px 0; color: #00C851;'>Adjust Auto-Scaling Target Utilization</h4>
+                <p style='color: #666; font-size: 16px; margin: 0;'>
+                    <strong>Change:</strong> 50% → 70% CPU target utilization<br>
+                    <strong>Impact:</strong> Reduce instance count by ~35%<br>
+                    <strong>Maintains:</strong> Performance SLA (p99 < 200ms)
+                </p>
+            </div>
+            <div style='text-align: center; padding-left: 20px;'>
+                <div style='font-size: 14px; color: #666;'>Monthly Savings</div>
+                <div style='font-size: 42px; font-weight: bold; color: #00C851;'>$18K</div>
+            </div>
+        </div>
+    </div>
+
+    <div style='display: grid; grid-template-columns: 1fr 1fr; gap: 15px;'>
+        <div style='background: white; padding: 15px; border-radius: 8px;'>
+            <strong style='color: #232F3E;'>✅ Benefits</strong>
+            <ul style='color: #666; font-size: 13px; margin: 10px 0 0 0; padding-left: 20px;'>
+                <li>$18,000/month cost reduction</li>
+                <li>Better resource utilization (70% vs 28%)</li>
+                <li>Maintains performance SLAs</li>
+                <li>Reduces carbon footprint by 35%</li>
+            </ul>
+        </div>
+        <div style='background: white; padding: 15px; border-radius: 8px;'>
+            <strong style='color: #232F3E;'>⚠️ Considerations</strong>
+            <ul style='color: #666; font-size: 13px; margin: 10px 0 0 0; padding-left: 20px;'>
+                <li>Implement during low-traffic window</li>
+                <li>Monitor closely for 48 hours</li>
+                <li>Rollback plan available</li>
+                <li>CloudWatch alarms updated</li>
+            </ul>
+        </div>
+    </div>
+</div>
+"""
+
+# Post-remediation savings summary
+_SUCCESS_SUMMARY_HTML = """
+<div style='
+    background: linear-gradient(135deg, #00C851 0%, #007E33 100%);
+    color: white;
+    padding: 30px;
+    border-radius: 10px;
+    margin: 20px 0;
+    box-shadow: 0 4px 12px rgba(0,200,81,0.3);
+'>
+    <h2 style='margin: 0 0 20px 0; color: white; text-align: center;'>
+        💰 Cost Anomaly Prevented!
+    </h2>
+    <div style='
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 20px;
+        margin-top: 20px;
+        padding-top: 20px;
+        border-top: 1px solid rgba(255,255,255,0.3);
+    '>
+        <div style='text-align: center;'>
+            <div style='font-size: 14px; opacity: 0.9;'>Monthly Savings</div>
+            <div style='font-size: 32px; font-weight: bold; margin: 10px 0;'>$18,000</div>
+            <div style='font-size: 12px; opacity: 0.8;'>Immediate impact</div>
+        </div>
+        <div style='text-align: center;'>
+            <div style='font-size: 14px; opacity: 0.9;'>Annual Savings</div>
+            <div style='font-size: 32px; font-weight: bold; margin: 10px 0;'>$216K</div>
+            <div style='font-size: 12px; opacity: 0.8;'>Projected</div>
+        </div>
+        <div style='text-align: center;'>
+            <div style='font-size: 14px; opacity: 0.9;'>Utilization</div>
+            <div style='font-size: 32px; font-weight: bold; margin: 10px 0;'>70%</div>
+            <div style='font-size: 12px; opacity: 0.8;'>Target achieved</div>
+        </div>
+        <div style='text-align: center;'>
+            <div style='font-size: 14px; opacity: 0.9;'>Time to Fix</div>
+            <div style='font-size: 32px; font-weight: bold; margin: 10px 0;'>42s</div>
+            <div style='font-size: 12px; opacity: 0.8;'>Fully automated</div>
+        </div>
+    </div>
+</div>
+"""
+
+# One remediation progress step
+_STEP_CARD_TEMPLATE = """
+<div style='
+    background: {bg_color};
+    border-left: 4px solid {color};
+    padding: 12px 20px;
+    margin: 8px 0;
+    border-radius: 5px;
+'>
+    <strong style='color: {color}; font-size: 16px;'>{step}</strong><br>
+    <span style='color: #666; font-size: 13px;'>{detail}</span>
+</div>
+"""
+
+# ============================================================================
+# CHARTS
+# ============================================================================
+
+# The trend chart only depends on the current day, so it is built once per day.
+# cache_resource hands back the same Figure (cache_data would re-validate it
+# when unpickling); st.plotly_chart only serializes it, never mutates it.
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _build_trend_figure(anchor: date) -> go.Figure:
+    """30-day expected vs predicted cost chart ending on anchor"""
+    dates = pd.date_range(end=anchor, periods=30, freq='D')
+    day = np.arange(30)
+    expected_costs = 67000.0 + day * 200 + 500 * (day % 7 == 0)
+    predicted_costs = expected_costs.copy()
+    predicted_costs[-4:] = (72000, 78000, 85000, 94000)
+    
+    fig_trend = go.Figure()
+    
+    # Expected trend line
+    fig_trend.add_trace(go.Scatter(
+        x=dates,
+        y=expected_costs,
+        mode='lines',
+        name='Expected Pattern',
+        line=dict(color='#00C851', width=2, dash='dash'),
+        hovertemplate='Date: %{x}<br>Expected: $%{y:,.0f}<extra></extra>'
+    ))
+    
+    # Predicted trend line (diverges at end)
+    fig_trend.add_trace(go.Scatter(
+        x=dates,
+        y=predicted_costs,
+        mode='lines',
+        name='Predicted Pattern',
+        line=dict(color='#FF6600', width=3),
+        fill='tonexty',
+        fillcolor='rgba(255,102,0,0.1)',
+        hovertemplate='Date: %{x}<br>Predicted: $%{y:,.0f}<extra></extra>'
+    ))
+    
+    # Anomaly zone
+    fig_trend.add_vrect(
+        x0=dates[26], x1=dates[29],
+        fillcolor="rgba(255,0,0,0.1)",
+        layer="below", line_width=0,
+        annotation_text="Anomaly Zone",
+        annotation_position="top left"
+    )
+    
+    fig_trend.update_layout(
+        title="30-Day Cost Forecast with Anomaly Detection",
+        xaxis_title="Date",
+        yaxis_title="Daily Cost (USD)",
+        hovermode='x unified',
+        height=350,
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    
+    return fig_trend
+
+
 def render_predictive_finops_scene():
     """
     Complete Predictive FinOps scene matching video script Scene 7
@@ -38,107 +385,10 @@ def render_predictive_finops_scene():
     st.markdown("### 🚨 Active Cost Anomaly Alerts")
     
     # Critical Cost Anomaly Card
-    st.markdown("""
-    <div style='
-        background: linear-gradient(135deg, #FF9900 0%, #FF6600 100%);
-        color: white;
-        padding: 25px;
-        border-radius: 10px;
-        border: 3px solid #CC5500;
-        margin: 20px 0;
-        box-shadow: 0 4px 12px rgba(255,153,0,0.4);
-        animation: alertPulse 2s infinite;
-    '>
-        <div style='display: flex; align-items: center; justify-content: space-between; margin-bottom: 15px;'>
-            <div style='display: flex; align-items: center;'>
-                <span style='font-size: 36px; margin-right: 15px;'>🚨</span>
-                <div>
-                    <h2 style='margin: 0; color: white;'>Predicted Cost Anomaly</h2>
-                    <p style='margin: 5px 0 0 0; font-size: 14px; opacity: 0.9;'>AI-detected spending pattern deviation</p>
-                </div>
-            </div>
-            <div style='
-                background: rgba(0,0,0,0.3);
-                padding: 10px 20px;
-                border-radius: 8px;
-                text-align: center;
-            '>
-                <div style='font-size: 12px; opacity: 0.9;'>Confidence</div>
-                <div style='font-size: 24px; font-weight: bold;'>94%</div>
-            </div>
-        </div>
-    </div>
-    
-    <style>
-        @keyframes alertPulse {
-            0%, 100% { box-shadow: 0 4px 12px rgba(255,153,0,0.4); }
-            50% { box-shadow: 0 4px 20px rgba(255,153,0,0.7); }
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_ALERT_CARD_HTML, unsafe_allow_html=True)
     
     # Cost Comparison Metrics
-    col_cost1, col_cost2, col_cost3, col_cost4 = st.columns(4)
-    
-    with col_cost1:
-        st.markdown("""
-        <div style='
-            background: white;
-            border: 2px solid #00C851;
-            border-radius: 10px;
-            padding: 20px;
-            text-align: center;
-        '>
-            <div style='color: #666; font-size: 14px; margin-bottom: 5px;'>Expected Cost</div>
-            <div style='color: #00C851; font-size: 36px; font-weight: bold;'>$67K</div>
-            <div style='color: #999; font-size: 12px;'>Normal pattern</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col_cost2:
-        st.markdown("""
-        <div style='
-            background: white;
-            border: 2px solid #FF6600;
-            border-radius: 10px;
-            padding: 20px;
-            text-align: center;
-        '>
-            <div style='color: #666; font-size: 14px; margin-bottom: 5px;'>Predicted Cost</div>
-            <div style='color: #FF6600; font-size: 36px; font-weight: bold;'>$94K</div>
-            <div style='color: #FF6600; font-size: 12px; font-weight: bold;'>+$27K (+40%)</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col_cost3:
-        st.markdown("""
-        <div style='
-            background: white;
-            border: 2px solid #D13212;
-            border-radius: 10px;
-            padding: 20px;
-            text-align: center;
-        '>
-            <div style='color: #666; font-size: 14px; margin-bottom: 5px;'>Time to Impact</div>
-            <div style='color: #D13212; font-size: 36px; font-weight: bold;'>4</div>
-            <div style='color: #999; font-size: 12px;'>Days remaining</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col_cost4:
-        st.markdown("""
-        <div style='
-            background: white;
-            border: 2px solid #00A8E1;
-            border-radius: 10px;
-            padding: 20px;
-            text-align: center;
-        '>
-            <div style='color: #666; font-size: 14px; margin-bottom: 5px;'>Potential Savings</div>
-            <div style='color: #00A8E1; font-size: 36px; font-weight: bold;'>$18K</div>
-            <div style='color: #999; font-size: 12px;'>Per month</div>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(_COST_CARDS_HTML, unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -152,143 +402,19 @@ def render_predictive_finops_scene():
     
     with col_analysis1:
         # Root cause details
-        st.markdown("""
-        <div style='
-            background: linear-gradient(135deg, #FFF8DC 0%, #FFEAA7 100%);
-            border-left: 5px solid #FF9900;
-            padding: 20px;
-            border-radius: 8px;
-            margin-bottom: 20px;
-        '>
-            <h4 style='margin: 0 0 15px 0; color: #232F3E;'>🎯 Identified Issue</h4>
-            <div style='background: white; padding: 15px; border-radius: 5px; margin-bottom: 15px;'>
-                <strong style='color: #FF6600; font-size: 16px;'>Misconfigured Auto-Scaling Policy</strong><br>
-                <span style='color: #666; font-size: 14px;'>
-                    Auto Scaling Group: <code>prod-api-asg-01</code><br>
-                    Current Target Utilization: <strong>50%</strong> (too aggressive)<br>
-                    Instance Type: c5.4xlarge<br>
-                    Average Utilization: 28% (significantly underutilized)
-                </span>
-            </div>
-            
-            <h4 style='margin: 15px 0 10px 0; color: #232F3E;'>📊 Impact Analysis</h4>
-            <ul style='color: #666; font-size: 14px; margin: 0; padding-left: 20px;'>
-                <li><strong>Over-provisioning:</strong> 72% of instances idle during off-peak</li>
-                <li><strong>Wasteful scaling:</strong> 12 unnecessary scale-out events/day</li>
-                <li><strong>Cost impact:</strong> $27,000/month in excess capacity</li>
-                <li><strong>Efficiency:</strong> Only 28% resource utilization vs 70% target</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_ROOT_CAUSE_HTML, unsafe_allow_html=True)
         
         # Historical pattern
         st.markdown("#### 📈 Historical Cost Pattern")
         
-        # Create cost trend chart
-        dates = pd.date_range(end=datetime.now(), periods=30, freq='D')
-        expected_costs = [67000 + (i * 200) + (500 * (i % 7 == 0)) for i in range(30)]
-        predicted_costs = expected_costs[:26] + [72000, 78000, 85000, 94000]
-        
-        fig_trend = go.Figure()
-        
-        # Expected trend line
-        fig_trend.add_trace(go.Scatter(
-            x=dates,
-            y=expected_costs,
-            mode='lines',
-            name='Expected Pattern',
-            line=dict(color='#00C851', width=2, dash='dash'),
-            hovertemplate='Date: %{x}<br>Expected: $%{y:,.0f}<extra></extra>'
-        ))
-        
-        # Predicted trend line (diverges at end)
-        fig_trend.add_trace(go.Scatter(
-            x=dates,
-            y=predicted_costs,
-            mode='lines',
-            name='Predicted Pattern',
-            line=dict(color='#FF6600', width=3),
-            fill='tonexty',
-            fillcolor='rgba(255,102,0,0.1)',
-            hovertemplate='Date: %{x}<br>Predicted: $%{y:,.0f}<extra></extra>'
-        ))
-        
-        # Anomaly zone
-        fig_trend.add_vrect(
-            x0=dates[26], x1=dates[29],
-            fillcolor="rgba(255,0,0,0.1)",
-            layer="below", line_width=0,
-            annotation_text="Anomaly Zone",
-            annotation_position="top left"
-        )
-        
-        fig_trend.update_layout(
-            title="30-Day Cost Forecast with Anomaly Detection",
-            xaxis_title="Date",
-            yaxis_title="Daily Cost (USD)",
-            hovermode='x unified',
-            height=350,
-            showlegend=True,
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
-        
-        st.plotly_chart(fig_trend, width="stretch")
+        st.plotly_chart(_build_trend_figure(datetime.now().date()), width="stretch")
     
     with col_analysis2:
         # AI Insights Box
-        st.markdown("""
-        <div style='
-            background: linear-gradient(135deg, #E8F4F8 0%, #D5E8F0 100%);
-            border: 2px solid #00A8E1;
-            border-radius: 10px;
-            padding: 20px;
-            margin-bottom: 20px;
-        '>
-            <div style='display: flex; align-items: center; margin-bottom: 15px;'>
-                <span style='font-size: 28px; margin-right: 10px;'>🤖</span>
-                <h4 style='margin: 0; color: #232F3E;'>AI Insights</h4>
-            </div>
-            <div style='background: white; padding: 15px; border-radius: 8px; color: #666; font-size: 13px; line-height: 1.6;'>
-                <strong style='color: #232F3E;'>Machine Learning Analysis:</strong><br><br>
-                • Detected 94% confidence anomaly<br>
-                • Pattern started 3 days ago<br>
-                • Similar to incident #1247 (Q2 2024)<br>
-                • 87% of peers use 65-75% target<br>
-                • Predicted escalation in 4 days<br><br>
-                <strong style='color: #00A8E1;'>Recommendation confidence: HIGH</strong>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_AI_INSIGHTS_HTML, unsafe_allow_html=True)
         
         # Service breakdown
-        st.markdown("""
-        <div style='
-            background: white;
-            border: 2px solid #E1E4E8;
-            border-radius: 10px;
-            padding: 15px;
-        '>
-            <h5 style='margin: 0 0 10px 0; color: #232F3E;'>💸 Cost Breakdown</h5>
-            <div style='font-size: 13px; color: #666;'>
-                <div style='display: flex; justify-content: space-between; padding: 8px 0; border-bottom: 1px solid #E1E4E8;'>
-                    <span>EC2 Instances</span>
-                    <strong>$21,400</strong>
-                </div>
-                <div style='display: flex; justify-content: space-between; padding: 8px 0; border-bottom: 1px solid #E1E4E8;'>
-                    <span>Load Balancer</span>
-                    <strong>$3,200</strong>
-                </div>
-                <div style='display: flex; justify-content: space-between; padding: 8px 0; border-bottom: 1px solid #E1E4E8;'>
-                    <span>Data Transfer</span>
-                    <strong>$2,400</strong>
-                </div>
-                <div style='display: flex; justify-content: space-between; padding: 8px 0; font-weight: bold; color: #FF6600;'>
-                    <span>Total Excess</span>
-                    <strong>$27,000</strong>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_COST_BREAKDOWN_HTML, unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -299,62 +425,7 @@ def render_predictive_finops_scene():
     st.markdown("### 💡 AI-Powered Recommendation")
     
     # Recommendation card
-    st.markdown("""
-    <div style='
-        background: linear-gradient(135deg, #E8F8F5 0%, #D4F1E8 100%);
-        border-left: 5px solid #00C851;
-        padding: 25px;
-        border-radius: 10px;
-        margin: 20px 0;
-        box-shadow: 0 4px 8px rgba(0,200,81,0.2);
-    '>
-        <h3 style='margin: 0 0 20px 0; color: #232F3E;'>🎯 Recommended Action</h3>
-        
-        <div style='
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            border: 2px solid #00C851;
-            margin-bottom: 15px;
-        '>
-            <div style='display: flex; align-items: center; justify-content: space-between;'>
-                <div>
-                    <h4 style='margin: 0 0 10px 0; color: #00C851;'>Adjust Auto-Scaling Target Utilization</h4>
-                    <p style='color: #666; font-size: 16px; margin: 0;'>
-                        <strong>Change:</strong> 50% → 70% CPU target utilization<br>
-                        <strong>Impact:</strong> Reduce instance count by ~35%<br>
-                        <strong>Maintains:</strong> Performance SLA (p99 < 200ms)
-                    </p>
-                </div>
-                <div style='text-align: center; padding-left: 20px;'>
-                    <div style='font-size: 14px; color: #666;'>Monthly Savings</div>
-                    <div style='font-size: 42px; font-weight: bold; color: #00C851;'>$18K</div>
-                </div>
-            </div>
-        </div>
-        
-        <div style='display: grid; grid-template-columns: 1fr 1fr; gap: 15px;'>
-            <div style='background: white; padding: 15px; border-radius: 8px;'>
-                <strong style='color: #232F3E;'>✅ Benefits</strong>
-                <ul style='color: #666; font-size: 13px; margin: 10px 0 0 0; padding-left: 20px;'>
-                    <li>$18,000/month cost reduction</li>
-                    <li>Better resource utilization (70% vs 28%)</li>
-                    <li>Maintains performance SLAs</li>
-                    <li>Reduces carbon footprint by 35%</li>
-                </ul>
-            </div>
-            <div style='background: white; padding: 15px; border-radius: 8px;'>
-                <strong style='color: #232F3E;'>⚠️ Considerations</strong>
-                <ul style='color: #666; font-size: 13px; margin: 10px 0 0 0; padding-left: 20px;'>
-                    <li>Implement during low-traffic window</li>
-                    <li>Monitor closely for 48 hours</li>
-                    <li>Rollback plan available</li>
-                    <li>CloudWatch alarms updated</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_RECOMMENDATION_HTML, unsafe_allow_html=True)
     
     st.info("💡 **Proactive, not reactive.** AI predicts issues before they become budget disasters.")
     
@@ -388,7 +459,7 @@ def render_predictive_finops_scene():
         
         # Progress bar
         progress_bar = st.progress(0)
-        status_container = st.container()
+        status_container = st.empty()
         
         remediation_steps = [
             ("⏳ Validating current configuration...", "Reading Auto Scaling Group settings", 15),
@@ -401,7 +472,8 @@ def render_predictive_finops_scene():
             ("✅ Alarms updated", "New thresholds: Warning: 75%, Critical: 85%", 100),
         ]
         
-        # Execute remediation steps
+        # Execute remediation steps; the placeholder is redrawn with every step
+        # so far, rather than appending the whole list again on each step
         completed_steps = []
         
         for step, detail, progress in remediation_steps:
@@ -415,22 +487,10 @@ def render_predictive_finops_scene():
                 color = "#00C851"
                 bg_color = "#E8F8F5"
             
-            completed_steps.append((step, detail, color, bg_color))
-            
-            with status_container:
-                for s, d, c, bc in completed_steps:
-                    st.markdown(f"""
-                    <div style='
-                        background: {bc};
-                        border-left: 4px solid {c};
-                        padding: 12px 20px;
-                        margin: 8px 0;
-                        border-radius: 5px;
-                    '>
-                        <strong style='color: {c}; font-size: 16px;'>{s}</strong><br>
-                        <span style='color: #666; font-size: 13px;'>{d}</span>
-                    </div>
-                    """, unsafe_allow_html=True)
+            completed_steps.append(_STEP_CARD_TEMPLATE.format(
+                bg_color=bg_color, color=color, step=step, detail=detail
+            ))
+            status_container.markdown("".join(completed_steps), unsafe_allow_html=True)
         
         # Success
         st.balloons()
@@ -438,49 +498,7 @@ def render_predictive_finops_scene():
         st.success("### ✅ Cost Optimization Applied!")
         
         # Success summary
-        st.markdown("""
-        <div style='
-            background: linear-gradient(135deg, #00C851 0%, #007E33 100%);
-            color: white;
-            padding: 30px;
-            border-radius: 10px;
-            margin: 20px 0;
-            box-shadow: 0 4px 12px rgba(0,200,81,0.3);
-        '>
-            <h2 style='margin: 0 0 20px 0; color: white; text-align: center;'>
-                💰 Cost Anomaly Prevented!
-            </h2>
-            <div style='
-                display: grid;
-                grid-template-columns: repeat(4, 1fr);
-                gap: 20px;
-                margin-top: 20px;
-                padding-top: 20px;
-                border-top: 1px solid rgba(255,255,255,0.3);
-            '>
-                <div style='text-align: center;'>
-                    <div style='font-size: 14px; opacity: 0.9;'>Monthly Savings</div>
-                    <div style='font-size: 32px; font-weight: bold; margin: 10px 0;'>$18,000</div>
-                    <div style='font-size: 12px; opacity: 0.8;'>Immediate impact</div>
-                </div>
-                <div style='text-align: center;'>
-                    <div style='font-size: 14px; opacity: 0.9;'>Annual Savings</div>
-                    <div style='font-size: 32px; font-weight: bold; margin: 10px 0;'>$216K</div>
-                    <div style='font-size: 12px; opacity: 0.8;'>Projected</div>
-                </div>
-                <div style='text-align: center;'>
-                    <div style='font-size: 14px; opacity: 0.9;'>Utilization</div>
-                    <div style='font-size: 32px; font-weight: bold; margin: 10px 0;'>70%</div>
-                    <div style='font-size: 12px; opacity: 0.8;'>Target achieved</div>
-                </div>
-                <div style='text-align: center;'>
-                    <div style='font-size: 14px; opacity: 0.9;'>Time to Fix</div>
-                    <div style='font-size: 32px; font-weight: bold; margin: 10px 0;'>42s</div>
-                    <div style='font-size: 12px; opacity: 0.8;'>Fully automated</div>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_SUCCESS_SUMMARY_HTML, unsafe_allow_html=True)
         
         # Before/After comparison
         st.markdown("#### 📊 Before vs After Comparison")
@@ -611,8 +629,8 @@ KEY FEATURES:
 ✅ 42-second resolution time
 
 CUSTOMIZATION:
-- Change cost values (lines 64-119)
-- Adjust remediation timing (line 403)
-- Modify savings amount (line 245)
-- Change confidence percentage (line 38)
+- Change cost values (_COST_CARDS)
+- Adjust remediation timing (time.sleep in the remediation loop)
+- Modify savings amount (_RECOMMENDATION_HTML)
+- Change confidence percentage (_ALERT_CARD_HTML)
 """
@@ -0,0 +1,61 @@
+"""
+Shared helpers for the FinOps modules
+
+- JSON serialization with orjson when it is installed, falling back to the
+  standard json module, so orjson stays an optional dependency
+- A thread pool whose workers can use Streamlit from the calling script run
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+# Optional fast JSON serializer (handles datetime and numpy natively)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ============================================================================
+# JSON SERIALIZATION
+# ============================================================================
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTION = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    loads = orjson.loads
+else:
+    loads = json.loads
+
+def dumps(obj, indent: bool = False, sort_keys: bool = False) -> str:
+    """Serialize to JSON with orjson when installed, falling back to json"""
+    if ORJSON_AVAILABLE:
+        option = _ORJSON_OPTION
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=str, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys, default=str)
+
+def dumps_sorted_bytes(obj) -> bytes:
+    """Canonical (sorted-key) JSON bytes for hashing, without a str round-trip under orjson"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTION | orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True, default=str).encode()
+
+# ============================================================================
+# CONCURRENCY
+# ============================================================================
+
+def script_run_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Thread pool whose workers share the current Streamlit script-run context"""
+    # Cached helpers and st.* calls look up the script-run context of the
+    # current thread; attaching it lets workers read session state and emit
+    # st.warning/st.error like the caller would
+    return ThreadPoolExecutor(
+        max_workers=max_workers,
+        initializer=add_script_run_ctx,
+        initargs=(None, get_script_run_ctx())
+    )
@@ -0,0 +1,82 @@
+"""
+Persistent on-disk cache for AI responses
+
+st.cache_data lives in process memory, so every restart (deploy, scale event)
+starts cold and the first user pays for every Claude call again. This SQLite
+store keeps serialized responses with an expiry time under ~/.finops_cache/
+(or $FINOPS_CACHE_DIR) so they survive restarts and are shared by all
+processes on the host.
+
+Values are opaque bytes; callers choose the serialization. The store is a
+best-effort cache: database errors (e.g. a lock held past the busy timeout)
+are treated as misses and skipped writes, never raised to the caller.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+_CACHE_DIR_ENV = "FINOPS_CACHE_DIR"
+_CACHE_DIR = Path(os.environ.get(_CACHE_DIR_ENV) or Path.home() / ".finops_cache").expanduser()
+_CACHE_PATH = _CACHE_DIR / "ai_responses.sqlite3"
+_DEFAULT_TTL_SECONDS = 3600
+# How long a write waits for another process's lock before giving up
+_BUSY_TIMEOUT_SECONDS = 5
+
+# ============================================================================
+# SQLITE AI RESPONSE CACHE
+# ============================================================================
+
+class SqliteAICache:
+    """Key -> bytes store with per-entry expiry, safe to share between threads"""
+
+    def __init__(self, path: Path = _CACHE_PATH, ttl: float = _DEFAULT_TTL_SECONDS):
+        self.ttl = ttl
+        # Responses include account cost data: keep the directory private
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), timeout=_BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+        # WAL lets several app processes read while one writes
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL NOT NULL)"
+        )
+        self._conn.commit()
+        try:
+            self._conn.execute("DELETE FROM cache WHERE expires < ?", (time.time(),))
+            self._conn.commit()
+        except sqlite3.Error:
+            # Another process holds the lock; expired rows are never read anyway
+            self._conn.rollback()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Stored value for key, or None if missing, expired or unreadable"""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value FROM cache WHERE key = ? AND expires >= ?",
+                    (key, time.time())
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None):
+        """Store value for key, replacing any previous entry; skipped if the database is unavailable"""
+        expires = time.time() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)",
+                    (key, value, expires)
+                )
+                self._conn.commit()
+            except sqlite3.Error:
+                self._conn.rollback()
@@ -0,0 +1,209 @@
+"""
+Semantic response cache for the FinOps AI query interface
+
+Paraphrased questions ("top cost drivers?" / "what drives my costs?") miss an
+exact-match cache but have the same answer. Questions are embedded with a
+sentence-transformers model and looked up in a FAISS inner-product index of
+previously answered questions; a close enough match returns the stored answer.
+
+Entries are scoped (e.g. by a cost_data hash) so answers computed against one
+data snapshot are never served for another. Each scope has its own index, so
+questions asked against old snapshots never crowd out a lookup's neighbours.
+Entries expire after a TTL and at most max_entries are kept.
+
+Entries are appended to a JSON-lines file under ~/.finops_cache/ (or
+$FINOPS_CACHE_DIR) so they survive restarts. The file is compacted (expired
+and excess entries dropped) on load and whenever it grows to twice the cap.
+
+faiss and sentence-transformers are optional: without them every lookup
+misses and get_or_compute simply calls the compute function.
+"""
+
+import base64
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Optional vector index and embedding model
+try:
+    import faiss
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+_EMBEDDING_DIM = 384
+# Cosine similarity at or above which a stored answer is reused
+_DEFAULT_THRESHOLD = 0.92
+_THRESHOLD_ENV = "FINOPS_SEMANTIC_CACHE_THRESHOLD"
+_CACHE_DIR_ENV = "FINOPS_CACHE_DIR"
+_CACHE_DIR = Path(os.environ.get(_CACHE_DIR_ENV) or Path.home() / ".finops_cache").expanduser()
+_DEFAULT_TTL_SECONDS = 3600
+_DEFAULT_MAX_ENTRIES = 2000
+# Neighbours examined per lookup within a scope; expired ones are skipped
+_SEARCH_K = 4
+
+# ============================================================================
+# SEMANTIC CACHE
+# ============================================================================
+
+def _encode_vector(vector: np.ndarray) -> str:
+    return base64.b64encode(vector.astype(np.float32).tobytes()).decode()
+
+def _decode_vectors(entries: List[Dict[str, Any]]) -> np.ndarray:
+    return np.vstack([
+        np.frombuffer(base64.b64decode(entry['vector']), dtype=np.float32) for entry in entries
+    ])
+
+class SemanticCache:
+    """Embedding-similarity cache of (scope, question) -> answer"""
+
+    def __init__(
+        self,
+        cache_dir: Path = _CACHE_DIR,
+        threshold: Optional[float] = None,
+        ttl: float = _DEFAULT_TTL_SECONDS,
+        max_entries: int = _DEFAULT_MAX_ENTRIES
+    ):
+        self.threshold = threshold if threshold is not None else float(
+            os.environ.get(_THRESHOLD_ENV, _DEFAULT_THRESHOLD)
+        )
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries_path = cache_dir / "semantic.jsonl"
+        self._lock = threading.Lock()
+        # scope -> (index, entries in index order)
+        self._scopes: Dict[str, Tuple[Any, List[Dict[str, Any]]]] = {}
+        # Lines in the entries file since it was last compacted
+        self._file_lines = 0
+        self._model = None
+
+        if not SEMANTIC_CACHE_AVAILABLE:
+            return
+
+        # Answers include account cost data: keep the directory private
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self._model = SentenceTransformer(_EMBEDDING_MODEL)
+        self._load()
+
+    @property
+    def enabled(self) -> bool:
+        return self._model is not None
+
+    def _live(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """The newest max_entries unexpired entries, oldest first"""
+        cutoff = time.time() - self.ttl
+        live = sorted((entry for entry in entries if entry['created'] >= cutoff), key=lambda e: e['created'])
+        return live[-self.max_entries:]
+
+    def _load(self):
+        """Restore persisted entries, skipping unreadable lines, and compact the file"""
+        entries = []
+        try:
+            with self._entries_path.open() as f:
+                for line in f:
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        # A torn line from an interrupted append
+                        continue
+        except OSError:
+            pass
+        self._rewrite(self._live(entries))
+
+    def _rewrite(self, entries: List[Dict[str, Any]]):
+        """Rebuild the per-scope indexes from entries and replace the file with them"""
+        by_scope: Dict[str, List[Dict[str, Any]]] = {}
+        for entry in entries:
+            by_scope.setdefault(entry['scope'], []).append(entry)
+        self._scopes = {}
+        for scope, scoped in by_scope.items():
+            index = faiss.IndexFlatIP(_EMBEDDING_DIM)
+            index.add(_decode_vectors(scoped))
+            self._scopes[scope] = (index, scoped)
+
+        temp_path = self._entries_path.with_suffix(".tmp")
+        temp_path.write_text("".join(json.dumps(entry) + "\n" for entry in entries))
+        os.replace(temp_path, self._entries_path)
+        self._file_lines = len(entries)
+
+    def _embed(self, text: str) -> np.ndarray:
+        """L2-normalized embedding, so inner product equals cosine similarity"""
+        vector = self._model.encode([text], normalize_embeddings=True)
+        return np.asarray(vector, dtype=np.float32)
+
+    def _lookup(self, vector: np.ndarray, scope: str) -> Optional[str]:
+        with self._lock:
+            if scope not in self._scopes:
+                return None
+            index, scoped = self._scopes[scope]
+            cutoff = time.time() - self.ttl
+            scores, ids = index.search(vector, min(_SEARCH_K, index.ntotal))
+            for score, idx in zip(scores[0], ids[0]):
+                if score < self.threshold:
+                    break
+                entry = scoped[idx]
+                if entry['created'] >= cutoff:
+                    return entry['response']
+        return None
+
+    def _store(self, vector: np.ndarray, query: str, scope: str, response: str):
+        entry = {
+            'scope': scope,
+            'query': query,
+            'response': response,
+            'created': time.time(),
+            'vector': _encode_vector(vector[0])
+        }
+        with self._lock:
+            if scope not in self._scopes:
+                self._scopes[scope] = (faiss.IndexFlatIP(_EMBEDDING_DIM), [])
+            index, scoped = self._scopes[scope]
+            index.add(vector)
+            scoped.append(entry)
+            self._file_lines += 1
+
+            # Append one line per answer; compact only once the file has doubled
+            if self._file_lines > 2 * self.max_entries:
+                self._rewrite(self._live([e for _, es in self._scopes.values() for e in es]))
+            else:
+                with self._entries_path.open("a") as f:
+                    f.write(json.dumps(entry) + "\n")
+
+    def get(self, query: str, scope: str) -> Optional[str]:
+        """Stored answer for a similar question in scope, or None"""
+        if not self.enabled:
+            return None
+        return self._lookup(self._embed(query), scope)
+
+    def put(self, query: str, scope: str, response: str):
+        """Store an answer and persist it"""
+        if self.enabled:
+            self._store(self._embed(query), query, scope, response)
+
+    def get_or_compute(self, query: str, scope: str, compute: Callable[[], str]) -> str:
+        """
+        Return a cached answer for a semantically similar question in scope,
+        otherwise call compute() and store its result
+
+        Exceptions from compute() propagate and nothing is stored.
+        """
+        if not self.enabled:
+            return compute()
+        vector = self._embed(query)
+        cached = self._lookup(vector, scope)
+        if cached is not None:
+            return cached
+        response = compute()
+        self._store(vector, query, scope, response)
+        return response
@@ -0,0 +1,89 @@
+"""Tests for the cost analytics helpers in finops_module"""
+
+import numpy as np
+
+from finops_module import _get_cost_and_usage_all, _lttb_indices, detect_spending_patterns
+
+
+class _PagedCostExplorer:
+    """Cost Explorer stand-in returning canned pages keyed by NextPageToken"""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def get_cost_and_usage(self, **kwargs):
+        self.calls.append(dict(kwargs))
+        return dict(self.pages[kwargs.get('NextPageToken')])
+
+
+def _group(service, amount):
+    return {'Keys': [service], 'Metrics': {'UnblendedCost': {'Amount': amount, 'Unit': 'USD'}}}
+
+
+def _daily_cost_data(amounts):
+    return {
+        'ResultsByTime': [
+            {
+                'TimePeriod': {'Start': f'2024-01-{day:02d}', 'End': f'2024-01-{day + 1:02d}'},
+                'Total': {'UnblendedCost': {'Amount': str(amount), 'Unit': 'USD'}}
+            }
+            for day, amount in enumerate(amounts, start=1)
+        ]
+    }
+
+
+def test_spending_patterns_constant_diffs_have_no_spikes():
+    patterns = detect_spending_patterns(_daily_cost_data([100, 110, 120, 130, 140]))
+    assert patterns['spike_count'] == 0
+    assert patterns['patterns'] == ['Normal spending pattern']
+    assert patterns['trend'] == 'increasing'
+
+
+def test_spending_patterns_falling_series_reports_peak_spend():
+    patterns = detect_spending_patterns(_daily_cost_data([500, 400, 300, 200, 100]))
+    assert patterns['trend'] == 'decreasing'
+    assert patterns['max_spike'] == 500.0
+    assert patterns['spike_count'] == 0
+
+
+def test_spending_patterns_detects_single_spike():
+    patterns = detect_spending_patterns(_daily_cost_data([100] * 10 + [1000] + [100] * 10))
+    assert patterns['spike_count'] == 1
+    assert patterns['max_spike'] == 1000.0
+
+
+def test_cost_and_usage_merges_groups_across_pages():
+    day1 = {'Start': '2024-01-01', 'End': '2024-01-02'}
+    day2 = {'Start': '2024-01-02', 'End': '2024-01-03'}
+    client = _PagedCostExplorer({
+        None: {
+            'ResultsByTime': [{'TimePeriod': day1, 'Groups': [_group('EC2', '1.0')]}],
+            'NextPageToken': 'page-2'
+        },
+        'page-2': {
+            'ResultsByTime': [
+                {'TimePeriod': day1, 'Groups': [_group('S3', '2.0')]},
+                {'TimePeriod': day2, 'Groups': [_group('EC2', '3.0')]}
+            ]
+        }
+    })
+
+    response = _get_cost_and_usage_all(client, Granularity='DAILY')
+
+    assert [call.get('NextPageToken') for call in client.calls] == [None, 'page-2']
+    assert 'NextPageToken' not in response
+    assert [result['TimePeriod']['Start'] for result in response['ResultsByTime']] == ['2024-01-01', '2024-01-02']
+    assert [group['Keys'][0] for group in response['ResultsByTime'][0]['Groups']] == ['EC2', 'S3']
+
+
+def test_lttb_keeps_endpoints_and_caps_points():
+    y = np.random.default_rng(0).standard_normal(1000)
+    indices = _lttb_indices(y, 100)
+    assert len(indices) == 100
+    assert indices[0] == 0 and indices[-1] == 999
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_lttb_keeps_short_series_whole():
+    assert _lttb_indices(np.arange(50, dtype=np.float64), 100).tolist() == list(range(50))
@@ -0,0 +1,77 @@
+"""Tests for the AI response helpers in finops_module_enhanced_complete"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from finops_module_enhanced_complete import _dedup_call, _extract_json
+
+
+def test_extract_json_strips_markdown_fence():
+    text = '```json\n{"executive_summary": "ok", "key_insights": []}\n```'
+    assert _extract_json(text) == {'executive_summary': 'ok', 'key_insights': []}
+
+
+def test_extract_json_ignores_prose_around_json():
+    text = 'Here are the results:\n[{"service": "EC2"}, {"service": "S3"}]\nLet me know.'
+    assert _extract_json(text, array=True) == [{'service': 'EC2'}, {'service': 'S3'}]
+
+
+def test_extract_json_truncated_array_returns_none():
+    assert _extract_json('[{"resource_id": "i-1", "steps": ["s1", "s2"]}, {"resour', array=True) is None
+
+
+def test_extract_json_does_not_return_nested_fragment():
+    # The outer array is broken; the inner ["s1","s2"] must not be returned
+    assert _extract_json('[{"a": 1, "steps": ["s1", "s2"]}, broken', array=True) is None
+    assert _extract_json('{"summary": {"total": 1}, broken') is None
+
+
+def test_extract_json_rejects_wrong_shape():
+    assert _extract_json('["s1", "s2"]', array=True) is None
+    assert _extract_json('{"a": 1') is None
+    assert _extract_json('no json here') is None
+
+
+def test_dedup_call_shares_one_result_with_concurrent_callers():
+    calls = []
+    release = threading.Event()
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        return {'answer': 42}
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(_dedup_call, 'dedup-result', fn) for _ in range(4)]
+        # Give the followers time to find the leader's call in flight
+        time.sleep(0.2)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_dedup_call_shares_exceptions_and_forgets_the_key():
+    calls = []
+    release = threading.Event()
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(_dedup_call, 'dedup-error', fn) for _ in range(3)]
+        time.sleep(0.2)
+        release.set()
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
+
+    assert len(calls) == 1
+    # A later call runs fn again instead of reusing the failure
+    assert _dedup_call('dedup-error', lambda: 'ok') == 'ok'
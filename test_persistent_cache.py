@@ -0,0 +1,46 @@
+"""Tests for the on-disk AI response cache"""
+
+import sqlite3
+
+from persistent_cache import SqliteAICache
+
+
+class _LockedConnection:
+    """Connection stand-in whose statements fail as if another process held the lock"""
+
+    def execute(self, *args):
+        raise sqlite3.OperationalError("database is locked")
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+def test_get_returns_stored_value(tmp_path):
+    cache = SqliteAICache(tmp_path / "cache.sqlite3", ttl=60)
+    cache.set("key", b"value")
+    assert cache.get("key") == b"value"
+    assert cache.get("other") is None
+
+
+def test_expired_entries_are_misses(tmp_path):
+    cache = SqliteAICache(tmp_path / "cache.sqlite3", ttl=60)
+    cache.set("stale", b"old", ttl=-1)
+    cache.set("fresh", b"new")
+    assert cache.get("stale") is None
+    assert cache.get("fresh") == b"new"
+
+
+def test_entries_survive_reopen(tmp_path):
+    SqliteAICache(tmp_path / "cache.sqlite3").set("key", b"value")
+    assert SqliteAICache(tmp_path / "cache.sqlite3").get("key") == b"value"
+
+
+def test_database_errors_are_misses_and_skipped_writes(tmp_path):
+    cache = SqliteAICache(tmp_path / "cache.sqlite3")
+    cache.set("key", b"value")
+    cache._conn = _LockedConnection()
+    assert cache.get("key") is None
+    cache.set("key", b"other")  # must not raise
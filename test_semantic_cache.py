@@ -0,0 +1,93 @@
+"""Tests for the semantic response cache, with faiss and the embedding model faked"""
+
+import importlib
+import sys
+import types
+
+import numpy as np
+import pytest
+
+import semantic_cache
+
+
+class _FakeIndex:
+    """Exact inner-product index with the faiss.IndexFlatIP interface used by the cache"""
+
+    def __init__(self, dim):
+        self.vectors = np.zeros((0, dim), dtype=np.float32)
+
+    @property
+    def ntotal(self):
+        return len(self.vectors)
+
+    def add(self, vectors):
+        self.vectors = np.vstack([self.vectors, vectors])
+
+    def search(self, queries, k):
+        scores = queries @ self.vectors.T
+        ids = np.argsort(-scores, axis=1)[:, :k]
+        return np.take_along_axis(scores, ids, axis=1), ids
+
+
+class _FakeModel:
+    """Embeds a question by its sorted words, so reordered wordings are identical"""
+
+    def __init__(self, name):
+        pass
+
+    def encode(self, texts, normalize_embeddings=True):
+        vectors = []
+        for text in texts:
+            words = " ".join(sorted(text.lower().strip("?").split()))
+            rng = np.random.default_rng(abs(hash(words)) % 2**32)
+            vector = rng.standard_normal(semantic_cache._EMBEDDING_DIM)
+            vectors.append(vector / np.linalg.norm(vector))
+        return np.array(vectors, dtype=np.float32)
+
+
+@pytest.fixture
+def fake_backends(monkeypatch):
+    monkeypatch.setitem(sys.modules, "faiss", types.SimpleNamespace(IndexFlatIP=_FakeIndex))
+    monkeypatch.setitem(
+        sys.modules, "sentence_transformers", types.SimpleNamespace(SentenceTransformer=_FakeModel)
+    )
+    module = importlib.reload(semantic_cache)
+    yield module
+    monkeypatch.undo()
+    importlib.reload(semantic_cache)
+
+
+def test_similar_question_in_scope_hits(fake_backends, tmp_path):
+    cache = fake_backends.SemanticCache(tmp_path, threshold=0.9)
+    cache.put("top cost drivers", "snapshot-1", "EC2 and RDS")
+    assert cache.get("drivers cost top?", "snapshot-1") == "EC2 and RDS"
+    assert cache.get("drivers cost top?", "snapshot-2") is None
+    assert cache.get("how do I cut S3 spend", "snapshot-1") is None
+
+
+def test_get_or_compute_calls_compute_once(fake_backends, tmp_path):
+    cache = fake_backends.SemanticCache(tmp_path, threshold=0.9)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return "answer"
+
+    assert cache.get_or_compute("top cost drivers", "s", compute) == "answer"
+    assert cache.get_or_compute("top cost drivers", "s", compute) == "answer"
+    assert len(calls) == 1
+
+
+def test_entries_persist_and_expire(fake_backends, tmp_path):
+    fake_backends.SemanticCache(tmp_path).put("top cost drivers", "s", "EC2")
+    assert fake_backends.SemanticCache(tmp_path).get("top cost drivers", "s") == "EC2"
+    assert fake_backends.SemanticCache(tmp_path, ttl=-1).get("top cost drivers", "s") is None
+
+
+def test_without_backends_compute_is_always_called(tmp_path):
+    if semantic_cache.SEMANTIC_CACHE_AVAILABLE:
+        pytest.skip("faiss and sentence-transformers are installed")
+    cache = semantic_cache.SemanticCache(tmp_path)
+    assert not cache.enabled
+    assert cache.get_or_compute("q", "s", lambda: "fresh") == "fresh"
+    assert cache.get("q", "s") is None